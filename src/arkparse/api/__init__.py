@@ -1,7 +1,9 @@
 from .base_api import BaseApi
+from .columnar_api import ColumnarApi
 from .dino_api import DinoApi
 from .equipment_api import EquipmentApi
 from .player_api import PlayerApi
 from .rcon_api import RconApi
+from .reference_api import ReferenceApi
 from .stackable_api import StackableApi
 from .structure_api import StructureApi
\ No newline at end of file
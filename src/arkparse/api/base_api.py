@@ -56,13 +56,7 @@ class BaseApi(StructureApi):
         if structures is None or len(structures) == 0:
             return None
         
-        all_structures: Dict[UUID, Structure] = {}
-        for key, structure in structures.items():
-            all_structures[key] = structure
-            connected = self.get_connected_structures(structures)
-            for key, conn_structure in connected.items():
-                if key not in all_structures:
-                    all_structures[key] = conn_structure
+        all_structures: Dict[UUID, Structure] = self.get_connected_structures(structures)
 
         if owner_tribe_id is not None:
             all_structures = {k: v for k, v in all_structures.items() if v.owner.tribe_id == owner_tribe_id}
@@ -73,6 +67,89 @@ class BaseApi(StructureApi):
 
         return Base(keystone.object.uuid, all_structures)
     
+    def find_all_bases(self, merge_distance: float = None, min_structures: int = 1, owner_tribe_id: int = None) -> List[Base]:
+        """
+        Groups all structures of the map into bases in one pass: structures connected through
+        LinkedStructures end up in the same base (union-find). When merge_distance is given,
+        structures within that distance (in world units) of each other are merged as well.
+        """
+        structures = self.get_all()
+        if owner_tribe_id is not None:
+            structures = {k: v for k, v in structures.items() if v.owner is not None and v.owner.tribe_id == owner_tribe_id}
+
+        parent: Dict[UUID, UUID] = {uuid: uuid for uuid in structures}
+
+        def find(uuid: UUID) -> UUID:
+            root = uuid
+            while parent[root] != root:
+                root = parent[root]
+            while parent[uuid] != root:
+                parent[uuid], uuid = root, parent[uuid]
+            return root
+
+        def union(a: UUID, b: UUID):
+            root_a, root_b = find(a), find(b)
+            if root_a != root_b:
+                parent[root_b] = root_a
+
+        for uuid, structure in structures.items():
+            for linked in structure.linked_structure_uuids:
+                if linked in parent:
+                    union(uuid, linked)
+
+        if merge_distance is not None and merge_distance > 0:
+            self.__merge_by_proximity(structures, merge_distance, union)
+
+        groups: Dict[UUID, Dict[UUID, Structure]] = {}
+        for uuid, structure in structures.items():
+            groups.setdefault(find(uuid), {})[uuid] = structure
+
+        bases = []
+        for group in groups.values():
+            if len(group) < min_structures:
+                continue
+            bases.append(Base(self.__get_central_structure(group), group))
+
+        return bases
+
+    def __merge_by_proximity(self, structures: Dict[UUID, Structure], distance: float, union):
+        # Grid hash with cells of the merge distance, only the neighbouring cells need to be compared
+        grid: Dict[tuple, List[UUID]] = {}
+        for uuid, structure in structures.items():
+            loc = structure.location
+            if loc is None:
+                continue
+            cell = (int(loc.x // distance), int(loc.y // distance), int(loc.z // distance))
+            grid.setdefault(cell, []).append(uuid)
+
+        max_dist_sq = distance * distance
+        for (cx, cy, cz), members in grid.items():
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    for dz in (-1, 0, 1):
+                        neighbours = grid.get((cx + dx, cy + dy, cz + dz))
+                        if neighbours is None:
+                            continue
+                        for a in members:
+                            la = structures[a].location
+                            for b in neighbours:
+                                if a >= b:
+                                    continue
+                                lb = structures[b].location
+                                if (la.x - lb.x) ** 2 + (la.y - lb.y) ** 2 + (la.z - lb.z) ** 2 <= max_dist_sq:
+                                    union(a, b)
+
+    def __get_central_structure(self, structures: Dict[UUID, Structure]) -> UUID:
+        located = [s for s in structures.values() if s.location is not None]
+        if len(located) == 0:
+            return next(iter(structures))
+
+        center_x = sum(s.location.x for s in located) / len(located)
+        center_y = sum(s.location.y for s in located) / len(located)
+        center_z = sum(s.location.z for s in located) / len(located)
+        central = min(located, key=lambda s: (s.location.x - center_x) ** 2 + (s.location.y - center_y) ** 2 + (s.location.z - center_z) ** 2)
+        return central.object.uuid
+
     def __get_all_files_from_dir_recursive(self, dir_path: Path) -> Dict[str, bytes]:
         out = []
         base_file = None
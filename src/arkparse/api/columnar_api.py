@@ -0,0 +1,236 @@
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from arkparse.enums import ArkMap
+from arkparse.logging import ArkSaveLogger
+from arkparse.object_model.ark_game_object import ArkGameObject
+from arkparse.object_model.dinos.stats import STAT_POSITION_MAP
+from arkparse.parsing import ArkBinaryParser
+from arkparse.parsing.struct.actor_transform import MapCoordinateParameters
+from arkparse.saves.asa_save import AsaSave
+
+# Missing integer values are exported as -1, missing floats as nan and missing strings as None
+_MISSING_INT = -1
+_MISSING_FLOAT = float("nan")
+
+_STAT_NAMES = [STAT_POSITION_MAP[i] for i in range(len(STAT_POSITION_MAP))]
+_POINT_PROPERTIES = (("base", "NumberOfLevelUpPointsApplied"),
+                     ("added", "NumberOfLevelUpPointsAppliedTamed"),
+                     ("mutated", "NumberOfMutationsAppliedTamed"))
+
+_LOCATION_FIELDS = [("x", "f8"), ("y", "f8"), ("z", "f8"), ("lat", "f8"), ("long", "f8")]
+
+DINO_FIELDS = [("uuid", "U36"), ("class", "O"), ("tamed", "?"), ("female", "?"), ("team", "i8"),
+               ("owner", "O"), ("owner_id", "i8"), ("tribe", "O"), ("level", "i4"), ("base_level", "i4")] + \
+              _LOCATION_FIELDS + \
+              [(f"{kind}_{stat}", "i4") for kind, _ in _POINT_PROPERTIES for stat in _STAT_NAMES]
+
+STRUCTURE_FIELDS = [("uuid", "U36"), ("class", "O"), ("team", "i8"), ("owner", "O"), ("owner_id", "i8"),
+                    ("health", "f4"), ("max_health", "f4"), ("item_count", "i4")] + \
+                   _LOCATION_FIELDS
+
+ITEM_FIELDS = [("uuid", "U36"), ("class", "O"), ("owner_inventory", "O"), ("quantity", "i4"),
+               ("quality", "i4"), ("rating", "f4"), ("durability", "f4"), ("is_blueprint", "?"), ("is_engram", "?")]
+
+
+def _is_dino(name: str) -> bool:
+    return "Dinos/" in name and "_Character_" in name
+
+def _is_status_component(name: str) -> bool:
+    return "DinoCharacterStatusComponent" in name
+
+def _is_structure(name: str) -> bool:
+    return "/Structures" in name and "PrimalItemStructure_" not in name
+
+def _is_item(name: str) -> bool:
+    return "PrimalItem" in name
+
+
+def _value(obj: ArkGameObject, name: str, default: Any = None, position: int = None) -> Any:
+    value = obj.get_property_value(name, position=position) if position is not None else obj.get_property_value(name)
+    return default if value is None else value
+
+def _uuid_of(ref) -> Optional[str]:
+    ref_uuid = getattr(ref, "uuid", None) if ref is not None else None
+    return str(ref_uuid) if ref_uuid is not None else None
+
+
+class ColumnarApi:
+    """
+    Exports dinos, structures and items as NumPy structured arrays, one row per object and one
+    column per field (see DINO_FIELDS, STRUCTURE_FIELDS and ITEM_FIELDS). All requested tables are
+    filled from a single pass over the game table, reading the parsed game objects directly
+    without constructing the object model.
+
+    lat and long are only filled when a map is given. Dino stat points come from the status
+    component of each dino, cryopodded dinos are not included.
+    Missing integers are -1, missing floats nan and missing strings None.
+    """
+    KINDS = ("dinos", "structures", "items")
+
+    def __init__(self, save: AsaSave, map: ArkMap = None):
+        self.save = save
+        self.map = map
+
+    def export(self, kinds: Iterable[str] = KINDS) -> Dict[str, "np.ndarray"]:
+        import numpy as np
+
+        kinds = tuple(kinds)
+        for kind in kinds:
+            if kind not in self.KINDS:
+                raise ValueError(f"Unknown table '{kind}', expected one of {self.KINDS}")
+
+        dinos: List[Tuple[ArkGameObject, Optional[UUID]]] = []
+        status_points: Dict[UUID, Tuple[int, List[int]]] = {}
+        structures: List[tuple] = []
+        items: List[tuple] = []
+
+        for obj in self.__objects(kinds):
+            name = obj.blueprint
+            if "dinos" in kinds and _is_dino(name):
+                status = obj.get_property_value("MyCharacterStatusComponent")
+                dinos.append((obj, status.uuid if status is not None else None))
+            elif "dinos" in kinds and _is_status_component(name):
+                status_points[obj.uuid] = self.__status_points(obj)
+            elif "structures" in kinds and _is_structure(name):
+                structures.append(self.__structure_row(obj))
+            elif "items" in kinds and _is_item(name):
+                items.append(self.__item_row(obj))
+
+        tables = {}
+        if "dinos" in kinds:
+            rows = [self.__dino_row(obj, status_points.get(status_uuid)) for obj, status_uuid in dinos]
+            tables["dinos"] = self.__with_map_coordinates(np.array(rows, dtype=DINO_FIELDS))
+        if "structures" in kinds:
+            tables["structures"] = self.__with_map_coordinates(np.array(structures, dtype=STRUCTURE_FIELDS))
+        if "items" in kinds:
+            tables["items"] = np.array(items, dtype=ITEM_FIELDS)
+
+        ArkSaveLogger.api_log("Columnar export: " + ", ".join(f"{len(t)} {k}" for k, t in tables.items()))
+        return tables
+
+    def dinos(self) -> "np.ndarray":
+        return self.export(("dinos",))["dinos"]
+
+    def structures(self) -> "np.ndarray":
+        return self.export(("structures",))["structures"]
+
+    def items(self) -> "np.ndarray":
+        return self.export(("items",))["items"]
+
+    @staticmethod
+    def to_arrow(table: "np.ndarray") -> "pyarrow.Table":
+        """Converts a structured array to a pyarrow Table, requires pyarrow"""
+        pa = ColumnarApi.__import_pyarrow()
+        names = list(table.dtype.names)
+        return pa.Table.from_arrays([pa.array(table[name]) for name in names], names=names)
+
+    def write_parquet(self, export_folder_path: str = Path.cwd() / "parquet_exports", kinds: Iterable[str] = KINDS) -> Dict[str, Path]:
+        """Writes <kind>.parquet per table, requires pyarrow"""
+        ColumnarApi.__import_pyarrow()
+        import pyarrow.parquet as pq
+
+        path_obj = Path(export_folder_path)
+        if not (path_obj.exists() and path_obj.is_dir()):
+            path_obj.mkdir(parents=True, exist_ok=True)
+
+        paths = {}
+        for kind, table in self.export(kinds).items():
+            paths[kind] = path_obj / f"{kind}.parquet"
+            pq.write_table(self.to_arrow(table), paths[kind])
+        return paths
+
+    @staticmethod
+    def __import_pyarrow():
+        try:
+            import pyarrow
+        except ImportError as e:
+            raise ImportError("Arrow and Parquet export require pyarrow, install it with 'pip install pyarrow'") from e
+        return pyarrow
+
+    def __objects(self, kinds: Tuple[str, ...]) -> Iterable[ArkGameObject]:
+        accepts = []
+        if "dinos" in kinds:
+            accepts += [_is_dino, _is_status_component]
+        if "structures" in kinds:
+            accepts.append(_is_structure)
+        if "items" in kinds:
+            accepts.append(_is_item)
+
+        context = self.save.save_context
+        # With a name table the first 4 bytes of every row are the id of its class name
+        by_name_id = context.has_name_table() and context.constant_name_table is None
+        accepted_ids: Dict[bytes, bool] = {}
+
+        cursor = self.save.connection.cursor()
+        for key, value in cursor.execute("SELECT key, value FROM game"):
+            if by_name_id and accepted_ids.get(value[:4]) is False:
+                continue
+
+            reader = ArkBinaryParser(value, context)
+            class_name = reader.read_name()
+            if class_name is None:
+                continue
+
+            accepted = any(accept(class_name) for accept in accepts)
+            if by_name_id:
+                accepted_ids[value[:4]] = accepted
+            if not accepted:
+                continue
+
+            obj_uuid = AsaSave.byte_array_to_uuid(key)
+            obj = self.save.parsed_objects.get(obj_uuid)
+            if obj is None:
+                obj = self.save.parse_as_predefined_object(obj_uuid, class_name, reader)
+            if obj:
+                yield obj
+
+    @staticmethod
+    def __status_points(status: ArkGameObject) -> Tuple[int, List[int]]:
+        points = [_value(status, prop, 0, position=i) for _, prop in _POINT_PROPERTIES for i in range(len(_STAT_NAMES))]
+        return _value(status, "BaseCharacterLevel", 0), points
+
+    @staticmethod
+    def __location(location) -> tuple:
+        if location is None:
+            return (_MISSING_FLOAT,) * len(_LOCATION_FIELDS)
+        return (location.x, location.y, location.z, _MISSING_FLOAT, _MISSING_FLOAT)
+
+    def __dino_row(self, obj: ArkGameObject, status: Optional[Tuple[int, List[int]]]) -> tuple:
+        if status is None:
+            base_level, points, level = _MISSING_INT, [_MISSING_INT] * (3 * len(_STAT_NAMES)), _MISSING_INT
+        else:
+            base_level, points = status
+            # Same as DinoStats.current_level: every applied point plus the base level 1
+            level = sum(points) + 1
+
+        tamed = obj.get_property_value("TamedTimeStamp") is not None
+        owner = obj.get_property_value("OwningPlayerName") or obj.get_property_value("TamerString")
+        return (str(obj.uuid), obj.blueprint, tamed, bool(_value(obj, "bIsFemale", False)),
+                _value(obj, "TargetingTeam", _MISSING_INT), owner, _value(obj, "OwningPlayerID", _MISSING_INT),
+                obj.get_property_value("TribeName"), level, base_level) + \
+               self.__location(obj.get_property_value("SavedBaseWorldLocation")) + tuple(points)
+
+    def __structure_row(self, obj: ArkGameObject) -> tuple:
+        return (str(obj.uuid), obj.blueprint, _value(obj, "TargetingTeam", _MISSING_INT), obj.get_property_value("OwnerName"),
+                _value(obj, "OwningPlayerID", _MISSING_INT), _value(obj, "Health", _MISSING_FLOAT), _value(obj, "MaxHealth", _MISSING_FLOAT),
+                _value(obj, "CurrentItemCount", _MISSING_INT)) + \
+               self.__location(self.save.save_context.actor_transforms.get(obj.uuid))
+
+    @staticmethod
+    def __item_row(obj: ArkGameObject) -> tuple:
+        return (str(obj.uuid), obj.blueprint, _uuid_of(obj.get_property_value("OwnerInventory")), _value(obj, "ItemQuantity", 1),
+                _value(obj, "ItemQualityIndex", 0), _value(obj, "ItemRating", _MISSING_FLOAT), _value(obj, "SavedDurability", _MISSING_FLOAT),
+                bool(_value(obj, "bIsBlueprint", False)), bool(_value(obj, "bIsEngram", False)))
+
+    def __with_map_coordinates(self, table: "np.ndarray") -> "np.ndarray":
+        import numpy as np
+
+        if self.map is None or len(table) == 0:
+            return table
+        # Same conversion as MapCoordinateParameters.transform_to, for all rows at once
+        params = MapCoordinateParameters(self.map)
+        table["lat"] = np.round(table["y"] / params.longitude_scale + params.longitude_shift, 2)
+        table["long"] = np.round(table["x"] / params.latitude_scale + params.latitude_shift, 2)
+        return table
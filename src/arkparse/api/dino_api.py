@@ -1,12 +1,14 @@
-from typing import Dict, List
+from typing import Callable, Dict, List
 from uuid import UUID
 
 from arkparse.object_model.cryopods.cryopod import Cryopod
 from arkparse.object_model.dinos.dino import Dino
 from arkparse.object_model.dinos.tamed_dino import TamedDino
+from arkparse.object_model.dinos.stat_table import DinoStatTable
 from arkparse.object_model.ark_game_object import ArkGameObject
 from arkparse.object_model.misc.dino_owner import DinoOwner
 from arkparse.ftp.ark_ftp_client import ArkFtpClient
+from arkparse.api.reference_api import ReferenceApi
 
 from arkparse.parsing import ArkBinaryParser
 from arkparse.saves.asa_save import AsaSave
@@ -14,6 +16,7 @@ from arkparse.parsing import GameObjectReaderConfiguration
 from arkparse.parsing.struct.actor_transform import MapCoords
 from arkparse.enums import ArkMap, ArkStat
 from arkparse.utils import TEMP_FILES_DIR
+from arkparse.utils.heatmap import build_heatmap_layers
 from arkparse.logging import ArkSaveLogger
 
 class DinoApi:
@@ -23,6 +26,10 @@ class DinoApi:
         self.parsed_dinos: Dict[UUID, Dino] = {}
         self.parsed_tamed_dinos: Dict[UUID, TamedDino] = {}
         self.parsed_cryopods: Dict[UUID, Cryopod] = {}
+        self.heatmap_cache: Dict[tuple, Dict[str, "np.ndarray"]] = {}
+        # Index of MyInventoryComponent references, (re)built on first use after the save changed
+        self.inventory_references = ReferenceApi(self.save, ("MyInventoryComponent",), GameObjectReaderConfiguration(
+            blueprint_name_filter=lambda name: name is not None and "Dinos/" in name and "_Character_" in name))
 
     def get_all_objects(self, config: GameObjectReaderConfiguration = None) -> Dict[UUID, ArkGameObject]:
         reuse = False
@@ -77,50 +84,56 @@ class DinoApi:
         dinos = {}
 
         ArkSaveLogger.api_log(f"Found {len(objects)} dinos, parsing them... (and retrieving inventories)")
-        for key, obj in objects.items():
-            dino = None
-            if "Dinos/" in obj.blueprint and "_Character_" in obj.blueprint:
-                is_tamed = obj.get_property_value("TamedTimeStamp") is not None
-
-                if obj.uuid in self.parsed_dinos:
-                    if is_tamed:
-                        dino = self.parsed_tamed_dinos[obj.uuid]
-                    else:
-                        dino = self.parsed_dinos[obj.uuid]
-                else:
-                    if is_tamed:
-                        dino = TamedDino(obj.uuid, save=self.save)
-                        self.parsed_tamed_dinos[obj.uuid] = dino
-                    else:
-                        dino = Dino(obj.uuid, save=self.save)
-                        self.parsed_dinos[obj.uuid] = dino
-            elif "PrimalItem_WeaponEmptyCryopod_C" in obj.blueprint:
-                if not obj.get_property_value("bIsEngram", default=False):
-                    if obj.uuid in self.parsed_cryopods:
-                        dino = self.parsed_cryopods[obj.uuid].dino
-                    else:
-                        try:
-                            parser = ArkBinaryParser(self.save.get_game_obj_binary(obj.uuid), self.save.save_context)
-                            cryopod = Cryopod(obj.uuid, parser)
-                            self.parsed_cryopods[obj.uuid] = cryopod
-                            if cryopod.dino is not None:
-                                dino = cryopod.dino
-                        except Exception as e:
-                            if "Unsupported embedded data version" in str(e):
-                                ArkSaveLogger.warning_log(f"Skipping cryopod {obj.uuid} due to unsupported embedded data version (pre Unreal 5.5)")
-                                continue
-                            ArkSaveLogger.set_log_level(ArkSaveLogger.LogTypes.PARSER, True)
-                            parser = ArkBinaryParser(self.save.get_game_obj_binary(obj.uuid), self.save.save_context)
-                            cryopod = Cryopod(obj.uuid, parser)
-                            ArkSaveLogger.set_log_level(ArkSaveLogger.LogTypes.PARSER, False)
-                            ArkSaveLogger.error_log(f"Error parsing cryopod {obj.uuid}: {e}")
-
-                            if ArkSaveLogger._allow_invalid_objects:
-                                continue
-                            raise e
+        items = list(objects.items())
+        for i in range(0, len(items), self.save.PREFETCH_BATCH_SIZE):
+            batch = items[i:i + self.save.PREFETCH_BATCH_SIZE]
+            # The binaries of a batch (and its inventories and items) are released once its dinos are built
+            with self.save.prefetched_references(obj for _, obj in batch \
+                                                 if obj.uuid not in self.parsed_dinos and obj.uuid not in self.parsed_tamed_dinos and obj.uuid not in self.parsed_cryopods):
+                for key, obj in batch:
+                    dino = None
+                    if "Dinos/" in obj.blueprint and "_Character_" in obj.blueprint:
+                        is_tamed = obj.get_property_value("TamedTimeStamp") is not None
+
+                        if obj.uuid in self.parsed_dinos:
+                            if is_tamed:
+                                dino = self.parsed_tamed_dinos[obj.uuid]
+                            else:
+                                dino = self.parsed_dinos[obj.uuid]
+                        else:
+                            if is_tamed:
+                                dino = TamedDino(obj.uuid, save=self.save)
+                                self.parsed_tamed_dinos[obj.uuid] = dino
+                            else:
+                                dino = Dino(obj.uuid, save=self.save)
+                                self.parsed_dinos[obj.uuid] = dino
+                    elif "PrimalItem_WeaponEmptyCryopod_C" in obj.blueprint:
+                        if not obj.get_property_value("bIsEngram", default=False):
+                            if obj.uuid in self.parsed_cryopods:
+                                dino = self.parsed_cryopods[obj.uuid].dino
+                            else:
+                                try:
+                                    parser = ArkBinaryParser(self.save.get_game_obj_binary(obj.uuid), self.save.save_context)
+                                    cryopod = Cryopod(obj.uuid, parser)
+                                    self.parsed_cryopods[obj.uuid] = cryopod
+                                    if cryopod.dino is not None:
+                                        dino = cryopod.dino
+                                except Exception as e:
+                                    if "Unsupported embedded data version" in str(e):
+                                        ArkSaveLogger.warning_log(f"Skipping cryopod {obj.uuid} due to unsupported embedded data version (pre Unreal 5.5)")
+                                        continue
+                                    ArkSaveLogger.set_log_level(ArkSaveLogger.LogTypes.PARSER, True)
+                                    parser = ArkBinaryParser(self.save.get_game_obj_binary(obj.uuid), self.save.save_context)
+                                    cryopod = Cryopod(obj.uuid, parser)
+                                    ArkSaveLogger.set_log_level(ArkSaveLogger.LogTypes.PARSER, False)
+                                    ArkSaveLogger.error_log(f"Error parsing cryopod {obj.uuid}: {e}")
+
+                                    if ArkSaveLogger._allow_invalid_objects:
+                                        continue
+                                    raise e
             
-            if dino is not None:
-                dinos[key] = dino
+                    if dino is not None:
+                        dinos[key] = dino
 
         return dinos
     
@@ -202,14 +215,14 @@ class DinoApi:
     
     def get_all_with_stat_of_at_least(self, value: int, stat: List[ArkStat] = None) -> Dict[UUID, Dino]:
         dinos = self.get_all()
-        filtered_dinos = {}
-        
-        for key, dino in dinos.items():
-            stats_above = dino.stats.get_of_at_least(value)
-            if len(stats_above) and (stat is None or any(s in stats_above for s in stat)):
-                filtered_dinos[key] = dinos[key]
+        table = self.get_stat_table(dinos)
 
-        return filtered_dinos
+        return {key: dinos[key] for key in table.with_stat_of_at_least(value, stat)}
+
+    def get_stat_table(self, dinos: Dict[UUID, Dino] = None) -> DinoStatTable:
+        if dinos is None:
+            dinos = self.get_all()
+        return DinoStatTable(dinos)
     
     def get_all_filtered(self, level_lower_bound: int = None, level_upper_bound: int = None, 
                          class_names: List[str] = None, 
@@ -344,33 +357,36 @@ class DinoApi:
             ftp_client.close()
 
     def create_heatmap(self, map: ArkMap, resolution: int = 100, dinos: Dict[UUID, TamedDino] = None, classes: List[str] = None, owner: DinoOwner = None, only_tamed: bool = False):
-        import math
-        import numpy as np
-
         tamed = None if not only_tamed else True
         if dinos is None:
             dinos = self.get_all_filtered(class_names=classes, tamed=tamed, include_cryopodded=False)
 
-        heatmap = [[0 for _ in range(resolution)] for _ in range(resolution)]
-        # print(f"Found {len(dinos)} dinos")
-
-        for key, dino in dinos.items():
-            if dino.location is None:
-                continue
-
-            coords: MapCoords = dino.location.as_map_coords(map)
-
-            y = math.floor(coords.long)
-            x = math.floor(coords.lat)
-
-            print(f"Adding dino {dino.tamed_name} ({dino.get_short_name()}) at ({x}, {y})")
+        return build_heatmap_layers(dinos.values(), map, resolution)["all"]
 
-            if x < 0 or x >= resolution or y < 0 or y >= resolution:
-                continue
-
-            heatmap[x][y] += 1
+    def create_heatmap_layers(self, map: ArkMap, resolution: int = 100, dinos: Dict[UUID, Dino] = None,
+                              layers: Dict[str, Callable[[Dino], bool]] = None, group_by: Callable[[Dino], str] = None) -> Dict[str, "np.ndarray"]:
+        """
+        Creates several heatmaps in one pass, by default a "tamed" and a "wild" layer.
+        The default layers over all dinos are cached until the save is modified.
+        """
+        cache_key = None
+        if dinos is None and layers is None and group_by is None:
+            cache_key = (self.save.get_snapshot_id(), map, resolution)
+            if cache_key in self.heatmap_cache:
+                return self.heatmap_cache[cache_key]
 
-        return np.array(heatmap)
+        if dinos is None:
+            dinos = self.get_all()
+        if layers is None and group_by is None:
+            layers = {
+                "tamed": lambda dino: isinstance(dino, TamedDino),
+                "wild": lambda dino: not isinstance(dino, TamedDino),
+            }
+
+        heatmaps = build_heatmap_layers(dinos.values(), map, resolution, layers=layers, group_by=group_by)
+        if cache_key is not None:
+            self.heatmap_cache[cache_key] = heatmaps
+        return heatmaps
     
     def get_best_dino_for_stat(self, classes: List[str] = None, stat: ArkStat = None, only_tamed: bool = False, only_untamed: bool = False, base_stat: bool = False, mutated_stat=False) -> (Dino, int, ArkStat):
         if only_tamed and only_untamed:
@@ -384,40 +400,38 @@ class DinoApi:
         else:
             dinos = self.get_all()
 
-        # print(f"Found {len(dinos)} dinos")
+        table = self.get_stat_table(dinos)
+        mask = table.mask(tamed=True if only_tamed else (False if only_untamed else None))
 
-        best_dino = None
-        best_value = None
-        best_stat = None
-        s = stat
-
-        for key, dino in dinos.items():
-            if only_tamed and not isinstance(dino, TamedDino):
-                continue
-            if only_untamed and isinstance(dino, TamedDino):
-                continue
+        if stat is not None:
+            best = table.top_k(stat, 1, base_stat, mutated_stat, mask=mask)
+            best = (best[0][0], stat, best[0][1]) if len(best) else None
+        else:
+            best = table.highest_stat(base_stat, mutated_stat, mask=mask)
 
-            if stat is not None:
-                value = dino.stats.get(stat, base_stat, mutated_stat)
-            else:
-                s, value = dino.stats.get_highest_stat(base_stat, mutated_stat)
+        if best is None:
+            return None, None, None
 
-            if best_value is None or value > best_value:
-                best_value = value
-                best_dino = dinos[key]
-                best_stat = s
+        best_dino = dinos[best[0]]
+        best_stat = best[1]
+        best_value = best[2]
 
         return best_dino, best_value, best_stat
     
-        
     def get_container_of_inventory(self, inv_uuid: UUID, include_cryopodded: bool = True, tamed_dinos: dict[UUID, TamedDino] = None) -> TamedDino:
+        for dino_uuid, _ in self.inventory_references.who_references(inv_uuid):
+            dino = tamed_dinos.get(dino_uuid) if tamed_dinos is not None else self.get_by_uuid(dino_uuid)
+            if isinstance(dino, TamedDino) and dino.inv_uuid == inv_uuid:
+                return dino
+
+        if not include_cryopodded:
+            return None
+
+        # Cryopodded dinos are stored inside their cryopod, so they are not in the reference index
         if tamed_dinos is None:
-            tamed_dinos = self.get_all_tamed(include_cryopodded=include_cryopodded)
+            tamed_dinos = self.get_all_in_cryopod()
         for _, obj in tamed_dinos.items():
-            if not isinstance(obj, TamedDino):
-                continue
-            obj: TamedDino = obj
-            if obj.inv_uuid == inv_uuid:
+            if isinstance(obj, TamedDino) and obj.cryopod is not None and obj.inv_uuid == inv_uuid:
                 return obj
 
         return None
@@ -29,19 +29,33 @@ class GeneralApi:
         return objects
     
     def get_all(self, constructor, use_save_in_constructor: bool = False, valid_filter = None, config = None) -> Dict[UUID, object]:
-        objects = self.get_all_objects(config)
-
         parsed = {}
 
-        for key, obj in objects.items():
+        def build(obj: ArkGameObject, binary: bytes):
+            parser = ArkBinaryParser(binary, self.save.save_context)
+            if use_save_in_constructor:
+                return constructor(obj.uuid, parser, self.save)
+            return constructor(obj.uuid, parser)
+
+        if config is None and self.all_objects is not None:
+            # Objects are known already, their binaries are read (and released) batch by batch
+            objects = [obj for obj in self.all_objects.values() if not valid_filter or valid_filter(obj)]
+            for i in range(0, len(objects), self.save.PREFETCH_BATCH_SIZE):
+                batch = objects[i:i + self.save.PREFETCH_BATCH_SIZE]
+                with self.save.prefetched_references(batch, depth=0):
+                    for obj in batch:
+                        parsed[obj.uuid] = build(obj, self.save.get_game_obj_binary(obj.uuid))
+            return parsed
+
+        # Built from the rows while the game table is scanned, without reading them again
+        objects = {}
+        for key, obj, binary in self.save.iter_game_objects(config if config is not None else self.config):
+            objects[key] = obj
             if valid_filter and not valid_filter(obj):
                 continue
+            parsed[key] = build(obj, binary)
 
-            parser = ArkBinaryParser(self.save.get_game_obj_binary(obj.uuid), self.save.save_context)
-            if use_save_in_constructor:
-                parsed[key] = constructor(obj.uuid, parser, self.save)
-            else:
-                parsed[key] = constructor(obj.uuid, parser)
+        if config is None:
+            self.all_objects = objects
 
         return parsed
-    
\ No newline at end of file
@@ -1,7 +1,13 @@
 import json
 import math
+from collections import deque
+from contextlib import ExitStack
+from dataclasses import dataclass
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from multiprocessing.util import Finalize
 from pathlib import Path
-from typing import Dict
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 from uuid import UUID
 
 from arkparse.logging import ArkSaveLogger
@@ -19,9 +25,12 @@ from arkparse.parsing.struct.ark_item_net_id import ArkItemNetId
 from arkparse.parsing.struct import ArkUniqueNetIdRepl
 from arkparse.parsing.struct import ObjectReference
 from arkparse.saves.asa_save import AsaSave
-from arkparse.utils.json_utils import DefaultJsonEncoder
+from arkparse.saves.save_context import SaveContext
+from arkparse.utils.json_utils import DefaultJsonEncoder, JsonStreamWriter
 
 from arkparse.enums import ArkEquipmentStat
+from arkparse.classes.equipment import Equipment as EqClasses
+from arkparse.classes.player import Player
 from arkparse.object_model.equipment.__armor_defaults import _get_default_hypoT, _get_default_hyperT
 
 def get_player_short_name(obj: ArkGameObject):
@@ -62,7 +71,7 @@ def get_actual_value(obj: ArkGameObject, stat: ArkEquipmentStat, internal_value:
 def primal_item_to_json_obj(obj: ArkGameObject):
     item_id: ArkItemNetId = obj.get_property_value("ItemID")
     owner_in: ObjectReference = obj.get_property_value("OwnerInventory", default=ObjectReference())
-    owner_inv_uuid = UUID(owner_in.value) if owner_in is not None and hasattr(owner_in, "value") and owner_in.value is not None else None
+    owner_inv_uuid = owner_in.uuid if owner_in is not None and hasattr(owner_in, "uuid") else None
     result = { "UUID": obj.uuid.__str__() if obj.uuid is not None else None,
                "ItemNetId1": item_id.id1 if item_id is not None else None,
                "ItemNetId2": item_id.id2 if item_id is not None else None,
@@ -101,6 +110,213 @@ def primal_item_to_json_obj(obj: ArkGameObject):
 
     return result
 
+def player_pawn_to_json_obj(save: AsaSave, pawn_obj: ArkGameObject, parser: ArkBinaryParser):
+    """Returns None for pawns without inventory"""
+    pawn: StructureWithInventory = StructureWithInventory(pawn_obj.uuid, parser, save, game_object=pawn_obj)
+    if pawn.inventory is None or pawn.inventory.object is None:
+        return None
+
+    platform_profile_id: ArkUniqueNetIdRepl = pawn_obj.get_property_value("PlatformProfileID", None)
+    return { "UUID": pawn_obj.uuid.__str__() if pawn_obj.uuid is not None else None,
+             "InventoryUUID": pawn.inventory.object.uuid.__str__() if pawn.inventory.object.uuid is not None else None,
+             "ShortName": get_player_short_name(pawn_obj),
+             "ClassName": "player",
+             "ItemArchetype": pawn_obj.blueprint,
+             "PlayerUniqueNetID": platform_profile_id.value if platform_profile_id is not None else None,
+             "PlayerName": pawn_obj.get_property_value("PlayerName", None),
+             "PlatformProfileName": pawn_obj.get_property_value("PlatformProfileName", None),
+             "LinkedPlayerDataID": pawn_obj.get_property_value("LinkedPlayerDataID", None),
+             "TribeID": pawn_obj.get_property_value("TargetingTeam", None),
+             "TribeName": pawn_obj.get_property_value("TribeName", None),
+             "SavedSleepAnim": pawn_obj.get_property_value("SavedSleepAnim", None), # Last sleep time (Game Time in seconds)
+             "SavedLastTimeHadController": pawn_obj.get_property_value("SavedLastTimeHadController", None), # Last controlled time (Game Time in seconds)
+             "LastTimeUpdatedCharacterStatusComponent": pawn_obj.get_property_value("LastTimeUpdatedCharacterStatusComponent", None), # Last StatusComponent update time (Game Time in seconds)
+             "LastEnterStasisTime": pawn_obj.get_property_value("LastEnterStasisTime", None), # Last enter statis time (Game Time in seconds)
+             "OriginalCreationTime": pawn_obj.get_property_value("OriginalCreationTime", None), # Original creation time (Game Time in seconds)
+             "FacialHairIndex": pawn_obj.get_property_value("FacialHairIndex", None),
+             "HeadHairIndex": pawn_obj.get_property_value("HeadHairIndex", None),
+             "PercentOfFullHeadHairGrowth": pawn_obj.get_property_value("PercentOfFullHeadHairGrowth", None),
+             "bGaveInitialItems": pawn_obj.get_property_value("bGaveInitialItems", None),
+             "bIsSleeping": pawn_obj.get_property_value("bIsSleeping", None),
+             "bSavedWhenStasised": pawn_obj.get_property_value("bSavedWhenStasised", None),
+             "ActorTransformX": pawn_obj.location.x if pawn_obj.location is not None else None,
+             "ActorTransformY": pawn_obj.location.y if pawn_obj.location is not None else None,
+             "ActorTransformZ": pawn_obj.location.z if pawn_obj.location is not None else None }
+
+def _is_dino_class(class_name: str) -> bool:
+    return "Dinos/" in class_name and "_Character_" in class_name
+
+def _is_cryopod_class(class_name: str) -> bool:
+    return "PrimalItem_WeaponEmptyCryopod_C" in class_name
+
+def _dino_to_json_obj(save: AsaSave, obj: ArkGameObject, reader: ArkBinaryParser, include_wilds: bool = True, include_tames: bool = True, include_cryopodded: bool = True):
+    dino = None
+    if _is_dino_class(obj.blueprint):
+        if obj.get_property_value("TamedTimeStamp") is not None:
+            if include_tames:
+                dino = TamedDino(obj.uuid, reader, save, game_object=obj)
+        elif include_wilds:
+            dino = Dino(obj.uuid, reader, save, game_object=obj)
+    elif include_cryopodded and not obj.get_property_value("bIsEngram", default=False):
+        dino = Cryopod(obj.uuid, reader, game_object=obj).dino
+
+    return dino.to_json_obj() if dino is not None else None
+
+def _is_structure_class(class_name: str) -> bool:
+    return "/Structures" in class_name and "PrimalItemStructure_" not in class_name
+
+def _structure_to_json_obj(save: AsaSave, obj: ArkGameObject, reader: ArkBinaryParser, only_structures_with_inventory: bool = False):
+    if obj.get_property_value("MaxItemCount") is not None or (obj.get_property_value("MyInventoryComponent") is not None and obj.get_property_value("CurrentItemCount") is not None):
+        structure = StructureWithInventory(obj.uuid, reader, save, game_object=obj)
+    elif only_structures_with_inventory:
+        return None
+    else:
+        structure = Structure(obj.uuid, reader, game_object=obj)
+
+    loc = save.save_context.actor_transforms.get(obj.uuid)
+    if loc is not None:
+        structure.set_actor_transform(loc)
+    return structure.to_json_obj()
+
+_ITEM_CLASS_MARKERS = ("/PrimalItemArmor_", "/PrimalItem_", "/PrimalItemAmmo_", "/PrimalItemC4Ammo",
+                       "/PrimalItemResource_", "/DroppedItemGeneric_", "/PrimalItemConsumable_")
+
+def _is_item_class(class_name: str) -> bool:
+    return any(marker in class_name for marker in _ITEM_CLASS_MARKERS)
+
+def _item_to_json_obj(save: AsaSave, obj: ArkGameObject, reader: ArkBinaryParser, include_engrams: bool = False):
+    if (not include_engrams) and obj.get_property_value("bIsEngram"):
+        return None
+    return primal_item_to_json_obj(obj)
+
+def _equipment_to_json_obj(constructor):
+    def to_json_obj(save: AsaSave, obj: ArkGameObject, reader: ArkBinaryParser):
+        if obj.get_property_value("bIsEngram"):
+            return None
+        return constructor(obj.uuid, reader, game_object=obj).to_json_obj()
+    return to_json_obj
+
+@dataclass
+class _RowExporter:
+    accepts: Callable[[str], bool]                       # decided on the class name only, before parsing
+    to_json_obj: Callable[..., Optional[Dict[str, Any]]] # (save, obj, reader, **options), None to skip the object
+
+_ARMOR_BPS = frozenset(EqClasses.armor.all_bps)
+_WEAPON_BPS = frozenset(EqClasses.weapons.all_bps)
+_SHIELD_BPS = frozenset(EqClasses.shield.all_bps)
+_SADDLE_BPS = frozenset(EqClasses.saddles.all_bps)
+_PAWN_BPS = frozenset([Player.pawn_female, Player.pawn_male])
+
+# Export kinds that are produced from single game table rows, the kind is also the output file name
+_ROW_EXPORTERS: Dict[str, _RowExporter] = {
+    "armors": _RowExporter(lambda name: name in _ARMOR_BPS, _equipment_to_json_obj(Armor)),
+    "weapons": _RowExporter(lambda name: name in _WEAPON_BPS, _equipment_to_json_obj(Weapon)),
+    "shields": _RowExporter(lambda name: name in _SHIELD_BPS, _equipment_to_json_obj(Shield)),
+    "saddles": _RowExporter(lambda name: name in _SADDLE_BPS, _equipment_to_json_obj(Saddle)),
+    "player_pawns": _RowExporter(lambda name: name in _PAWN_BPS, player_pawn_to_json_obj),
+    "items": _RowExporter(_is_item_class, _item_to_json_obj),
+    "dinos": _RowExporter(lambda name: _is_dino_class(name) or _is_cryopod_class(name), _dino_to_json_obj),
+    "structures": _RowExporter(_is_structure_class, _structure_to_json_obj),
+}
+
+# Rows handed to a worker process per task
+EXPORT_TASK_ROWS = 2000
+EXPORT_PENDING_TASKS = 4
+
+def _export_rows(save: AsaSave, exports: Dict[str, dict], first_rowid: int = None, last_rowid: int = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Yields (kind, record) for the given export kinds (kind -> options) in a single pass over the
+    game table, optionally limited to a rowid range. Rows are classified once per class name id and
+    every accepted row is parsed once, also when several exports use it.
+    """
+    exporters = {kind: _ROW_EXPORTERS[kind] for kind in exports}
+    context = save.save_context
+    # With a name table the first 4 bytes of every row are the id of its class name
+    by_name_id = context.has_name_table() and context.constant_name_table is None
+    interested_per_class: Dict[Any, List[str]] = {}
+
+    query = "SELECT key, value FROM game"
+    params = ()
+    if first_rowid is not None:
+        query += " WHERE rowid BETWEEN ? AND ?"
+        params = (first_rowid, last_rowid)
+
+    cursor = save.connection.cursor()
+    for key, value in cursor.execute(query, params):
+        interested = interested_per_class.get(value[:4]) if by_name_id else None
+        if interested is not None and len(interested) == 0:
+            continue
+
+        reader = ArkBinaryParser(value, context)
+        class_name = reader.read_name()
+        if class_name is None:
+            continue
+
+        if interested is None:
+            class_key = value[:4] if by_name_id else class_name
+            interested = interested_per_class.get(class_key)
+            if interested is None:
+                interested = [kind for kind, exporter in exporters.items() if exporter.accepts(class_name)]
+                interested_per_class[class_key] = interested
+            if len(interested) == 0:
+                continue
+
+        obj = save.parse_as_predefined_object(save.byte_array_to_uuid(key), class_name, reader)
+        if not obj:
+            continue
+
+        for kind in interested:
+            record = exporters[kind].to_json_obj(save, obj, reader, **exports[kind])
+            if record is not None:
+                yield kind, record
+
+_worker_save: AsaSave = None
+
+def _init_export_worker(db_path: str, save_context: SaveContext):
+    global _worker_save
+    # Reads the working copy of the exporting save, with its name table and actor transforms
+    _worker_save = AsaSave(working_copy=Path(db_path), save_context=save_context)
+    # Drop the save when the worker exits so its connection is closed
+    Finalize(None, _close_export_worker, exitpriority=10)
+
+def _close_export_worker():
+    global _worker_save
+    _worker_save = None
+
+def _export_worker_range(exports: Dict[str, dict], format: str, first_rowid: int, last_rowid: int) -> List[Tuple[str, str]]:
+    # Records are serialized in the worker, only the text is sent back to the writing process
+    records = _export_rows(_worker_save, exports, first_rowid, last_rowid)
+    return [(kind, JsonStreamWriter.serialize_record(record, format)) for kind, record in records]
+
+def _export_rows_parallel(save: AsaSave, exports: Dict[str, dict], format: str, workers: int, ordered: bool) -> Iterator[Tuple[str, str]]:
+    """
+    Yields (kind, serialized record) produced by a process pool, each worker opens the working copy of the save read-only.
+    At most EXPORT_PENDING_TASKS tasks per worker are in flight, so finished results do not pile up.
+    """
+    rowids = [row[0] for row in save.connection.execute("SELECT rowid FROM game ORDER BY rowid")]
+    ranges = iter([(rowids[i], rowids[min(i + EXPORT_TASK_ROWS, len(rowids)) - 1]) for i in range(0, len(rowids), EXPORT_TASK_ROWS)])
+
+    # Modifications are committed by the write sessions, the workers see the current state of the save
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_export_worker, initargs=(str(save.sqlite_db), save.save_context)) as executor:
+        def submit(rowid_range):
+            return executor.submit(_export_worker_range, exports, format, *rowid_range)
+
+        pending = deque(submit(r) for r in islice(ranges, workers * EXPORT_PENDING_TASKS))
+        while pending:
+            if ordered:
+                future = pending.popleft()
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                future = done.pop()
+                pending.remove(future)
+
+            next_range = next(ranges, None)
+            if next_range is not None:
+                pending.append(submit(next_range))
+
+            for item in future.result():
+                yield item
+
 class JsonApi:
     def __init__(self, save: AsaSave, ignore_error: bool = False):
         self.save = save
@@ -227,34 +443,8 @@ class JsonApi:
         all_pawns = []
         for pawn_obj in player_pawns.values():
             pawn_obj_binary = self.save.get_game_obj_binary(pawn_obj.uuid)
-            pawn: StructureWithInventory = StructureWithInventory(pawn_obj.uuid, ArkBinaryParser(pawn_obj_binary, save_context=self.save.save_context), self.save)
-            if pawn.inventory is not None and pawn.inventory.object is not None:
-                platform_profile_id: ArkUniqueNetIdRepl = pawn_obj.get_property_value("PlatformProfileID", None)
-                pawn_data = { "UUID": pawn_obj.uuid.__str__() if pawn_obj.uuid is not None else None,
-                              "InventoryUUID": pawn.inventory.object.uuid.__str__() if pawn.inventory.object.uuid is not None else None,
-                              "ShortName": get_player_short_name(pawn_obj),
-                              "ClassName": "player",
-                              "ItemArchetype": pawn_obj.blueprint,
-                              "PlayerUniqueNetID": platform_profile_id.value if platform_profile_id is not None else None,
-                              "PlayerName": pawn_obj.get_property_value("PlayerName", None),
-                              "PlatformProfileName": pawn_obj.get_property_value("PlatformProfileName", None),
-                              "LinkedPlayerDataID": pawn_obj.get_property_value("LinkedPlayerDataID", None),
-                              "TribeID": pawn_obj.get_property_value("TargetingTeam", None),
-                              "TribeName": pawn_obj.get_property_value("TribeName", None),
-                              "SavedSleepAnim": pawn_obj.get_property_value("SavedSleepAnim", None), # Last sleep time (Game Time in seconds)
-                              "SavedLastTimeHadController": pawn_obj.get_property_value("SavedLastTimeHadController", None), # Last controlled time (Game Time in seconds)
-                              "LastTimeUpdatedCharacterStatusComponent": pawn_obj.get_property_value("LastTimeUpdatedCharacterStatusComponent", None), # Last StatusComponent update time (Game Time in seconds)
-                              "LastEnterStasisTime": pawn_obj.get_property_value("LastEnterStasisTime", None), # Last enter statis time (Game Time in seconds)
-                              "OriginalCreationTime": pawn_obj.get_property_value("OriginalCreationTime", None), # Original creation time (Game Time in seconds)
-                              "FacialHairIndex": pawn_obj.get_property_value("FacialHairIndex", None),
-                              "HeadHairIndex": pawn_obj.get_property_value("HeadHairIndex", None),
-                              "PercentOfFullHeadHairGrowth": pawn_obj.get_property_value("PercentOfFullHeadHairGrowth", None),
-                              "bGaveInitialItems": pawn_obj.get_property_value("bGaveInitialItems", None),
-                              "bIsSleeping": pawn_obj.get_property_value("bIsSleeping", None),
-                              "bSavedWhenStasised": pawn_obj.get_property_value("bSavedWhenStasised", None),
-                              "ActorTransformX": pawn_obj.location.x if pawn_obj.location is not None else None,
-                              "ActorTransformY": pawn_obj.location.y if pawn_obj.location is not None else None,
-                              "ActorTransformZ": pawn_obj.location.z if pawn_obj.location is not None else None }
+            pawn_data = player_pawn_to_json_obj(self.save, pawn_obj, ArkBinaryParser(pawn_obj_binary, save_context=self.save.save_context))
+            if pawn_data is not None:
                 all_pawns.append(pawn_data)
 
         # Create json exports folder if it does not exist.
@@ -268,139 +458,63 @@ class JsonApi:
 
         ArkSaveLogger.api_log("Player pawns successfully exported.")
 
-    def export_dinos(self, export_folder_path: str = Path.cwd() / "json_exports", include_wilds: bool = True, include_tames: bool = True, include_cryopodded: bool = True):
-        ArkSaveLogger.api_log("Exporting dinos...")
-
-        # Parse and format dinos as JSON.
-        all_dinos = []
-        query = "SELECT key, value FROM game"
-        with self.save.connection as conn:
-            cursor = conn.execute(query)
-            for row in cursor:
-                obj_uuid = self.save.byte_array_to_uuid(row[0])
-                byte_buffer = ArkBinaryParser(row[1], self.save.save_context)
-                class_name = byte_buffer.read_name()
-                if class_name is None or ("PrimalItem_WeaponEmptyCryopod_C" not in class_name and not ("Dinos/" in class_name and "_Character_" in class_name)):
-                    continue
-                obj = self.save.parse_as_predefined_object(obj_uuid, class_name, byte_buffer)
-                if obj:
-                    dino = None
-                    if (include_tames or include_wilds) and "Dinos/" in obj.blueprint and "_Character_" in obj.blueprint:
-                        is_tamed = obj.get_property_value("TamedTimeStamp") is not None
-                        parser = ArkBinaryParser(self.save.get_game_obj_binary(obj.uuid), self.save.save_context)
-                        if is_tamed:
-                            if include_tames:
-                                dino = TamedDino(obj.uuid, parser, self.save)
-                        else:
-                            if include_wilds:
-                                dino = Dino(obj.uuid, parser, self.save)
-                    elif include_cryopodded and "PrimalItem_WeaponEmptyCryopod_C" in obj.blueprint:
-                        if not obj.get_property_value("bIsEngram", default=False):
-                            cryopod = Cryopod(obj.uuid, ArkBinaryParser(self.save.get_game_obj_binary(obj.uuid), self.save.save_context))
-                            if cryopod.dino is not None:
-                                dino = cryopod.dino
-                    if dino is not None:
-                        all_dinos.append(dino.to_json_obj())
-
+    def __export_rows(self, exports: Dict[str, dict], export_folder_path: str, format: str, workers: int, ordered: bool) -> Dict[str, Path]:
+        """Writes every export kind to its own file while the game table is read once"""
         # Create json exports folder if it does not exist.
         path_obj = Path(export_folder_path)
         if not (path_obj.exists() and path_obj.is_dir()):
             path_obj.mkdir(parents=True, exist_ok=True)
 
-        # Write JSON.
-        with open(path_obj / "dinos.json", "w") as text_file:
-            text_file.write(json.dumps(all_dinos, indent=4, cls=DefaultJsonEncoder))
-
+        paths = {kind: path_obj / (kind + JsonStreamWriter.EXTENSIONS.get(format, ".json")) for kind in exports}
+        with ExitStack() as stack:
+            writers = {kind: stack.enter_context(JsonStreamWriter(path, format)) for kind, path in paths.items()}
+            if workers > 1:
+                for kind, text in _export_rows_parallel(self.save, exports, format, workers, ordered):
+                    writers[kind].write_serialized(text)
+            else:
+                for kind, record in _export_rows(self.save, exports):
+                    writers[kind].write(record)
+
+        for kind, writer in writers.items():
+            ArkSaveLogger.api_log(f"Exported {writer.count} {kind} to {paths[kind]}")
+        return paths
+
+    def export_dinos(self, export_folder_path: str = Path.cwd() / "json_exports", include_wilds: bool = True, include_tames: bool = True, include_cryopodded: bool = True,
+                     format: str = "json", workers: int = 1, ordered: bool = True):
+        """
+        Exports dinos to dinos.json (or dinos.jsonl for the jsonl format), records are written as they are parsed.
+        With workers > 1 the rows are parsed by a process pool, ordered=False writes records in completion order.
+        """
+        ArkSaveLogger.api_log("Exporting dinos...")
+        options = {"include_wilds": include_wilds, "include_tames": include_tames, "include_cryopodded": include_cryopodded}
+        self.__export_rows({"dinos": options}, export_folder_path, format, workers, ordered)
         ArkSaveLogger.api_log("Dinos successfully exported.")
 
-    def export_structures(self, export_folder_path: str = Path.cwd() / "json_exports", only_structures_with_inventory: bool = False):
+    def export_structures(self, export_folder_path: str = Path.cwd() / "json_exports", only_structures_with_inventory: bool = False,
+                          format: str = "json", workers: int = 1, ordered: bool = True):
         ArkSaveLogger.api_log("Exporting structures...")
-
-        # Parse and format structures as JSON.
-        all_structures = []
-        query = "SELECT key, value FROM game"
-        with self.save.connection as conn:
-            cursor = conn.execute(query)
-            for row in cursor:
-                obj_uuid = self.save.byte_array_to_uuid(row[0])
-                byte_buffer = ArkBinaryParser(row[1], self.save.save_context)
-                class_name = byte_buffer.read_name()
-                if class_name is None or "/Structures" not in class_name or "PrimalItemStructure_" in class_name:
-                    continue
-                obj = self.save.parse_as_predefined_object(obj_uuid, class_name, byte_buffer)
-                if obj:
-                    obj: ArkGameObject = obj
-                    if obj is not None:
-                        parser = ArkBinaryParser(self.save.get_game_obj_binary(obj.uuid), self.save.save_context)
-                        if obj.get_property_value("MaxItemCount") is not None or (obj.get_property_value("MyInventoryComponent") is not None and obj.get_property_value("CurrentItemCount") is not None):
-                            structure = StructureWithInventory(obj.uuid, parser, self.save)
-                        else:
-                            if only_structures_with_inventory:
-                                continue
-                            structure = Structure(obj.uuid, parser)
-                        if obj.uuid in self.save.save_context.actor_transforms:
-                            structure.set_actor_transform(self.save.save_context.actor_transforms[obj.uuid])
-                        all_structures.append(structure.to_json_obj())
-
-        # Create json exports folder if it does not exist.
-        path_obj = Path(export_folder_path)
-        if not (path_obj.exists() and path_obj.is_dir()):
-            path_obj.mkdir(parents=True, exist_ok=True)
-
-        # Write JSON.
-        with open(path_obj / "structures.json", "w") as text_file:
-            text_file.write(json.dumps(all_structures, indent=4, cls=DefaultJsonEncoder))
-
+        options = {"only_structures_with_inventory": only_structures_with_inventory}
+        self.__export_rows({"structures": options}, export_folder_path, format, workers, ordered)
         ArkSaveLogger.api_log("Structures successfully exported.")
 
-    def export_items(self, export_folder_path: str = Path.cwd() / "json_exports", include_engrams: bool = False):
+    def export_items(self, export_folder_path: str = Path.cwd() / "json_exports", include_engrams: bool = False,
+                     format: str = "json", workers: int = 1, ordered: bool = True):
         ArkSaveLogger.api_log("Exporting items...")
-
-        # Parse and format items as JSON.
-        all_items = []
-        query = "SELECT key, value FROM game"
-        with self.save.connection as conn:
-            cursor = conn.execute(query)
-            for row in cursor:
-                obj_uuid = self.save.byte_array_to_uuid(row[0])
-                byte_buffer = ArkBinaryParser(row[1], self.save.save_context)
-                class_name = byte_buffer.read_name()
-
-                if "/PrimalItemArmor_" not in class_name and \
-                        "/PrimalItem_" not in class_name and \
-                        "/PrimalItemAmmo_" not in class_name and \
-                        "/PrimalItemC4Ammo" not in class_name and \
-                        "/PrimalItemResource_" not in class_name and \
-                        "/DroppedItemGeneric_" not in class_name and \
-                        "/PrimalItemConsumable_" not in class_name:
-                    continue
-
-                obj = self.save.parse_as_predefined_object(obj_uuid, class_name, byte_buffer)
-                if obj:
-                    if (not include_engrams) and obj.get_property_value("bIsEngram"):
-                        continue
-                    all_items.append(primal_item_to_json_obj(obj))
-
-        # Create json exports folder if it does not exist.
-        path_obj = Path(export_folder_path)
-        if not (path_obj.exists() and path_obj.is_dir()):
-            path_obj.mkdir(parents=True, exist_ok=True)
-
-        # Write JSON.
-        with open(path_obj / "items.json", "w") as text_file:
-            text_file.write(json.dumps(all_items, indent=4, cls=DefaultJsonEncoder))
-
+        options = {"include_engrams": include_engrams}
+        self.__export_rows({"items": options}, export_folder_path, format, workers, ordered)
         ArkSaveLogger.api_log("Items successfully exported.")
 
     def export_all(self,
                    equipment_api: EquipmentApi = None,
                    player_api: PlayerApi = None,
-                   export_folder_path: str = Path.cwd() / "json_exports"):
-        self.export_armors(equipment_api=equipment_api, export_folder_path=export_folder_path)
-        self.export_weapons(equipment_api=equipment_api, export_folder_path=export_folder_path)
-        self.export_shields(equipment_api=equipment_api, export_folder_path=export_folder_path)
-        self.export_saddles(equipment_api=equipment_api, export_folder_path=export_folder_path)
-        self.export_player_pawns(player_api=player_api, export_folder_path=export_folder_path)
-        self.export_items(export_folder_path=export_folder_path)
-        self.export_dinos(export_folder_path=export_folder_path)
-        self.export_structures(export_folder_path=export_folder_path)
+                   export_folder_path: str = Path.cwd() / "json_exports",
+                   format: str = "json", workers: int = 1, ordered: bool = True):
+        """
+        Exports armors, weapons, shields, saddles, player pawns, items, dinos and structures in a
+        single pass over the save, all output files are written at the same time.
+        equipment_api and player_api are no longer needed, they are accepted for compatibility.
+        """
+        ArkSaveLogger.api_log("Exporting all...")
+        exports = {kind: {} for kind in _ROW_EXPORTERS}
+        self.__export_rows(exports, export_folder_path, format, workers, ordered)
+        ArkSaveLogger.api_log("All successfully exported.")
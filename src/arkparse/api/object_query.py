@@ -0,0 +1,223 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Type
+from uuid import UUID
+
+from arkparse.enums import ArkMap
+from arkparse.logging import ArkSaveLogger
+from arkparse.object_model.ark_game_object import ArkGameObject
+from arkparse.object_model.dinos.dino import Dino
+from arkparse.object_model.dinos.tamed_dino import TamedDino
+from arkparse.object_model.structures import Structure, StructureWithInventory
+from arkparse.parsing import ArkBinaryParser
+from arkparse.parsing.struct.actor_transform import ActorTransform, MapCoords
+from arkparse.saves.asa_save import AsaSave
+
+
+_OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "eq": lambda value, expected: value == expected,
+    "ne": lambda value, expected: value != expected,
+    "gt": lambda value, expected: value is not None and value > expected,
+    "gte": lambda value, expected: value is not None and value >= expected,
+    "lt": lambda value, expected: value is not None and value < expected,
+    "lte": lambda value, expected: value is not None and value <= expected,
+    "in": lambda value, expected: value in expected,
+}
+
+# Fields answered from the parsed game object, before the object model is constructed
+_OBJECT_FIELDS: Dict[str, Callable[[ArkGameObject], Any]] = {
+    "tamed": lambda obj: obj.get_property_value("TamedTimeStamp") is not None,
+    "owner_tribe": lambda obj: obj.get_property_value("TargetingTeam"),
+    "blueprint": lambda obj: obj.blueprint,
+}
+
+# Fields that need the object model
+_MODEL_FIELDS: Dict[str, Callable[[Any], Any]] = {
+    "level": lambda model: model.stats.current_level,
+}
+
+
+def _is_dino(name: Optional[str]) -> bool:
+    return name is not None and "Dinos/" in name and "_Character_" in name
+
+def _is_structure(name: Optional[str]) -> bool:
+    return name is not None and "/Structures" in name and "PrimalItemStructure_" not in name
+
+def _build_dino(save: AsaSave, obj: ArkGameObject, value: bytes):
+    parser = ArkBinaryParser(value, save.save_context)
+    if obj.get_property_value("TamedTimeStamp") is not None:
+        return TamedDino(obj.uuid, binary=parser, save=save, game_object=obj)
+    return Dino(obj.uuid, binary=parser, save=save, game_object=obj)
+
+def _build_structure(save: AsaSave, obj: ArkGameObject, value: bytes):
+    parser = ArkBinaryParser(value, save.save_context)
+    if obj.get_property_value("MaxItemCount") is not None or (obj.get_property_value("MyInventoryComponent") is not None and obj.get_property_value("CurrentItemCount") is not None):
+        structure = StructureWithInventory(obj.uuid, parser, save, game_object=obj)
+    else:
+        structure = Structure(obj.uuid, parser, game_object=obj)
+    loc = save.save_context.actor_transforms.get(obj.uuid)
+    if loc is not None:
+        structure.set_actor_transform(loc)
+    return structure
+
+def _dino_location(save: AsaSave, obj: ArkGameObject) -> Optional[ActorTransform]:
+    return ActorTransform(vector=obj.get_property_value("SavedBaseWorldLocation"))
+
+def _structure_location(save: AsaSave, obj: ArkGameObject) -> Optional[ActorTransform]:
+    return save.save_context.actor_transforms.get(obj.uuid)
+
+
+@dataclass
+class _QueryTarget:
+    blueprint_filter: Callable[[Optional[str]], bool]
+    build: Callable[[AsaSave, ArkGameObject, bytes], Any]
+    location: Callable[[AsaSave, ArkGameObject], Optional[ActorTransform]]
+    criteria: Dict[str, Any]
+
+
+_TARGETS: Dict[type, _QueryTarget] = {
+    Dino: _QueryTarget(_is_dino, _build_dino, _dino_location, {}),
+    TamedDino: _QueryTarget(_is_dino, _build_dino, _dino_location, {"tamed": True}),
+    Structure: _QueryTarget(_is_structure, _build_structure, _structure_location, {}),
+    StructureWithInventory: _QueryTarget(_is_structure, _build_structure, _structure_location, {}),
+}
+
+
+class ObjectQuery:
+    """
+    Declarative query over the object model, for example:
+
+        save.query(Dino).where(tamed=True, class_in=[...], level__gte=150, owner_tribe=123).near(map, coords, 0.5).limit(50).all()
+
+    The class filter is turned into a SQL filter on the class name id of each row, property
+    criteria are checked on the parsed game object and only the remaining objects are
+    constructed as object model instances, all in one streaming pass over the game table.
+
+    Criteria are field=value or field__op=value with op one of eq, ne, gt, gte, lt, lte, in.
+    Known fields are tamed, owner_tribe, blueprint and level, class_in limits the blueprints,
+    any other field is compared against the game object property of that name.
+    Cryopodded dinos are not included, they are stored inside the cryopod items.
+    """
+    def __init__(self, save: AsaSave, target: Type):
+        if target not in _TARGETS:
+            raise ValueError(f"Unsupported query target {target}, supported are {[t.__name__ for t in _TARGETS]}")
+        self.save = save
+        self.target = _TARGETS[target]
+        self.target_type = target
+        self.classes: Optional[List[str]] = None
+        self.object_predicates: List[Callable[[ArkGameObject], bool]] = []
+        self.model_predicates: List[Callable[[Any], bool]] = []
+        self.location_filter: Optional[Tuple[ArkMap, MapCoords, float]] = None
+        self.max_results: Optional[int] = None
+        self.where(**self.target.criteria)
+        if target is StructureWithInventory:
+            self.filter(lambda model: isinstance(model, StructureWithInventory))
+
+    def where(self, **criteria) -> "ObjectQuery":
+        for key, expected in criteria.items():
+            if key == "class_in":
+                classes = set(expected)
+                self.classes = list(classes if self.classes is None else classes.intersection(self.classes))
+                continue
+
+            field, _, op = key.partition("__")
+            op = op or "eq"
+            if op not in _OPERATORS:
+                raise ValueError(f"Unknown operator '{op}' in criterion '{key}'")
+            compare = _OPERATORS[op]
+
+            if field in _MODEL_FIELDS:
+                getter = _MODEL_FIELDS[field]
+                self.model_predicates.append(lambda model, g=getter, c=compare, e=expected: c(g(model), e))
+            else:
+                getter = _OBJECT_FIELDS.get(field, lambda obj, f=field: obj.get_property_value(f))
+                self.object_predicates.append(lambda obj, g=getter, c=compare, e=expected: c(g(obj), e))
+        return self
+
+    def filter(self, predicate: Callable[[Any], bool]) -> "ObjectQuery":
+        """Adds an arbitrary predicate on the constructed object model instance"""
+        self.model_predicates.append(predicate)
+        return self
+
+    def near(self, map: ArkMap, coords: MapCoords, radius: float = 0.3) -> "ObjectQuery":
+        self.location_filter = (map, coords, radius)
+        return self
+
+    def limit(self, max_results: int) -> "ObjectQuery":
+        self.max_results = max_results
+        return self
+
+    def __blueprint_filter(self, name: Optional[str]) -> bool:
+        if not self.target.blueprint_filter(name):
+            return False
+        return self.classes is None or name in self.classes
+
+    def __class_name_ids(self) -> Optional[List[bytes]]:
+        # The class name is the first name of every object, with a name table it is stored as a 4 byte name id
+        context = self.save.save_context
+        if not context.has_name_table() or context.constant_name_table is not None:
+            return None
+        ids = [key.to_bytes(4, byteorder="little") for key, name in context.names.items() if self.__blueprint_filter(name)]
+        return ids if len(ids) <= AsaSave.PREFETCH_CHUNK_SIZE else None
+
+    def __rows(self):
+        ids = self.__class_name_ids()
+        cursor = self.save.connection.cursor()
+        if ids is None:
+            cursor.execute("SELECT key, value FROM game")
+        elif len(ids) == 0:
+            return
+        else:
+            cursor.execute(f"SELECT key, value FROM game WHERE substr(value, 1, 4) IN ({','.join('?' * len(ids))})", ids)
+            ArkSaveLogger.api_log(f"Query prefiltered on {len(ids)} class name ids")
+
+        for row in cursor:
+            yield row
+
+    def __object_matches(self, obj: ArkGameObject) -> bool:
+        if not all(predicate(obj) for predicate in self.object_predicates):
+            return False
+
+        if self.location_filter is not None:
+            map, coords, radius = self.location_filter
+            location = self.target.location(self.save, obj)
+            if location is None or not location.is_at_map_coordinate(map, coords, tolerance=radius):
+                return False
+        return True
+
+    def __iter__(self) -> Iterator[Any]:
+        found = 0
+        if self.max_results is not None and self.max_results <= 0:
+            return
+
+        for key, value in self.__rows():
+            obj_uuid = AsaSave.byte_array_to_uuid(key)
+            obj = self.save.parsed_objects.get(obj_uuid)
+            if obj is None:
+                reader = ArkBinaryParser(value, self.save.save_context)
+                class_name = reader.read_name()
+                if not self.__blueprint_filter(class_name):
+                    continue
+                obj = self.save.parse_as_predefined_object(obj_uuid, class_name, reader)
+                if obj is None:
+                    continue
+                self.save.parsed_objects[obj_uuid] = obj
+            elif not self.__blueprint_filter(obj.blueprint):
+                continue
+
+            if not self.__object_matches(obj):
+                continue
+
+            model = self.target.build(self.save, obj, value)
+            if not all(predicate(model) for predicate in self.model_predicates):
+                continue
+
+            yield model
+            found += 1
+            if self.max_results is not None and found >= self.max_results:
+                return
+
+    def all(self) -> Dict[UUID, Any]:
+        return {model.object.uuid: model for model in self}
+
+    def first(self) -> Optional[Any]:
+        return next(iter(self), None)
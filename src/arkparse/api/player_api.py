@@ -1,4 +1,7 @@
-from typing import List, Dict, Set, Optional
+from typing import Callable, List, Dict, Set, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import repeat
 from pathlib import Path
 from uuid import UUID
 import time
@@ -8,11 +11,12 @@ from arkparse.ftp.ark_ftp_client import ArkFtpClient, ArkMap
 from arkparse.player.ark_player import ArkPlayer
 from arkparse.ark_tribe import ArkTribe
 from arkparse.saves.asa_save import AsaSave
+from arkparse.saves.blob_reader import BlobReader
+from arkparse.saves.extraction import ExtractionReport
 from arkparse.object_model.misc.inventory import Inventory
 from arkparse.parsing import ArkBinaryParser
 from arkparse.classes.player import Player
 from arkparse.parsing.game_object_reader_configuration import GameObjectReaderConfiguration
-from arkparse.utils import TEMP_FILES_DIR
 from arkparse.logging import ArkSaveLogger
 
 from arkparse.object_model.misc.dino_owner import DinoOwner
@@ -39,76 +43,98 @@ class _TribeAndPlayerData:
         0x61, 0x74, 0x61, 0x42, 0x50, 0x5f, 0x43, 0x00
     ])
 
-    def __init__(self, store_data: ArkBinaryParser):
+    NONE = bytes([0x4E, 0x6F, 0x6E, 0x65])
+
+    def __init__(self, store_data: BlobReader):
+        # GameModeCustomBytes can be hundreds of MB, it is searched chunk by chunk and
+        # every archive is only read from the save when it is decoded
         self.data = store_data
         
         self.tribe_data_pointers: List[int] = []
         self.player_data_pointers: List[int] = []
-        ArkSaveLogger.set_file(self.data, "TribeAndPlayerData.bin")
         self.initialize_data()
         ArkSaveLogger.api_log(f"Found {len(self.tribe_data_pointers)} tribe data pointers and {len(self.player_data_pointers)} player data pointers in the save data.")
 
     def initialize_data(self) -> None:
-        # Read initial flag (unused)
-        _ = self.data.read_boolean()
+        # The initial flag (first byte) is unused
         self._get_tribe_offsets()
         self._get_player_offsets()
 
     def _get_tribe_offsets(self) -> None:
-        positions = self.data.find_byte_sequence(self.TRIBE_DATA_NAME)
+        # same -1 adjustment find_byte_sequence applies by default
+        positions = [offset - 1 for offset, _ in self.data.find_all([self.TRIBE_DATA_NAME])]
         # print(f"Found {len(positions)} tribe data offsets in the save data.")
-        for pos in positions:
-            # Get ID
-            # print(f"Tribe data found at offset: {pos}")
-            self.data.set_position(pos - 20)
-            uuid_bytes = self.data.read_bytes(16)
-            uuid_pos = self.data.find_byte_sequence(uuid_bytes)
+        tribe_uuids = [self.data.read(pos - 20, 16) for pos in positions]
+
+        # Locate all tribe UUIDs in one pass instead of scanning the blob once per tribe
+        uuid_positions: Dict[bytes, List[int]] = {uuid_bytes: [] for uuid_bytes in tribe_uuids}
+        for offset, uuid_bytes in self.data.find_all(tribe_uuids):
+            uuid_positions[uuid_bytes].append(offset - 1)
+
+        for pos, uuid_bytes in zip(positions, tribe_uuids):
+            uuid_pos = uuid_positions[uuid_bytes]
             ArkSaveLogger.api_log(f"Found tribe UUID at position: {uuid_pos[0]}, second UUID position: {uuid_pos[1]}")
             offset = pos - 36
             size = uuid_pos[1] - offset
             self.tribe_data_pointers.append([uuid_bytes, offset+1, size])
 
     def _get_player_offsets(self) -> None:
-        positions = self.data.find_byte_sequence(self.PLAYER_DATA_NAME)
-        nones = self.data.find_byte_sequence(bytes([0x4E, 0x6F, 0x6E, 0x65]))
+        # One pass for the player data names and the "None" markers, keeping only the
+        # last marker before each player data name instead of every marker position
+        positions = []
+        last_nones = []
+        last_none = None
+        for offset, pattern in self.data.find_all([self.PLAYER_DATA_NAME, self.NONE]):
+            if pattern == self.NONE:
+                last_none = offset - 1
+            else:
+                positions.append(offset - 1)
+                last_nones.append(last_none)
         # print(f"Found {len(positions)} player data offsets in the save data.")
         for i, pos in enumerate(positions):
             # Get ID
-            self.data.set_position(pos - 20)
-            uuid_bytes = self.data.read_bytes(16)
+            uuid_bytes = self.data.read(pos - 20, 16)
             offset = pos - 36
 
             next_player_data = positions[i + 1] if i + 1 < len(positions) else None
-            last_none = self.get_last_none_before(nones, next_player_data)
-            end_pos = last_none + 4
+            end_pos = (last_nones[i + 1] if next_player_data is not None else last_none) + 4
             size = end_pos - offset
             ArkSaveLogger.api_log(f"Player UUID: {uuid_bytes.hex()}, Offset: {offset}, Size: {size}, End: {offset+size}, Next Player Data: {next_player_data}")
             self.player_data_pointers.append([uuid_bytes, offset, size+1])
 
-    def get_last_none_before(self, nones: List[int], pos: int = None):
-        if pos is None:
-            pos = self.data.size() - 1
-        for i in range(len(nones) - 1, -1, -1):
-            if nones[i] < pos:
-                return nones[i]
-            
-        return None
-
-
     def get_ark_tribe_raw_data(self, index: int) -> Optional[bytes]:
         pointer = self.tribe_data_pointers[index]
         if not pointer:
             return None
-        self.data.set_position(pointer[1])
-        return self.data.read_bytes(pointer[2])
+        return self.data.read(pointer[1], pointer[2])
 
     def get_ark_profile_raw_data(self, index: int) -> Optional[bytes]:
         pointer = self.player_data_pointers[index]
         if not pointer:
             return None
-        self.data.set_position(pointer[1])
-        return self.data.read_bytes(pointer[2]) + bytes([0x00, 0x01, 0x00, 0x00, 0x00])  + pointer[0]
+        return self.data.read(pointer[1], pointer[2]) + bytes([0x00, 0x01, 0x00, 0x00, 0x00])  + pointer[0]
+
+class _StoredArchive:
+    """A profile or tribe archive in GameModeCustomBytes, read from the save when it is decoded"""
+    def __init__(self, read: Callable[[], bytes], size: int):
+        self.read = read
+        self.size = size
+
+    def __len__(self) -> int:
+        return self.size
     
+def _decode_archive(constructor, source, from_store: bool):
+    # Exceptions are returned instead of raised so they can be handled per archive by the caller
+    try:
+        if isinstance(source, _StoredArchive):
+            source = source.read()
+        return constructor(source, from_store), None
+    except Exception as e:
+        return None, e
+
+def _source_name(source) -> str:
+    return str(source) if isinstance(source, Path) else f"record ({len(source)} bytes)"
+
 class PlayerApi:
     class StatType:
         LOWEST = 0
@@ -125,16 +151,30 @@ class PlayerApi:
         OBJECT = 0
         DINO = 1
 
-    def __init__(self, save: AsaSave, ignore_error: bool = False):
+    def __init__(self, save: AsaSave, ignore_error: bool = False, workers: int = 1):
         self.players: List[ArkPlayer] = []
         self.tribes: List[ArkTribe] = []
         self.tribe_to_player_map: Dict[int, List[ArkPlayer]] = {}
         self.save: AsaSave = save
         self.pawns: Dict[UUID, ArkGameObject] = None
 
+        # Lookup indexes, rebuilt whenever the players, tribes or pawns are (re)loaded
+        self.players_by_id: Dict[int, ArkPlayer] = {}
+        self.players_by_unique_id: Dict[str, ArkPlayer] = {}
+        self.players_by_name: Dict[str, ArkPlayer] = {}
+        self.tribes_by_id: Dict[int, ArkTribe] = {}
+        self.tribes_by_name: Dict[str, ArkTribe] = {}
+        self.pawns_by_player_id: Dict[int, ArkGameObject] = {}
+        self.player_ids_by_inventory: Dict[UUID, int] = {}
+
         self.profile_paths: Set[Path] = set()
         self.tribe_paths: Set[Path] = set()
+        # Raw profile and tribe archives when the data is stored in the save itself
+        self.profile_records: List[_StoredArchive] = []
+        self.tribe_records: List[_StoredArchive] = []
         self.ignore_error = ignore_error
+        # Number of processes decoding the profile and tribe archives
+        self.workers = workers
 
         self.from_store = True
         if save.profile_data_in_saves() == False:
@@ -152,6 +192,8 @@ class PlayerApi:
 
         if len(self.profile_paths) == 0 and len(self.tribe_paths) == 0 and not self.from_store:
             ArkSaveLogger.api_log("No profile or tribe data found")
+        elif self.from_store:
+            ArkSaveLogger.api_log(f"Found {len(self.profile_records)} profile records and {len(self.tribe_records)} tribe records in the save")
         else:
             ArkSaveLogger.api_log(f"Found {len(self.profile_paths)} profile files and {len(self.tribe_paths)} tribe files in the save directory")
 
@@ -174,32 +216,51 @@ class PlayerApi:
                 blueprint_name_filter=lambda name: name is not None and name in pawn_bps,
             )
             self.pawns = self.save.get_game_objects(config)
+            self.__index_pawns()
+
+    def __index_pawns(self):
+        self.pawns_by_player_id = {}
+        self.player_ids_by_inventory = {}
+        for pawn in self.pawns.values():
+            player_id = pawn.get_property_value("LinkedPlayerDataID")
+            # First pawn wins, like the linear search did
+            if player_id is None or player_id in self.pawns_by_player_id:
+                continue
+            self.pawns_by_player_id[player_id] = pawn
+            inventory = pawn.get_property_value("MyInventoryComponent")
+            if inventory is not None:
+                self.player_ids_by_inventory[inventory.uuid] = player_id
+
+    def __index_players_and_tribes(self):
+        self.players_by_id = {}
+        self.players_by_unique_id = {}
+        self.players_by_name = {}
+        for player in self.players:
+            self.players_by_id.setdefault(player.id_, player)
+            self.players_by_unique_id.setdefault(player.unique_id, player)
+            self.players_by_name.setdefault(player.name, player)
+
+        self.tribes_by_id = {}
+        self.tribes_by_name = {}
+        for tribe in self.tribes:
+            self.tribes_by_id.setdefault(tribe.tribe_id, tribe)
+            self.tribes_by_name.setdefault(tribe.name, tribe)
 
-    def __store_as_file(self, data: bytes, file_name: str):
-        output_dir = TEMP_FILES_DIR
-        if not output_dir.exists():
-            output_dir.mkdir(parents=True, exist_ok=True)
-        path = output_dir / file_name
-        with open(path, "wb") as f:
-            f.write(data)
-        return path
-    
     def __get_files_from_db(self):
         if self.save is None:
             raise ValueError("Save not provided")
         
-        if self.save.get_custom_value("GameModeCustomBytes") is None:
+        blob = self.save.get_custom_blob("GameModeCustomBytes")
+        if blob is None:
             raise ValueError("No GameModeCustomBytes found in the save data")
         
-        self.data = _TribeAndPlayerData(self.save.get_custom_value("GameModeCustomBytes"))
-
-        for index in range(len(self.data.player_data_pointers)):
-            path = self.__store_as_file(self.data.get_ark_profile_raw_data(index), f"{index}.arkprofile")
-            self.profile_paths.add(path)
+        self.data = _TribeAndPlayerData(blob)
 
-        for index in range(len(self.data.tribe_data_pointers)):
-            path = self.__store_as_file(self.data.get_ark_tribe_raw_data(index), f"{index}.arktribe")
-            self.tribe_paths.add(path)
+        # Profile records get the player uuid appended, 5 + 16 bytes
+        self.profile_records = [_StoredArchive(partial(self.data.get_ark_profile_raw_data, index), pointer[2] + 21)
+                                for index, pointer in enumerate(self.data.player_data_pointers)]
+        self.tribe_records = [_StoredArchive(partial(self.data.get_ark_tribe_raw_data, index), pointer[2])
+                              for index, pointer in enumerate(self.data.tribe_data_pointers)]
 
     def get_files_from_directory(self, directory: Path):
         for path in directory.glob("*.arkprofile"):
@@ -207,17 +268,28 @@ class PlayerApi:
         for path in directory.glob("*.arktribe"):
             self.tribe_paths.add(path)
 
+    def __decode_archives(self, constructor, sources: list) -> list:
+        """Returns (source, decoded object, exception) per source, decoded in a process pool if workers > 1"""
+        if self.workers > 1 and len(sources) > 1:
+            # The save connection cannot be sent to other processes, read the stored archives here
+            contents = [s.read() if isinstance(s, _StoredArchive) else s for s in sources]
+            chunksize = max(1, len(contents) // (self.workers * 4))
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                results = list(executor.map(_decode_archive, repeat(constructor), contents, repeat(self.from_store), chunksize=chunksize))
+        else:
+            results = [_decode_archive(constructor, source, self.from_store) for source in sources]
+        return [(source, decoded, error) for source, (decoded, error) in zip(sources, results)]
+
     def __update_files(self):
         new_players: Dict[int, ArkPlayer] = {}
         new_tribes: Dict[int, ArkTribe] = {}
         new_tribe_to_player = {}
 
-        for path in self.profile_paths:
-            try:
-                player: ArkPlayer = ArkPlayer(path, self.from_store)
-            except Exception as e:
+        profiles = self.__decode_archives(ArkPlayer, list(self.profile_paths) + list(self.profile_records))
+        for path, player, e in profiles:
+            if e is not None:
                 if "Unsupported archive version" in str(e):
-                    ArkSaveLogger.warning_log(f"Skipping player data {path} due to unsupported archive version: {e}")
+                    ArkSaveLogger.warning_log(f"Skipping player data {_source_name(path)} due to unsupported archive version: {e}")
                     continue
                 if self.ignore_error:
                     continue
@@ -230,22 +302,16 @@ class PlayerApi:
             new_players[player.id_] = player
 
         for player in new_players.values():
-            player_pawn = None
-            for pawn in self.pawns.keys():
-                pawn_player_id = self.pawns[pawn].get_property_value("LinkedPlayerDataID")
-                if pawn_player_id == player.id_:
-                    player_pawn = self.pawns[pawn]
-                    break
+            player_pawn = self.pawns_by_player_id.get(player.id_)
             if self.save is not None and player_pawn is not None:
                 player.get_location_and_inventory(self.save, player_pawn)
         
         
-        for path in self.tribe_paths:
-            try:
-                tribe: ArkTribe = ArkTribe(path, self.from_store)
-            except Exception as e:
+        tribes = self.__decode_archives(ArkTribe, list(self.tribe_paths) + list(self.tribe_records))
+        for path, tribe, e in tribes:
+            if e is not None:
                 if "Unsupported archive version" in str(e):
-                    ArkSaveLogger.warning_log(f"Skipping player data {path} due to unsupported archive version: {e}")
+                    ArkSaveLogger.warning_log(f"Skipping player data {_source_name(path)} due to unsupported archive version: {e}")
                     continue
                 if self.ignore_error:
                     continue
@@ -253,15 +319,11 @@ class PlayerApi:
             
             players = []
             for id in tribe.member_ids:
-                found = None
-                for p in new_players.values():
-                    p: ArkPlayer
-                    if p.id_ == id and found is None:
-                        players.append(p)
-                        found = p
-        
+                found = new_players.get(id)
                 if found is None:
                     ArkSaveLogger.api_log(f"Player with ID {id} not found in player list")
+                else:
+                    players.append(found)
 
             # latest is newest??
             if tribe.tribe_id in new_tribes:
@@ -274,6 +336,7 @@ class PlayerApi:
         self.players = new_players.values()
         self.tribes = new_tribes.values()
         self.tribe_to_player_map = new_tribe_to_player
+        self.__index_players_and_tribes()
 
     def __calc_stat(self, stat: List[int], stat_type: int):
         if stat_type == self.StatType.LOWEST:
@@ -353,35 +416,24 @@ class PlayerApi:
         return player, value
     
     def get_container_of_inventory_by_uuid(self, inv_uuid: UUID, save: AsaSave = None):
-        for player in self.players:
-            inventory = self.get_player_inventory(player, save)
-            if inventory is not None and inventory.object.uuid == inv_uuid:
-                return player
-        return None
+        self.__check_pawns(save)
+        player_id = self.player_ids_by_inventory.get(inv_uuid)
+        return self.players_by_id.get(player_id) if player_id is not None else None
     
     def get_player_by_platform_name(self, name: str):
-        for p in self.players:
-            if p.name == name:
-                return p
-        return None
+        return self.players_by_name.get(name)
     
     def get_tribe_of(self, player: ArkPlayer):
-        for t in self.tribes:
-            if player.tribe == t.tribe_id:
-                return t
-        return None
+        return self.tribes_by_id.get(player.tribe)
     
     def get_as_owner(self, owner_type: int, player_id: int= None, ue5_id: str = None, tribe_id: int = None, tribe_name: str = None):
         player = None
         tribe = None
 
-        for p in self.players:
-            if player_id is not None and p.id_ == player_id:
-                player = p
-                break
-            elif ue5_id is not None and p.unique_id == ue5_id:
-                player = p
-                break
+        if player_id is not None:
+            player = self.players_by_id.get(player_id)
+        if player is None and ue5_id is not None:
+            player = self.players_by_unique_id.get(ue5_id)
         
         if player is None and tribe_id is None and tribe_name is None:
             raise ValueError("Player not found")
@@ -389,13 +441,10 @@ class PlayerApi:
         if player:
             tribe = self.get_tribe_of(player)
         else:
-            for t in self.tribes:
-                if tribe_id is not None and t.tribe_id == tribe_id:
-                    tribe = t
-                    break
-                elif tribe_name is not None and t.name == tribe_name:
-                    tribe = t
-                    break
+            if tribe_id is not None:
+                tribe = self.tribes_by_id.get(tribe_id)
+            if tribe is None and tribe_name is not None:
+                tribe = self.tribes_by_name.get(tribe_name)
         
         if tribe is None:
             raise ValueError("Tribe not found")
@@ -418,11 +467,7 @@ class PlayerApi:
     
     def get_player_pawn(self, player: ArkPlayer, save: AsaSave = None):
         self.__check_pawns(save)
-        for _, pawn in self.pawns.items():
-            player_id = pawn.get_property_value("LinkedPlayerDataID")
-            if player_id == player.id_:
-                return pawn
-        return None
+        return self.pawns_by_player_id.get(player.id_)
     
     def get_player_inventory(self, player: ArkPlayer, save: AsaSave = None):
         if player.inventory:
@@ -445,6 +490,25 @@ class PlayerApi:
 
         return player.location
 
+    def extract_tribe(self, path: Path, tribe_id: int, bounds: Tuple[Tuple[float, float], Tuple[float, float]] = None) -> ExtractionReport:
+        """
+        Writes a new save to path with only the objects of the tribe (targeting team), the pawns of its members and
+        everything they hold. With bounds, ((min x, min y), (max x, max y)) in world coordinates, only the objects of
+        the tribe in that area are extracted, e.g. one base. GameModeCustomBytes, with the profile and tribe data of
+        all players and tribes, is copied unchanged.
+        """
+        if bounds is not None:
+            objects = self.save.select_obj_uuids_in_bounds(bounds, team=tribe_id)
+        else:
+            objects = self.save.select_obj_uuids("ark_prop_int(value, 'TargetingTeam') = ?", (tribe_id,))
+            tribe = self.tribes_by_id.get(tribe_id)
+            for player_id in (tribe.member_ids if tribe is not None else []):
+                pawn = self.pawns_by_player_id.get(player_id)
+                if pawn is not None:
+                    objects.append(pawn.uuid)
+
+        return self.save.extract(path, objects, cascade=True)
+
     # def add_to_player_inventory(self, player: ArkPlayer, item: ArkGameObject, save: AsaSave = None):
     #     if player is None:
     #         raise ValueError("Player not found")
@@ -0,0 +1,99 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from arkparse.object_model.ark_game_object import ArkGameObject
+from arkparse.parsing import GameObjectReaderConfiguration
+from arkparse.saves.asa_save import AsaSave
+from arkparse.logging import ArkSaveLogger
+
+
+@dataclass
+class OwnerChain:
+    item: UUID
+    inventory: Optional[UUID] = None
+    container: Optional[UUID] = None
+    container_class: Optional[str] = None
+    tribe_id: Optional[int] = None      #TargetingTeam of the container
+    player_id: Optional[int] = None     #OwningPlayerID, or LinkedPlayerDataID for player pawns
+
+    def __str__(self) -> str:
+        return f"OwnerChain(item={self.item}, inventory={self.inventory}, container={self.container_class} ({self.container}), tribe={self.tribe_id}, player={self.player_id})"
+
+
+class ReferenceApi:
+    """
+    Reverse reference index: maps every referenced object UUID to the objects referencing it,
+    built from a single pass over the parsed game objects, and again after the save is modified.
+    """
+    INDEXED_PROPERTIES = ("OwnerInventory", "MyInventoryComponent", "LinkedStructures", "MyCharacterStatusComponent")
+
+    def __init__(self, save: AsaSave, properties: Tuple[str, ...] = INDEXED_PROPERTIES, config: GameObjectReaderConfiguration = None):
+        self.save = save
+        self.properties = properties
+        # Objects that are indexed, all by default
+        self.config = config
+        self.index: Optional[Dict[UUID, List[Tuple[UUID, str]]]] = None
+        self.index_snapshot: Optional[int] = None
+
+    def build_index(self, config: GameObjectReaderConfiguration = None) -> Dict[UUID, List[Tuple[UUID, str]]]:
+        if config is not None:
+            self.config = config
+        objects = self.save.get_game_objects(self.config if self.config is not None else GameObjectReaderConfiguration())
+
+        index: Dict[UUID, List[Tuple[UUID, str]]] = {}
+        for obj_uuid, obj in objects.items():
+            for name in self.properties:
+                value = obj.get_property_value(name)
+                if value is None:
+                    continue
+                for ref in (value if isinstance(value, list) else [value]):
+                    ref_uuid = getattr(ref, "uuid", None)
+                    if ref_uuid is not None:
+                        index.setdefault(ref_uuid, []).append((obj_uuid, name))
+
+        ArkSaveLogger.api_log(f"Indexed references to {len(index)} objects from {len(objects)} objects")
+        self.index = index
+        self.index_snapshot = self.save.get_snapshot_id()
+        return index
+
+    def __get_index(self) -> Dict[UUID, List[Tuple[UUID, str]]]:
+        # Rebuilt when the save was modified since, e.g. by a delete or an added object
+        if self.index is None or self.index_snapshot != self.save.get_snapshot_id():
+            self.build_index()
+        return self.index
+
+    def who_references(self, uuid: UUID, property_name: str = None) -> List[Tuple[UUID, str]]:
+        """Returns (referencing object UUID, property name) pairs, optionally limited to one property"""
+        references = self.__get_index().get(uuid, [])
+        if property_name is None:
+            return list(references)
+        return [r for r in references if r[1] == property_name]
+
+    def get_container_of_inventory(self, inv_uuid: UUID) -> Optional[ArkGameObject]:
+        containers = self.who_references(inv_uuid, "MyInventoryComponent")
+        if len(containers) == 0:
+            return None
+        return self.save.get_game_object_by_id(containers[0][0])
+
+    def resolve_owner_chain(self, item_uuid: UUID) -> OwnerChain:
+        """Follows item -> inventory -> container and reads the tribe and player owning the container"""
+        chain = OwnerChain(item=item_uuid)
+        item = self.save.get_game_object_by_id(item_uuid)
+        if item is None:
+            return chain
+
+        owner_inventory = item.get_property_value("OwnerInventory")
+        chain.inventory = owner_inventory.uuid if owner_inventory is not None else None
+        if chain.inventory is None:
+            return chain
+
+        container = self.get_container_of_inventory(chain.inventory)
+        if container is None:
+            return chain
+
+        chain.container = container.uuid
+        chain.container_class = container.blueprint
+        chain.tribe_id = container.get_property_value("TargetingTeam")
+        chain.player_id = container.get_property_value("OwningPlayerID", default=container.get_property_value("LinkedPlayerDataID"))
+        return chain
@@ -1,22 +1,32 @@
-from typing import Dict, Union, List
+from typing import Callable, Dict, Union, List
 from uuid import UUID
 
 from arkparse.saves.asa_save import AsaSave
+from arkparse.saves.compaction import DeletionReport
 from arkparse.parsing import GameObjectReaderConfiguration, ArkBinaryParser
 from arkparse.ftp.ark_ftp_client import ArkFtpClient
+from arkparse.api.reference_api import ReferenceApi
 from arkparse.utils import TEMP_FILES_DIR
+from arkparse.utils.heatmap import build_heatmap_layers
+from arkparse.classes import Classes
 
 from arkparse.object_model import ArkGameObject
 from arkparse.object_model.misc.object_owner import ObjectOwner
 from arkparse.object_model.structures import Structure, StructureWithInventory
 from arkparse.parsing.struct.actor_transform import MapCoords
 from arkparse.enums.ark_map import ArkMap
+from arkparse.logging import ArkSaveLogger
 
 class StructureApi:
     def __init__(self, save: AsaSave):
         self.save = save
         self.retrieved_all = False
         self.parsed_structures = {}
+        self.structures_without_transform = 0
+        self.heatmap_cache: Dict[tuple, Dict[str, "np.ndarray"]] = {}
+        # Index of MyInventoryComponent references, (re)built on first use after the save changed
+        self.inventory_references = ReferenceApi(self.save, ("MyInventoryComponent",), GameObjectReaderConfiguration(
+            blueprint_name_filter=lambda name: name is not None and "/Structures" in name and not "PrimalItemStructure_" in name))
 
     def get_all_objects(self, config: GameObjectReaderConfiguration = None) -> Dict[UUID, ArkGameObject]:
         if config is None:
@@ -30,7 +40,7 @@ class StructureApi:
 
         return objects
     
-    def _parse_single_structure(self, obj: ArkGameObject, parser: ArkBinaryParser = None) -> Union[Structure, StructureWithInventory]:
+    def _parse_single_structure(self, obj: ArkGameObject, parser: ArkBinaryParser = None, attach_transform: bool = True) -> Union[Structure, StructureWithInventory]:
         if obj.uuid in self.parsed_structures.keys():
             return self.parsed_structures[obj.uuid]
         
@@ -42,8 +52,9 @@ class StructureApi:
         else:
             structure = Structure(obj.uuid, parser)
         
-        for key, loc in self.save.save_context.actor_transforms.items():
-            if key == obj.uuid:
+        if attach_transform:
+            loc = self.save.save_context.actor_transforms.get(obj.uuid)
+            if loc is not None:
                 structure.set_actor_transform(loc)
 
         self.parsed_structures[obj.uuid] = structure
@@ -59,21 +70,43 @@ class StructureApi:
 
         structures = {}
 
-        for key, obj in objects.items():
-            obj : ArkGameObject = obj
-            if obj is None:
-                print(f"Object is None for {key}")
-                continue
-            
-            structure = self._parse_single_structure(obj)
+        items = list(objects.items())
+        for i in range(0, len(items), self.save.PREFETCH_BATCH_SIZE):
+            batch = items[i:i + self.save.PREFETCH_BATCH_SIZE]
+            # The binaries of a batch are released once its structures are built
+            with self.save.prefetched_references(obj for _, obj in batch if obj is not None and obj.uuid not in self.parsed_structures):
+                for key, obj in batch:
+                    obj : ArkGameObject = obj
+                    if obj is None:
+                        print(f"Object is None for {key}")
+                        continue
+                    
+                    structure = self._parse_single_structure(obj, attach_transform=False)
+
+                    structures[obj.uuid] = structure
 
-            structures[obj.uuid] = structure
+        self._attach_actor_transforms(structures)
 
         if config is None:
             self.retrieved_all = True
 
         return structures
     
+    def _attach_actor_transforms(self, structures: Dict[UUID, Union[Structure, StructureWithInventory]]) -> int:
+        actor_transforms = self.save.save_context.actor_transforms
+        missing = 0
+        for uuid, structure in structures.items():
+            loc = actor_transforms.get(uuid)
+            if loc is None:
+                missing += 1
+            else:
+                structure.set_actor_transform(loc)
+
+        self.structures_without_transform = missing
+        if missing > 0:
+            ArkSaveLogger.api_log(f"{missing} of {len(structures)} structures have no actor transform")
+        return missing
+
     def get_by_id(self, id: UUID) -> Union[Structure, StructureWithInventory]:
         obj = self.save.get_game_object_by_id(id)
         return self._parse_single_structure(obj)
@@ -99,12 +132,15 @@ class StructureApi:
 
         return result
     
-    def remove_at_location(self, map: ArkMap, coords: MapCoords, radius: float = 0.3, owner_tribe_id: int = None):
+    def remove_at_location(self, map: ArkMap, coords: MapCoords, radius: float = 0.3, owner_tribe_id: int = None) -> DeletionReport:
         structures = self.get_at_location(map, coords, radius)
+        to_remove = [key for key, obj in structures.items() if owner_tribe_id is None or obj.owner.tribe_id == owner_tribe_id]
 
-        for _, obj in structures.items():
-            if owner_tribe_id is None or obj.owner.tribe_id == owner_tribe_id:
-                obj.remove_from_save(self.save)
+        # One transaction for all structures, with their inventories and the items in them
+        report = self.save.delete(to_remove, cascade=True)
+        for key in report.deleted_objects:
+            self.parsed_structures.pop(key, None)
+        return report
     
     def get_owned_by(self, owner: ObjectOwner = None, owner_tribe_id: int = None) -> Dict[UUID, Union[Structure, StructureWithInventory]]:
         result = {}
@@ -163,18 +199,15 @@ class StructureApi:
     
     def get_connected_structures(self, structures: Dict[UUID, Union[Structure, StructureWithInventory]]) -> Dict[UUID, Union[Structure, StructureWithInventory]]:
         result = structures.copy()
-        new_found = True
-
-        while new_found:
-            new_found = False
-            new_result = result.copy()
-            for key, s in result.items():
-                for uuid in s.linked_structure_uuids:
-                    if uuid not in new_result.keys():
-                        new_found = True
-                        obj = self.get_by_id(uuid)
-                        new_result[uuid] = obj
-            result = new_result
+        queue = list(result.values())
+
+        while queue:
+            s = queue.pop()
+            for uuid in s.linked_structure_uuids:
+                if uuid not in result:
+                    obj = self.get_by_id(uuid)
+                    result[uuid] = obj
+                    queue.append(obj)
 
         return result
      
@@ -199,36 +232,47 @@ class StructureApi:
             ftp_client.close()
 
     def create_heatmap(self, map: ArkMap, resolution: int = 100, structures: Dict[UUID, Union[Structure, StructureWithInventory]] = None, classes: List[str] = None, owner: ObjectOwner = None, min_in_section: int = 1):
-        import math
-        import numpy as np
-
         structs = structures
 
         if classes is not None:
             structs = self.get_by_class(classes)
         elif structures is None:
             structs = self.get_all()
-        heatmap = [[0 for _ in range(resolution)] for _ in range(resolution)]
-
-        for key, obj in structs.items():
-            obj: Structure = obj
-            if obj.location is None:
-                continue
-
-            if owner is not None and not obj.is_owned_by(owner):
-                continue
-
-            coords: MapCoords = obj.location.as_map_coords(map)
-            y = math.floor(coords.long)
-            x = math.floor(coords.lat)
-            heatmap[x][y] += 1
 
-        for i in range(resolution):
-            for j in range(resolution):
-                if heatmap[i][j] < min_in_section:
-                    heatmap[i][j] = 0
+        layers = None
+        if owner is not None:
+            layers = {"all": lambda obj: obj.is_owned_by(owner)}
+
+        return build_heatmap_layers(structs.values(), map, resolution, layers=layers, min_in_section=min_in_section)["all"]
+
+    def create_heatmap_layers(self, map: ArkMap, resolution: int = 100, structures: Dict[UUID, Union[Structure, StructureWithInventory]] = None,
+                              layers: Dict[str, Callable[[Structure], bool]] = None, group_by: Callable[[Structure], str] = None,
+                              min_in_section: int = 1) -> Dict[str, "np.ndarray"]:
+        """
+        Creates several heatmaps in one pass. By default an "all" and a "turrets" layer plus a
+        "tribe_<id>" layer per owning tribe. The default layers over all structures are cached
+        until the save is modified.
+        """
+        cache_key = None
+        if structures is None and layers is None and group_by is None:
+            cache_key = (self.save.get_snapshot_id(), map, resolution, min_in_section)
+            if cache_key in self.heatmap_cache:
+                return self.heatmap_cache[cache_key]
 
-        return np.array(heatmap)
+        if structures is None:
+            structures = self.get_all()
+        if layers is None and group_by is None:
+            turrets = set(Classes.structures.placed.turrets.all_bps)
+            layers = {
+                "all": lambda obj: True,
+                "turrets": lambda obj: obj.object.blueprint in turrets,
+            }
+            group_by = lambda obj: f"tribe_{obj.owner.tribe_id if obj.owner is not None else None}"
+
+        heatmaps = build_heatmap_layers(structures.values(), map, resolution, layers=layers, group_by=group_by, min_in_section=min_in_section)
+        if cache_key is not None:
+            self.heatmap_cache[cache_key] = heatmaps
+        return heatmaps
     
     def get_all_with_inventory(self) -> Dict[UUID, StructureWithInventory]:
         structures = self.get_all()
@@ -241,15 +285,15 @@ class StructureApi:
         return result
     
     def get_container_of_inventory(self, inv_uuid: UUID, structures: dict[UUID, StructureWithInventory] = None) -> StructureWithInventory:
-        if structures is None:
-            structures = self.get_all_with_inventory()
-        for _, obj in structures.items():
-            if not isinstance(obj, StructureWithInventory):
-                continue
-            obj: StructureWithInventory = obj
-            if obj.inventory_uuid == inv_uuid:
-                return obj
-        
+        for structure_uuid, _ in self.inventory_references.who_references(inv_uuid):
+            if structures is not None:
+                structure = structures.get(structure_uuid)
+            else:
+                obj = self.save.get_game_object_by_id(structure_uuid)
+                structure = self._parse_single_structure(obj) if obj is not None else None
+            if isinstance(structure, StructureWithInventory) and structure.inventory_uuid == inv_uuid:
+                return structure
+
         return None
 
     # def get_building_arround(self, key_piece: UUID) -> Dict[UUID, ArkGameObject]:
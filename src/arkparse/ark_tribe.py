@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Union
 from pathlib import Path
 from dataclasses import dataclass
 from arkparse.parsing import ArkPropertyContainer
@@ -18,7 +18,7 @@ class ArkTribe:
     log_index: int
     nr_of_dinos: int
 
-    def __init__(self, file: Path, from_store: bool):
+    def __init__(self, file: Union[Path, bytes, memoryview], from_store: bool):
         self._archive = ArkArchive(file, from_store)
 
         self.properties = self._archive.get_object_by_class("/Script/ShooterGame.PrimalTribeData")
@@ -54,7 +54,7 @@ class ArkGameObject(ArkPropertyContainer):
                     self.blueprint = binary_reader.read_string()
 
                 ArkSaveLogger.parser_log(f"Blueprint: {blueprint}")
-                binary_reader.validate_uint32(0)
+                binary_reader.expect_uint32(0)
 
             try:
                 if not no_header:
@@ -81,7 +81,7 @@ class ArkGameObject(ArkPropertyContainer):
                     ArkSaveLogger.parser_log(f"Section: {self.section}, Unknown: {self.unknown}")
                     
                     if from_custom_bytes:
-                        binary_reader.validate_uint16(0)
+                        binary_reader.expect_uint16(0)
                         # binary_reader.validate_byte(0)
                         has_rotator = binary_reader.read_uint32() == 1
                         if has_rotator:
@@ -89,7 +89,7 @@ class ArkGameObject(ArkPropertyContainer):
 
                         self.properties_offset = binary_reader.read_uint32()
                         ArkSaveLogger.parser_log(f"Properties offset: {self.properties_offset}")
-                        binary_reader.validate_uint32(0)
+                        binary_reader.expect_uint32(0)
 
                 if not from_custom_bytes: 
                     self.read_properties(binary_reader, ArkProperty, binary_reader.size())
@@ -171,7 +171,7 @@ class ArkGameObject(ArkPropertyContainer):
         # if reader.position != self.properties_offset:
         #     ArkSaveLogger.open_hex_view()
         #     raise Exception("Invalid offset for properties: ", reader.position, "expected: ", self.properties_offset)
-        reader.validate_byte(0)
+        reader.expect_byte(0)
         self.read_properties(reader, ArkProperty, reader.size())
         # reader.read_int()
         # self.uuid2 = reader.read_uuid()
@@ -181,22 +181,22 @@ class ArkGameObject(ArkPropertyContainer):
         super().print_properties()
 
     def read_double(self, reader: ArkBinaryParser, property_name: str) -> float:
-        reader.validate_name(property_name)
-        reader.validate_name("DoubleProperty")
-        reader.validate_byte(0x08)
-        reader.validate_uint64(0)
+        reader.expect_name(property_name)
+        reader.expect_name("DoubleProperty")
+        reader.expect_byte(0x08)
+        reader.expect_uint64(0)
         value = reader.read_double()
         return value
     
     def read_boolean(self, reader: ArkBinaryParser, property_name: str) -> bool:
-        reader.validate_name(property_name)
-        reader.validate_name("BoolProperty")
-        reader.validate_uint64(0)
+        reader.expect_name(property_name)
+        reader.expect_name("BoolProperty")
+        reader.expect_uint64(0)
         value = reader.read_boolean()
         return value
     
     def decode_name(self, buffer: ArkBinaryParser):
-        buffer.validate_uint32(1)
+        buffer.expect_uint32(1)
         name = buffer.read_string()
-        buffer.validate_uint32(0)
+        buffer.expect_uint32(0)
         return name
\ No newline at end of file
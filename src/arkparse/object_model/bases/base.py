@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, Tuple
 from uuid import UUID, uuid4
 from pathlib import Path
 import json
@@ -10,12 +10,14 @@ import arkparse.parsing.struct as structs
 from arkparse.object_model.stackables import Ammo, Resource
 from arkparse.object_model.structures import Structure, StructureWithInventory
 from arkparse.parsing.struct.actor_transform import ActorTransform
+from arkparse.parsing.struct.ark_vector import ArkVector
 from arkparse.object_model.misc.object_owner import ObjectOwner
 from arkparse.parsing import ArkBinaryParser
 
 class Base:
     structures: Dict[UUID, Structure]
     location: ActorTransform
+    bounds: Tuple[ArkVector, ArkVector]     # (min, max) corner of the structure locations
     keystone: Structure
     owner: ObjectOwner
     nr_of_turrets: int
@@ -25,19 +27,28 @@ class Base:
         average_y = 0
         average_z = 0
 
-        for _, structure in self.structures.items():
-            average_x += structure.location.x
-            average_y += structure.location.y
-            average_z += structure.location.z
+        located = [structure.location for structure in self.structures.values() if structure.location is not None]
+        if len(located) == 0:
+            self.location = None
+            self.bounds = None
+            return
+
+        for location in located:
+            average_x += location.x
+            average_y += location.y
+            average_z += location.z
 
-        average_x /= len(self.structures)
-        average_y /= len(self.structures)
-        average_z /= len(self.structures)
+        average_x /= len(located)
+        average_y /= len(located)
+        average_z /= len(located)
 
         self.location = structs.ActorTransform(vector=structs.ArkVector(x=average_x, y=average_y, z=average_z))
+        self.bounds = (structs.ArkVector(x=min(l.x for l in located), y=min(l.y for l in located), z=min(l.z for l in located)),
+                       structs.ArkVector(x=max(l.x for l in located), y=max(l.y for l in located), z=max(l.z for l in located)))
 
     def __init__(self, keystone: UUID = None, structures: Dict[UUID, Structure] = None):
         self.structures = structures
+        self.bounds = None
         if self.structures is not None:
             self.__determine_location()
         self.set_keystone(keystone)
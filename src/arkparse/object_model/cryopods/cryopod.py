@@ -80,8 +80,8 @@ class Cryopod(InventoryItem):
     saddle: Saddle
     costume: any
 
-    def __init__(self, uuid: UUID = None, binary: ArkBinaryParser = None):
-        super().__init__(uuid, binary=binary)
+    def __init__(self, uuid: UUID = None, binary: ArkBinaryParser = None, game_object: ArkGameObject = None):
+        super().__init__(uuid, binary=binary, game_object=game_object)
         self.dino = None
         self.saddle = None
         self.costume = None
@@ -39,17 +39,17 @@ class Dino(ParsedObjectBase):
         self.gene_traits = self.object.get_array_property_value("GeneTraits")
         self.location = ActorTransform(vector=self.object.get_property_value("SavedBaseWorldLocation"))
     
-    def __init__(self, uuid: UUID = None, binary: ArkBinaryParser = None, save: AsaSave = None):
-        super().__init__(uuid, binary=binary, save=save)
+    def __init__(self, uuid: UUID = None, binary: ArkBinaryParser = None, save: AsaSave = None, game_object: ArkGameObject = None):
+        super().__init__(uuid, binary=binary, save=save, game_object=game_object)
 
         if self.binary is not None:
             self.__init_props__()
 
         if save is not None and self.object.get_property_value("MyCharacterStatusComponent") is not None:
-            stat_uuid = self.object.get_property_value("MyCharacterStatusComponent").value
-            bin = save.get_game_obj_binary(UUID(stat_uuid))
+            stat_uuid = self.object.get_property_value("MyCharacterStatusComponent").uuid
+            bin = save.get_game_obj_binary(stat_uuid)
             parser = ArkBinaryParser(bin, save.save_context)
-            self.stats = DinoStats(UUID(stat_uuid), parser, save=save)
+            self.stats = DinoStats(stat_uuid, parser, save=save)
 
     def __str__(self) -> str:
         return "Dino(type={}, lv={})".format(self.get_short_name(), self.stats.current_level)
@@ -148,7 +148,7 @@ class Dino(ParsedObjectBase):
         inv_uuid = None
         inv_comp: ObjectReference = self.object.get_property_value("MyInventoryComponent")
         if inv_comp is not None:
-            inv_uuid = UUID(inv_comp.value)
+            inv_uuid = inv_comp.uuid
         return { "UUID": self.object.uuid.__str__(),
                  "InventoryUUID": inv_uuid.__str__() if inv_uuid is not None else None,
                  "DinoID1": self.id1,
@@ -0,0 +1,144 @@
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from arkparse.enums import ArkStat
+
+from .dino import Dino
+from .tamed_dino import TamedDino
+from .stats import STAT_POSITION_MAP
+
+NR_OF_STATS = len(STAT_POSITION_MAP)
+
+
+class DinoStatTable:
+    """
+    Columnar view on the stats of a set of dinos, one row per dino.
+
+    base_points, added_points and mutated_points are (n x 12) int arrays, stat_values
+    a (n x 12) float array, columns follow ArkStat. level, class_ids, tamed and cryopodded
+    are per dino arrays, uuids[i] and classes[class_ids[i]] map a row back to its dino.
+    """
+    def __init__(self, dinos: Dict[UUID, Dino]):
+        import numpy as np
+
+        n = len(dinos)
+        self.uuids: List[UUID] = list(dinos.keys())
+        self.row_of: Dict[UUID, int] = {uuid: i for i, uuid in enumerate(self.uuids)}
+        self.classes: List[str] = []
+
+        self.base_points = np.zeros((n, NR_OF_STATS), dtype=np.int32)
+        self.added_points = np.zeros((n, NR_OF_STATS), dtype=np.int32)
+        self.mutated_points = np.zeros((n, NR_OF_STATS), dtype=np.int32)
+        self.stat_values = np.zeros((n, NR_OF_STATS), dtype=np.float64)
+        self.level = np.zeros(n, dtype=np.int32)
+        self.class_ids = np.zeros(n, dtype=np.int32)
+        self.tamed = np.zeros(n, dtype=bool)
+        self.cryopodded = np.zeros(n, dtype=bool)
+
+        class_index: Dict[str, int] = {}
+        for i, dino in enumerate(dinos.values()):
+            stats = dino.stats
+            for idx, name in STAT_POSITION_MAP.items():
+                self.base_points[i, idx] = getattr(stats.base_stat_points, name)
+                self.added_points[i, idx] = getattr(stats.added_stat_points, name)
+                self.mutated_points[i, idx] = getattr(stats.mutated_stat_points, name)
+                self.stat_values[i, idx] = getattr(stats.stat_values, name)
+            self.level[i] = stats.current_level
+
+            blueprint = dino.object.blueprint
+            if blueprint not in class_index:
+                class_index[blueprint] = len(self.classes)
+                self.classes.append(blueprint)
+            self.class_ids[i] = class_index[blueprint]
+
+            self.tamed[i] = isinstance(dino, TamedDino)
+            self.cryopodded[i] = dino.is_cryopodded or getattr(dino, "cryopod", None) is not None
+
+    def __len__(self) -> int:
+        return len(self.uuids)
+
+    def points(self, base: bool = False, mutated: bool = False):
+        """Point matrix with the same meaning as DinoStats.get: base only, base + mutated or base + mutated + added"""
+        if base and mutated:
+            raise ValueError("Cannot get base and mutated stats at the same time")
+        if base:
+            return self.base_points
+        if mutated:
+            return self.base_points + self.mutated_points
+        return self.base_points + self.mutated_points + self.added_points
+
+    def mask(self, tamed: bool = None, cryopodded: bool = None, classes: List[str] = None, min_level: int = None, max_level: int = None):
+        import numpy as np
+
+        selected = np.ones(len(self), dtype=bool)
+        if tamed is not None:
+            selected &= self.tamed == tamed
+        if cryopodded is not None:
+            selected &= self.cryopodded == cryopodded
+        if classes is not None:
+            ids = [i for i, c in enumerate(self.classes) if c in classes]
+            selected &= np.isin(self.class_ids, ids)
+        if min_level is not None:
+            selected &= self.level >= min_level
+        if max_level is not None:
+            selected &= self.level <= max_level
+        return selected
+
+    def top_k(self, stat: ArkStat, k: int = 10, base: bool = False, mutated: bool = False, mask=None) -> List[Tuple[UUID, int]]:
+        import numpy as np
+
+        column = self.points(base, mutated)[:, stat.value]
+        rows = np.arange(len(self)) if mask is None else np.flatnonzero(mask)
+        if len(rows) == 0:
+            return []
+
+        values = column[rows]
+        k = min(k, len(rows))
+        best = np.argpartition(-values, k - 1)[:k]
+        best = best[np.argsort(-values[best], kind="stable")]
+        return [(self.uuids[rows[i]], int(values[i])) for i in best]
+
+    def with_stat_of_at_least(self, value: float, stats: List[ArkStat] = None, base: bool = False, mutated: bool = False, mask=None) -> List[UUID]:
+        points = self.points(base, mutated)
+        if stats is not None:
+            points = points[:, [s.value for s in stats]]
+        selected = (points >= value).any(axis=1)
+        if mask is not None:
+            selected &= mask
+        return [self.uuids[i] for i in selected.nonzero()[0]]
+
+    def highest_stat(self, base: bool = False, mutated: bool = False, mask=None) -> Optional[Tuple[UUID, ArkStat, int]]:
+        import numpy as np
+
+        points = self.points(base, mutated)
+        if mask is not None:
+            points = np.where(mask[:, None], points, -1)
+        if points.size == 0:
+            return None
+        row, column = np.unravel_index(np.argmax(points), points.shape)
+        if points[row, column] < 0:
+            return None
+        return self.uuids[row], ArkStat(int(column)), int(points[row, column])
+
+    def best_per_class(self, stat: ArkStat, base: bool = False, mutated: bool = False, mask=None) -> Dict[str, Tuple[UUID, int]]:
+        """Returns the dino with the highest value for the stat per blueprint"""
+        import numpy as np
+
+        column = self.points(base, mutated)[:, stat.value]
+        rows = np.arange(len(self)) if mask is None else np.flatnonzero(mask)
+        if len(rows) == 0:
+            return {}
+
+        # Sort by class, then descending value; the first row of each class is its best
+        order = rows[np.lexsort((-column[rows], self.class_ids[rows]))]
+        class_ids = self.class_ids[order]
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = class_ids[1:] != class_ids[:-1]
+        return {self.classes[class_ids[i]]: (self.uuids[order[i]], int(column[order[i]])) for i in np.flatnonzero(first)}
+
+    def count_per_class(self, mask=None) -> Dict[str, int]:
+        import numpy as np
+
+        class_ids = self.class_ids if mask is None else self.class_ids[mask]
+        counts = np.bincount(class_ids, minlength=len(self.classes))
+        return {self.classes[i]: int(c) for i, c in enumerate(counts) if c > 0}
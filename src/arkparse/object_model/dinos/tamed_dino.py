@@ -34,10 +34,10 @@ class TamedDino(Dino):
             self.inv_uuid = None
             self.inventory = None
         else:
-            self.inv_uuid = UUID(inv_uuid.value)
+            self.inv_uuid = inv_uuid.uuid
 
-    def __init__(self, uuid: UUID = None, binary: ArkBinaryParser = None, save: AsaSave = None):
-        super().__init__(uuid, binary=binary, save=save)
+    def __init__(self, uuid: UUID = None, binary: ArkBinaryParser = None, save: AsaSave = None, game_object: ArkGameObject = None):
+        super().__init__(uuid, binary=binary, save=save, game_object=game_object)
         self.inv_uuid = None
         self.inventory = None
         if self.binary is not None:
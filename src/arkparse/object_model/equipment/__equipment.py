@@ -33,8 +33,8 @@ class Equipment(InventoryItem):
         self.quality = self.object.get_property_value("ItemQualityIndex", default=ArkItemQuality.PRIMITIVE.value)
         self.current_durability = self.object.get_property_value("SavedDurability", default=1.0)
 
-    def __init__(self, uuid: UUID = None, binary: ArkBinaryParser = None):
-        super().__init__(uuid, binary)
+    def __init__(self, uuid: UUID = None, binary: ArkBinaryParser = None, game_object: ArkGameObject = None):
+        super().__init__(uuid, binary, game_object=game_object)
         self.__init_props__()
             
     def get_internal_value(self, stat: ArkEquipmentStat) -> int:
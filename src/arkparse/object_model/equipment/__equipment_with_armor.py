@@ -67,8 +67,8 @@ class EquipmentWithArmor(EquipmentWithDurability):
         armor = self.object.get_property_value("ItemStatValues", position=ArkEquipmentStat.ARMOR.value, default=0)
         self.armor = self.get_actual_value(ArkEquipmentStat.ARMOR, armor)
 
-    def __init__(self, uuid: UUID = None, binary: ArkBinaryParser = None):
-        super().__init__(uuid, binary)
+    def __init__(self, uuid: UUID = None, binary: ArkBinaryParser = None, game_object: ArkGameObject = None):
+        super().__init__(uuid, binary, game_object=game_object)
         self.__init_props__()  
 
     def get_implemented_stats(self) -> list:
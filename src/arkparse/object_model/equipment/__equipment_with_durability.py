@@ -110,8 +110,8 @@ class EquipmentWithDurability(Equipment):
         dura = self.object.get_property_value("ItemStatValues", position=ArkEquipmentStat.DURABILITY.value, default=0)
         self.durability = self.get_actual_value(ArkEquipmentStat.DURABILITY, dura)
 
-    def __init__(self, uuid: UUID = None, binary: ArkBinaryParser = None):
-        super().__init__(uuid, binary)
+    def __init__(self, uuid: UUID = None, binary: ArkBinaryParser = None, game_object: ArkGameObject = None):
+        super().__init__(uuid, binary, game_object=game_object)
         self.__init_props__()
 
     def get_average_stat(self, __stats = []) -> float:
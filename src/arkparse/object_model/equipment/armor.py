@@ -29,8 +29,8 @@ class Armor(EquipmentWithArmor):
         self.hypothermal_insulation = self.get_actual_value(ArkEquipmentStat.HYPOTHERMAL_RESISTANCE, hypo)
         self.hyperthermal_insulation = self.get_actual_value(ArkEquipmentStat.HYPERTHERMAL_RESISTANCE, hyper)
 
-    def __init__(self, uuid: UUID = None, binary: ArkBinaryParser = None):
-        super().__init__(uuid, binary)
+    def __init__(self, uuid: UUID = None, binary: ArkBinaryParser = None, game_object: ArkGameObject = None):
+        super().__init__(uuid, binary, game_object=game_object)
                          
         self.class_name = "armor"
         self.__init_props__()
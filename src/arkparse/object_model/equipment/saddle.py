@@ -15,8 +15,8 @@ class Saddle(EquipmentWithArmor):
     def __init_props__(self, obj: ArkGameObject = None):
         super().__init_props__(obj)
 
-    def __init__(self, uuid: UUID = None, binary: ArkBinaryParser = None):
-        super().__init__(uuid, binary)
+    def __init__(self, uuid: UUID = None, binary: ArkBinaryParser = None, game_object: ArkGameObject = None):
+        super().__init__(uuid, binary, game_object=game_object)
         self.class_name = "saddle"             
     
     @staticmethod
@@ -13,8 +13,8 @@ class Shield(EquipmentWithDurability):
     def __init_props__(self, obj: ArkGameObject = None):
         super().__init_props__(obj)
 
-    def __init__(self, uuid: UUID = None, binary: ArkBinaryParser = None):
-        super().__init__(uuid, binary)
+    def __init__(self, uuid: UUID = None, binary: ArkBinaryParser = None, game_object: ArkGameObject = None):
+        super().__init__(uuid, binary, game_object=game_object)
         self.class_name = "shield"
 
     def auto_rate(self, save: AsaSave = None):
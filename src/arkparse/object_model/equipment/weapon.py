@@ -23,8 +23,8 @@ class Weapon(EquipmentWithDurability):
         damage = self.object.get_property_value("ItemStatValues", position=ArkEquipmentStat.DAMAGE.value, default=0)
         self.damage = self.get_actual_value(ArkEquipmentStat.DAMAGE, damage)
 
-    def __init__(self, uuid: UUID = None, binary: ArkBinaryParser = None):
-        super().__init__(uuid, binary)
+    def __init__(self, uuid: UUID = None, binary: ArkBinaryParser = None, game_object: ArkGameObject = None):
+        super().__init__(uuid, binary, game_object=game_object)
 
         self.class_name = "weapon"             
         self.__init_props__()
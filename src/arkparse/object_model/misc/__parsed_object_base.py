@@ -20,10 +20,14 @@ class ParsedObjectBase:
     def __init_props__(self, obj: ArkGameObject = None):
         self.object = obj
 
-    def __init__(self, uuid: UUID = None, binary: ArkBinaryParser = None, save: "AsaSave" = None):
+    def __init__(self, uuid: UUID = None, binary: ArkBinaryParser = None, save: "AsaSave" = None, game_object: ArkGameObject = None):
         if uuid is None or (binary is None and save is None):
             return
-        if save is not None:
+        if game_object is not None:
+            # Already parsed by the caller, do not parse the binary a second time
+            self.binary = binary if binary is not None else save.get_parser_for_game_object(uuid)
+            self.__init_props__(game_object)
+        elif save is not None:
             self.binary = save.get_parser_for_game_object(uuid)
             self.__init_props__(save.get_game_object_by_id(uuid))
         else:
@@ -58,7 +62,7 @@ class ParsedObjectBase:
         
         uuid_as_bytes = new_uuid.bytes           
         old_uuid_bytes = self.object.uuid.bytes if uuid_to_replace is None else uuid_to_replace.bytes
-        self.binary.byte_buffer = self.binary.byte_buffer.replace(old_uuid_bytes, uuid_as_bytes)
+        self.binary.byte_buffer = self.binary.get_bytes().replace(old_uuid_bytes, uuid_as_bytes)
 
         if uuid_to_replace is None:
             self.object.uuid = new_uuid
@@ -20,7 +20,7 @@ class Inventory(ParsedObjectBase):
 
         item_arr = self.object.get_array_property_value("InventoryItems")
         for item in item_arr:
-            item_uuid = UUID(item.value)
+            item_uuid = item.uuid
             item = InventoryItem(item_uuid, save=save)
             is_engram = item.object.get_property_value("bIsEngram")
             if is_engram is None or not is_engram:
@@ -22,10 +22,10 @@ class InventoryItem(ParsedObjectBase):
         self.id_ = self.object.get_property_value("ItemID")
         self.quantity = self.object.get_property_value("ItemQuantity", default=1)
         owner_in: ObjectReference = self.object.get_property_value("OwnerInventory", default=ObjectReference())
-        self.owner_inv_uuid = UUID(owner_in.value)
+        self.owner_inv_uuid = owner_in.uuid
 
-    def __init__(self, uuid: UUID = None, binary: ArkBinaryParser = None, save: AsaSave = None):
-        super().__init__(uuid, binary=binary, save=save)
+    def __init__(self, uuid: UUID = None, binary: ArkBinaryParser = None, save: AsaSave = None, game_object: ArkGameObject = None):
+        super().__init__(uuid, binary=binary, save=save, game_object=game_object)
 
         if self.binary is not None:
             self.__init_props__()
@@ -44,7 +44,7 @@ class InventoryItem(ParsedObjectBase):
     def add_self_to_inventory(self, inv_uuid: UUID):
         old_id = self.owner_inv_uuid
         self.owner_inv_uuid = inv_uuid
-        self.binary.byte_buffer = self.binary.byte_buffer.replace(old_id.bytes, inv_uuid.bytes)
+        self.binary.byte_buffer = self.binary.get_bytes().replace(old_id.bytes, inv_uuid.bytes)
 
     def to_string(self, name = "InventoryItem"):
         return f"{name}({self.get_short_name()}, quantity={self.quantity})"
@@ -6,6 +6,7 @@ from pathlib import Path
 import random
 
 from arkparse.object_model.misc.__parsed_object_base import ParsedObjectBase
+from arkparse.object_model.ark_game_object import ArkGameObject
 from arkparse.object_model.misc.object_owner import ObjectOwner
 from arkparse.parsing.struct.object_reference import ObjectReference
 from arkparse.parsing.struct import ActorTransform
@@ -50,8 +51,8 @@ class Structure(ParsedObjectBase):
     #MyInventoryComponent
     #NetDestructionTime
 
-    def __init__(self, uuid: UUID, binary: ArkBinaryParser):
-        super().__init__(uuid, binary)
+    def __init__(self, uuid: UUID, binary: ArkBinaryParser, game_object: ArkGameObject = None):
+        super().__init__(uuid, binary, game_object=game_object)
 
         properties = self.object
         self.owner = ObjectOwner(properties)
@@ -63,7 +64,7 @@ class Structure(ParsedObjectBase):
         self.location = None
 
         linked: List[ObjectReference] = properties.get_array_property_value("LinkedStructures", [])
-        self.linked_structure_uuids = [UUID(link.value) for link in linked]
+        self.linked_structure_uuids = [link.uuid for link in linked]
         self.linked_structures = []
 
         self.original_creation_time = properties.get_property_value("OriginalCreationTime")
@@ -152,7 +153,7 @@ class Structure(ParsedObjectBase):
         inv_uuid = None
         inv_comp: ObjectReference = self.object.get_property_value("MyInventoryComponent")
         if inv_comp is not None:
-            inv_uuid = UUID(inv_comp.value)
+            inv_uuid = inv_comp.uuid
         return { "UUID": self.object.uuid.__str__(),
                  "InventoryUUID": inv_uuid.__str__() if inv_uuid is not None else None,
                  "LinkedStructureUUIDS": self.get_linked_structures_str(),
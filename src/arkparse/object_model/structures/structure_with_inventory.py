@@ -15,13 +15,13 @@ class StructureWithInventory(Structure):
     inventory: Inventory
     db = AsaSave
 
-    def __init__(self, uuid: UUID, binary: ArkBinaryParser, database: AsaSave):
+    def __init__(self, uuid: UUID, binary: ArkBinaryParser, database: AsaSave, game_object: ArkGameObject = None):
         binary.save_context = database.save_context
-        super().__init__(uuid, binary)
+        super().__init__(uuid, binary, game_object=game_object)
         self.db = database
 
         inv_uuid = self.object.get_property_value("MyInventoryComponent")
-        self.inventory_uuid = UUID(inv_uuid.value) if inv_uuid is not None else None
+        self.inventory_uuid = inv_uuid.uuid if inv_uuid is not None else None
         self.item_count = self.object.get_property_value("CurrentItemCount", default=0)
         self.max_item_count = self.object.get_property_value("MaxItemCount")
 
@@ -1,12 +1,15 @@
 import struct
-from typing import List
+from typing import List, Union
 from uuid import UUID
 
 from ._binary_reader_base import BinaryReaderBase
 from arkparse.logging import ArkSaveLogger
 
+# Names that legitimately have a non zero value after their index
+_ALWAYS_ZERO_EXCEPTIONS = frozenset(["DontDoMaterialSpawning", "CorruptSpawnInValue", "LadderSocket"])
+
 class BaseValueParser(BinaryReaderBase):
-    def __init__(self, data: bytes, save_context=None):
+    def __init__(self, data: Union[bytes, memoryview], save_context=None):
         super().__init__(data, save_context)
 
     def read_int(self) -> int:
@@ -50,6 +53,15 @@ class BaseValueParser(BinaryReaderBase):
             raise ValueError("Attempting to read more bytes than available in the buffer: " + str(count) + " " + str(len(self.byte_buffer) - self.position))
         result = self.byte_buffer[self.position:self.position + count]
         self.position += count
+        return result.tobytes() if isinstance(result, memoryview) else result
+
+    def read_bytes_view(self, count: int) -> memoryview:
+        # Same as read_bytes, but the result shares the parser's memory instead of copying it
+        if count > len(self.byte_buffer) - self.position:
+            ArkSaveLogger.open_hex_view()
+            raise ValueError("Attempting to read more bytes than available in the buffer: " + str(count) + " " + str(len(self.byte_buffer) - self.position))
+        result = self.get_view()[self.position:self.position + count]
+        self.position += count
         return result
 
     def skip_bytes(self, count: int):
@@ -169,10 +181,13 @@ class BaseValueParser(BinaryReaderBase):
         if name == "NPCZoneVolume" or "NPCZoneVolume_" in name or "_NPCZoneVolume" in name or "NPCCountVolume" in name:
             return name + "_" + hex(self.read_int())
 
+        if self.save_context.trusted:
+            self.position += 4
+            return name
+
         always_zero = self.read_int()
 
-        no_prints = ["DontDoMaterialSpawning", "CorruptSpawnInValue", "LadderSocket"]
-        if always_zero != 0 and name not in no_prints:
+        if always_zero != 0 and name not in _ALWAYS_ZERO_EXCEPTIONS:
             ArkSaveLogger.warning_log(f"Always zero is not zero: {always_zero}, for name {name} at position {pos}")
         
         return name
@@ -7,9 +7,24 @@ from ._byte_operator import ByteOperator
 from arkparse.logging import ArkSaveLogger
 
 class BaseValueValidator(ByteOperator):
+    """
+    validate_* reads a value and raises if it differs from the expected one, always, as edits rely on them.
+    expect_* does the same while parsing, but when the save context is trusted only the position advances.
+    """
     def __init__(self, data: bytes, save_context=None):
         super().__init__(data, save_context)
 
+    def skip_string(self):
+        length = self.read_int()
+        self.position += length if length >= 0 else -2 * length
+
+    def skip_name(self):
+        if not self.save_context.has_name_table():
+            self.skip_string()
+        else:
+            # name index followed by the always zero (or NPCZoneVolume suffix) int
+            self.position += 8
+
     def validate_string(self, s):
         pos = self.position
         read = self.read_string()
@@ -64,4 +79,52 @@ class BaseValueValidator(ByteOperator):
         read = self.read_bytes_as_hex(nr_bytes)
         if read != s:
             ArkSaveLogger.open_hex_view()
-            raise Exception(f"Expected {hex(s)} but got {hex(read)} at position {pos}")
\ No newline at end of file
+            raise Exception(f"Expected {hex(s)} but got {hex(read)} at position {pos}")
+
+    def expect_string(self, s):
+        if self.save_context.trusted:
+            self.skip_string()
+        else:
+            self.validate_string(s)
+
+    def expect_uint64(self, u64):
+        if self.save_context.trusted:
+            self.position += 8
+        else:
+            self.validate_uint64(u64)
+
+    def expect_uint16(self, u16):
+        if self.save_context.trusted:
+            self.position += 2
+        else:
+            self.validate_uint16(u16)
+
+    def expect_uint32(self, u32):
+        if self.save_context.trusted:
+            self.position += 4
+        else:
+            self.validate_uint32(u32)
+
+    def expect_byte(self, b):
+        if self.save_context.trusted:
+            self.position += 1
+        else:
+            self.validate_byte(b)
+
+    def expect_name(self, s):
+        if self.save_context.trusted:
+            self.skip_name()
+        else:
+            self.validate_name(s)
+
+    def expect_int32(self, i32):
+        if self.save_context.trusted:
+            self.position += 4
+        else:
+            self.validate_int32(i32)
+
+    def expect_bytes_as_string(self, s, nr_bytes):
+        if self.save_context.trusted:
+            self.position += nr_bytes
+        else:
+            self.validate_bytes_as_string(s, nr_bytes)
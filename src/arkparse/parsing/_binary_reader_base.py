@@ -1,14 +1,25 @@
+from typing import Optional, Union
+
 from ..saves.save_context import SaveContext
 
 class BinaryReaderBase:
     LENGTH_OF_NAME = 8
     LENGTH_OF_BOOLEAN_PROPERTY = 26
 
-    def __init__(self, data: bytes, save_context=None):
+    def __init__(self, data: Union[bytes, memoryview], save_context=None):
         self.byte_buffer = data
         self.position = 0
         self.save_context = save_context if save_context else SaveContext()
         self.in_cryopod = False
+        self._view: Optional[memoryview] = None
+
+    def __getstate__(self):
+        # Memoryviews cannot be pickled, e.g. when objects are decoded in a process pool
+        state = self.__dict__.copy()
+        state["_view"] = None
+        if isinstance(self.byte_buffer, memoryview):
+            state["byte_buffer"] = self.byte_buffer.tobytes()
+        return state
 
     def get_position(self) -> int:
         return self.position
@@ -21,4 +32,17 @@ class BinaryReaderBase:
 
     def size(self) -> int:
         return len(self.byte_buffer)
+
+    def get_view(self) -> memoryview:
+        # Slices of the view share the buffer's memory, the view is rebuilt when the buffer is replaced
+        if isinstance(self.byte_buffer, memoryview):
+            return self.byte_buffer
+        if self._view is None or self._view.obj is not self.byte_buffer:
+            self._view = memoryview(self.byte_buffer)
+        return self._view
+
+    def get_bytes(self) -> bytes:
+        if isinstance(self.byte_buffer, memoryview):
+            return self.byte_buffer.tobytes()
+        return self.byte_buffer
     
\ No newline at end of file
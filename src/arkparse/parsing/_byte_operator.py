@@ -14,7 +14,8 @@ class ByteOperator(BaseValueParser):
             self.position = position
         if nr_to_replace is None:
             nr_to_replace = len(new_bytes)
-        self.byte_buffer = self.byte_buffer[:self.position] + new_bytes + self.byte_buffer[self.position + nr_to_replace:]
+        buffer = self.get_bytes()
+        self.byte_buffer = buffer[:self.position] + new_bytes + buffer[self.position + nr_to_replace:]
 
         if inc_position:
             self.position += + len(new_bytes)
@@ -22,11 +23,13 @@ class ByteOperator(BaseValueParser):
     def insert_bytes(self, new_bytes: bytes, position: int = None, inc_position: bool = True):
         if position is not None:
             self.position = position
-        self.byte_buffer = self.byte_buffer[:self.position] + new_bytes + self.byte_buffer[self.position:]
+        buffer = self.get_bytes()
+        self.byte_buffer = buffer[:self.position] + new_bytes + buffer[self.position:]
 
         if inc_position:
             self.position += len(new_bytes)
     
     def snip_bytes(self, length: int):
-        self.byte_buffer = self.byte_buffer[:self.position] + self.byte_buffer[self.position + length:]
+        buffer = self.get_bytes()
+        self.byte_buffer = buffer[:self.position] + buffer[self.position + length:]
         
\ No newline at end of file
@@ -112,7 +112,7 @@ class ArkProperty:
 
         unknown_byte = byte_buffer.read_byte()
         start_of_data = byte_buffer.get_position()
-        byte_buffer.validate_uint32(0)
+        byte_buffer.expect_uint32(0)
         count = byte_buffer.read_int()
 
         map_entries = []
@@ -156,7 +156,7 @@ class ArkProperty:
         value_type = byte_buffer.read_value_type_by_name()
         unknown_byte = byte_buffer.read_byte()
         start_of_data = byte_buffer.get_position()
-        byte_buffer.validate_uint32(0)
+        byte_buffer.expect_uint32(0)
         count = byte_buffer.read_int()
 
         ArkSaveLogger.enter_struct(f"Set({value_type})")
@@ -177,7 +177,7 @@ class ArkProperty:
     def read_soft_object_property_value(byte_buffer: 'ArkBinaryParser') -> str:
         ArkSaveLogger.enter_struct("SfO")
         obj_name = byte_buffer.read_name()
-        byte_buffer.validate_bytes_as_string("00 00 00 00", 4)
+        byte_buffer.expect_bytes_as_string("00 00 00 00", 4)
         ArkSaveLogger.parser_log(f"Read soft object property {obj_name}")
         ArkSaveLogger.exit_struct()
         return obj_name
@@ -187,7 +187,7 @@ class ArkProperty:
         ArkSaveLogger.parser_log(f"Reading struct property {struct_type} with data size {data_size}")
         if not in_array:
             ArkSaveLogger.enter_struct(f"S({struct_type})")
-            byte_buffer.validate_bytes_as_string("00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00", 16)
+            byte_buffer.expect_bytes_as_string("00 00 00 00 00 00 00 00 00 00 00 00 00 00 00 00", 16)
 
         ark_struct_type = ArkStructType.from_type_name(struct_type)
         
@@ -32,7 +32,7 @@ class ArkDinoAncestorEntry:
         id1 = byte_buffer.parse_uint32_property("FemaleDinoID1")
         id2 = byte_buffer.parse_uint32_property("FemaleDinoID2")
         self.female = ArkDinoAncestor(female_name, id1, id2)
-        byte_buffer.validate_name("None")
+        byte_buffer.expect_name("None")
 
     def __str__(self):
         return f"AncestorEntry:[M:{self.male}, F:{self.female}]"
@@ -12,22 +12,22 @@ class ForPrimalBuffClass:
     class_string: str
 
     def __init__(self, byte_buffer: "ArkBinaryParser"):
-        byte_buffer.validate_string("ForPrimalBuffClass")
-        byte_buffer.validate_string("ObjectProperty")
+        byte_buffer.expect_string("ForPrimalBuffClass")
+        byte_buffer.expect_string("ObjectProperty")
 
         self.class64Bit = byte_buffer.read_uint64()
         byte_buffer.skip_bytes(1)
-        byte_buffer.validate_uint32(1)
+        byte_buffer.expect_uint32(1)
 
         self.class_ = byte_buffer.read_string()
 
-        byte_buffer.validate_string("ForPrimalBuffClassString")
-        byte_buffer.validate_string("StrProperty")
+        byte_buffer.expect_string("ForPrimalBuffClassString")
+        byte_buffer.expect_string("StrProperty")
         self.classString64Bit = byte_buffer.read_uint64()
         byte_buffer.skip_bytes(1)
         self.class_string = byte_buffer.read_string()
 
-        byte_buffer.validate_string("None")
+        byte_buffer.expect_string("None")
 
     def __str__(self):
         return f"ForPrimalBuffClass: {self.class_} {self.class_string}"
@@ -40,7 +40,7 @@ class ArkMyPersistentBuffDatas:
     # buffs : list[ForPrimalBuffClass]
 
     def __init__(self, byte_buffer: "ArkBinaryParser", size: int):
-        byte_buffer.validate_uint32(0)
+        byte_buffer.expect_uint32(0)
         self.initialIds = []
         
         for i in range(size-1):
@@ -48,8 +48,8 @@ class ArkMyPersistentBuffDatas:
 
         self.initialIds.append((byte_buffer.read_uint32(), 0))
 
-        byte_buffer.validate_string("None")
-        byte_buffer.validate_uint32(1)
+        byte_buffer.expect_string("None")
+        byte_buffer.expect_uint32(1)
 
         self.id_ = str(byte_buffer.read_uint64()) + str(byte_buffer.read_uint64())
 
@@ -57,7 +57,7 @@ class ArkMyPersistentBuffDatas:
         # self.buffs = []
         # for _ in range(size):
         #     self.buffs.append(ForPrimalBuffClass(byte_buffer)) 
-        #     byte_buffer.validate_uint32(0)
+        #     byte_buffer.expect_uint32(0)
             # ArkSaveLogger.open_hex_view(True)
 
     def __str__(self):
@@ -15,22 +15,22 @@ class ArkVectorBoolPair:
 
     def __init__(self, byte_buffer: "ArkBinaryParser"):
 
-        byte_buffer.validate_string("VectorVal")
-        byte_buffer.validate_string("StructProperty")
-        byte_buffer.validate_uint64(24)
-        byte_buffer.validate_string("Vector")
+        byte_buffer.expect_string("VectorVal")
+        byte_buffer.expect_string("StructProperty")
+        byte_buffer.expect_uint64(24)
+        byte_buffer.expect_string("Vector")
 
         byte_buffer.skip_bytes(17)
 
         self.vector = ArkVector(byte_buffer)
 
-        byte_buffer.validate_string("BoolVal")
-        byte_buffer.validate_string("BoolProperty")
-        byte_buffer.validate_uint64(0)
+        byte_buffer.expect_string("BoolVal")
+        byte_buffer.expect_string("BoolProperty")
+        byte_buffer.expect_uint64(0)
 
         self.bool_ = byte_buffer.read_uint16() != 0
 
-        byte_buffer.validate_string("None")
+        byte_buffer.expect_string("None")
 
         ArkSaveLogger.parser_log(
             f"Read vector bool pair {self.vector} {self.vector}")
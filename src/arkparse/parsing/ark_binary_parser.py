@@ -1,6 +1,9 @@
-from typing import List, Dict, TYPE_CHECKING
+from typing import List, Dict, Tuple, Union, TYPE_CHECKING
 from uuid import UUID
 from io import BytesIO
+from collections import OrderedDict
+import hashlib
+import threading
 import zlib
 
 from arkparse.parsing.struct.actor_transform import ActorTransform
@@ -8,7 +11,6 @@ from arkparse.logging import ArkSaveLogger
 from ._property_parser import PropertyParser
 from ._property_replacer import PropertyReplacer
 from .ark_value_type import ArkValueType
-from collections import deque
 from arkparse.utils.temp_files import TEMP_FILES_DIR
 
 if TYPE_CHECKING:
@@ -51,7 +53,20 @@ COMPRESSED_BYTES_NAME_CONSTANTS = {
         56: "UnknowColor1", # !!!
     }
 
+# Every byte from 0xF0 upwards starts a wildcard escape sequence, they are all mapped to 0xF0
+# so a single find() locates the next one
+_WILDCARD_MARKER_TABLE = bytes(b if b < 0xF0 else 0xF0 for b in range(256))
+_WILDCARD_SWITCH_TABLE = [bytes([0xF0 | ((b & 0xF0) >> 4), 0xF0 | (b & 0x0F)]) for b in range(256)]
+_WILDCARD_PADDING_TABLE = {b: bytes(b & 0x0F) for b in range(0xF2, 0xFF)}
+
 class ArkBinaryParser(PropertyParser, PropertyReplacer):
+    # Inflated cryopod payloads, keyed by a hash of the compressed bytes (LRU, bounded by total size)
+    INFLATED_CACHE_MAX_BYTES = 128 * 1024 * 1024
+    _inflated_cache: "OrderedDict[bytes, Tuple[int, bytes]]" = OrderedDict()
+    _inflated_cache_bytes = 0
+    # Parsers of a save shared between threads use the same cache
+    _inflated_cache_lock = threading.Lock()
+
     def __init__(self, data: bytes, save_context=None):
         super().__init__(data, save_context)
 
@@ -61,69 +76,105 @@ class ArkBinaryParser(PropertyParser, PropertyReplacer):
         Processes the input buffer using the wildcard inflation rules
         and returns the resulting decompressed buffer.
 
+        Literal runs between escape codes are copied in one go, the escape
+        codes themselves are expanded through precomputed tables.
+
         :param input_buffer: The compressed input as bytes.
         :return: The decompressed output as bytes.
         """
-        class ReadState:
-            NONE = 0
-            ESCAPE = 1
-            SWITCH = 2
-
-        fifo_queue = deque()
+        data = bytes(input_buffer)
+        markers = data.translate(_WILDCARD_MARKER_TABLE)
         output_buffer = bytearray()
-        read_state = ReadState.NONE
-
-        def read_from_input(data, pos):
-            """Reads the next byte from the input buffer."""
-            if pos < len(data):
-                return data[pos], pos + 1
-            return None, pos
-
+        size = len(data)
         pos = 0
-        while pos < len(input_buffer) or fifo_queue:
-            if fifo_queue:
-                output_buffer.append(fifo_queue.popleft())
-                continue
-
-            next_byte, pos = read_from_input(input_buffer, pos)
-            if next_byte is None:
-                print("End of stream")
+
+        while pos < size:
+            next_escape = markers.find(0xF0, pos)
+            if next_escape == -1:
+                output_buffer += data[pos:]
                 break
 
-            if read_state == ReadState.SWITCH:
-                return_value = 0xF0 | ((next_byte & 0xF0) >> 4)
-                fifo_queue.append(0xF0 | (next_byte & 0x0F))
-                output_buffer.append(return_value)
-                read_state = ReadState.NONE
-                continue
-
-            if read_state == ReadState.NONE:
-                if next_byte == 0xF0:
-                    read_state = ReadState.ESCAPE
-                    continue
-                elif next_byte == 0xF1:
-                    read_state = ReadState.SWITCH
-                    continue
-                elif 0xF2 <= next_byte < 0xFF:
-                    # Insert padding bytes
-                    byte_count = next_byte & 0x0F
-                    fifo_queue.extend([0] * byte_count)
-                    continue
-                elif next_byte == 0xFF:
-                    # Handle special FF case
-                    b1, pos = read_from_input(input_buffer, pos)
-                    b2, pos = read_from_input(input_buffer, pos)
-                    if b1 is None or b2 is None:
-                        raise ValueError("Unexpected end of stream after 0xFF")
-                    fifo_queue.extend([0, 0, 0, b1, 0, 0, 0, b2, 0, 0, 0])
-                    continue
-
-            # Default case: append the byte to the output
-            read_state = ReadState.NONE
-            output_buffer.append(next_byte)
+            output_buffer += data[pos:next_escape]
+            code = data[next_escape]
+
+            if code == 0xF0:
+                # Escaped byte, copied as is
+                output_buffer += data[next_escape + 1:next_escape + 2]
+                pos = next_escape + 2
+            elif code == 0xF1:
+                # Switched byte, both nibbles expand to 0xFX
+                if next_escape + 1 < size:
+                    output_buffer += _WILDCARD_SWITCH_TABLE[data[next_escape + 1]]
+                pos = next_escape + 2
+            elif code == 0xFF:
+                # Two bytes padded with zeroes
+                if next_escape + 2 >= size:
+                    raise ValueError("Unexpected end of stream after 0xFF")
+                output_buffer += b"\x00\x00\x00"
+                output_buffer.append(data[next_escape + 1])
+                output_buffer += b"\x00\x00\x00"
+                output_buffer.append(data[next_escape + 2])
+                output_buffer += b"\x00\x00\x00"
+                pos = next_escape + 3
+            else:
+                # 0xF2 - 0xFE: insert padding bytes
+                output_buffer += _WILDCARD_PADDING_TABLE[code]
+                pos = next_escape + 1
 
         return bytes(output_buffer)
 
+    @staticmethod
+    def __inflate(compressed: Union[bytes, memoryview]) -> Tuple[int, bytes]:
+        key = hashlib.blake2b(compressed, digest_size=16).digest()
+        with ArkBinaryParser._inflated_cache_lock:
+            cached = ArkBinaryParser._inflated_cache.get(key)
+            if cached is not None:
+                ArkBinaryParser._inflated_cache.move_to_end(key)
+                return cached
+
+        header_parser = ArkBinaryParser(compressed[:12])
+        if header_parser.size() < 12:
+            raise ValueError("Insufficient data for header")
+        version = header_parser.read_uint32()
+        if version < 0x0407:
+            raise RuntimeError(f"Unsupported embedded data version (only Unreal 5.5 is supported), skipping")
+        inflated_size = header_parser.read_uint32()
+        names_offset = header_parser.read_uint32()
+
+        compressed_data = compressed[12:]
+        if not compressed_data:
+            raise ValueError("No compressed data found")  
+
+        # Decompress data with error handling
+        try:
+            decompressed = zlib.decompress(compressed_data) # decompress the data using the DEFLATE algorithm
+        except zlib.error as e:
+            raise RuntimeError(f"Failed to decompress data") from e
+        
+        if len(decompressed) != inflated_size:
+            raise ValueError(f"Expected compressed size {inflated_size}, got {len(decompressed)}")
+
+        result = (names_offset, ArkBinaryParser.__wildcard_decompress(decompressed))
+
+        max_bytes = ArkBinaryParser.INFLATED_CACHE_MAX_BYTES
+        if len(result[1]) <= max_bytes:
+            with ArkBinaryParser._inflated_cache_lock:
+                # Another thread may have inflated the same payload in the meantime
+                if key not in ArkBinaryParser._inflated_cache:
+                    ArkBinaryParser._inflated_cache[key] = result
+                    ArkBinaryParser._inflated_cache_bytes += len(result[1])
+                while ArkBinaryParser._inflated_cache_bytes > max_bytes and len(ArkBinaryParser._inflated_cache) > 0:
+                    _, (_, evicted) = ArkBinaryParser._inflated_cache.popitem(last=False)
+                    ArkBinaryParser._inflated_cache_bytes -= len(evicted)
+
+        return result
+
+    @staticmethod
+    def clear_inflated_cache():
+        with ArkBinaryParser._inflated_cache_lock:
+            ArkBinaryParser._inflated_cache.clear()
+            ArkBinaryParser._inflated_cache_bytes = 0
+
     def __structured_print_print(self, msg: str, to_file: BytesIO, end: str = "\n"):
         if to_file is not None:
             to_file.write(msg.encode())
@@ -206,35 +257,12 @@ class ArkBinaryParser(PropertyParser, PropertyReplacer):
         self.__structured_print_print(" === End of structured print === ", to_file)
 
     @staticmethod
-    def from_deflated_data(byte_arr: List[int]):
+    def from_deflated_data(byte_arr: Union[List[int], bytes, memoryview]):
         parser = ArkBinaryParser(None)
 
-        raw_data = BytesIO(bytes(byte_arr))
-        header_data_bytes = raw_data.read(12)
-        if len(header_data_bytes) < 12:
-            raise ValueError("Insufficient data for header")
-        
-        header_parser = ArkBinaryParser(header_data_bytes)
-        version = header_parser.read_uint32()
-        if version < 0x0407:
-            raise RuntimeError(f"Unsupported embedded data version (only Unreal 5.5 is supported), skipping")
-        inflated_size = header_parser.read_uint32()
-        names_offset = header_parser.read_uint32()
-
-        compressed_data = raw_data.read()
-        if not compressed_data:
-            raise ValueError("No compressed data found")  
-
-        # Decompress data with error handling
-        try:
-            decompressed = zlib.decompress(compressed_data) # decompress the data using the DEFLATE algorithm
-        except zlib.error as e:
-            raise RuntimeError(f"Failed to decompress data") from e
-        
-        if len(decompressed) != inflated_size:
-            raise ValueError(f"Expected compressed size {inflated_size}, got {len(decompressed)}")
-
-        parser.byte_buffer = ArkBinaryParser.__wildcard_decompress(decompressed)
+        if not isinstance(byte_arr, (bytes, memoryview)):
+            byte_arr = bytes(byte_arr)
+        names_offset, parser.byte_buffer = ArkBinaryParser.__inflate(byte_arr)
         ArkSaveLogger.set_file(parser, "debug.bin")
 
         name_table = {}
@@ -357,24 +385,17 @@ class ArkBinaryParser(PropertyParser, PropertyReplacer):
         max_prints = 20
         prints = 0
         found = []
-        buffer = self.byte_buffer
-        cur_offset = 0
+        buffer = self.get_bytes()
+        pos = buffer.find(pattern)
         
-        while True:
-            pos = buffer.find(pattern)
-            if pos == -1:
-                break
-            found.append(pos + cur_offset + adjust_offset)
+        while pos != -1:
+            found.append(pos + adjust_offset)
             if prints < max_prints:
                 ArkSaveLogger.parser_log(
-                    f"Found byte sequence at {pos + cur_offset + adjust_offset}"
+                    f"Found byte sequence at {pos + adjust_offset}"
                 )
                 prints += 1
-            buffer = buffer[pos + 1:]
-            cur_offset += pos + 1
+            pos = buffer.find(pattern, pos + 1)
         
         self.set_position(original_position)
-        return found
-
-    
-    
+        return found
\ No newline at end of file
@@ -47,7 +47,7 @@ class ArkObject(ArkPropertyContainer):
             rotator = ArkRotator(reader)
         
         properties_offset = reader.read_int()
-        reader.validate_uint32(0)
+        reader.expect_uint32(0)
 
         ArkSaveLogger.parser_log(f"Read ArkObject: {class_name} with UUID {uuid} at offset {properties_offset}")
 
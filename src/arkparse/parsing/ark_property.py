@@ -133,7 +133,7 @@ class ArkProperty:
     nr_of_bytes: int = field(default=0, init=False)
     name_position: int = field(default=0, init=False)
     value_position: int = field(default=0, init=False)
-    bytes: Optional[bytes] = field(default=None, init=False, repr=False)
+    bytes: Optional[memoryview] = field(default=None, init=False, repr=False)
 
     def __init__(self, name: str, type: str, position: int, unknown_byte: int, value: T):
         # Keep ctor to match the original signature/behavior
@@ -147,6 +147,18 @@ class ArkProperty:
         self.value_position = 0
         self.bytes = None
 
+    def __getstate__(self):
+        # The bytes view cannot be pickled, it is sent as a copy and restored as a view of that copy
+        state = self.__dict__.copy()
+        if isinstance(self.bytes, memoryview):
+            state["bytes"] = self.bytes.tobytes()
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if isinstance(self.bytes, bytes):
+            self.bytes = memoryview(self.bytes)
+
     # ---------------------------------------------------------------------------------------------
     # Public API
     # ---------------------------------------------------------------------------------------------
@@ -202,7 +214,7 @@ class ArkProperty:
             prop.nr_of_bytes = data_size
             prop.name_position = name_position
             prop.value_position = value_position
-            prop.bytes = byte_buffer.byte_buffer[name_position:byte_buffer.get_position()]
+            prop.bytes = byte_buffer.get_view()[name_position:byte_buffer.get_position()]
 
         return prop
 
@@ -241,9 +253,9 @@ class ArkProperty:
         enum_type = bb.read_name()  # unused but kept
         _size = bb.read_int()
         _enum_bp = bb.read_name()  # unused but kept
-        bb.validate_uint32(0)
+        bb.expect_uint32(0)
         _enum_byte_size = bb.read_byte()
-        bb.validate_uint32(0)
+        bb.expect_uint32(0)
         enum_name = bb.read_name()
         ArkSaveLogger.parser_log(f"[ENUM: key={key}; value={ArkEnumValue(enum_name)}; start_pos={pre_read_pos}]")
         value_position = bb.get_position()
@@ -310,11 +322,11 @@ class ArkProperty:
     @staticmethod
     def read_set_property(key: str, value_type_name: str, position: int, bb: "ArkBinaryParser", data_size: int) -> "ArkProperty":
         value_type = bb.read_value_type_by_name()
-        bb.validate_uint32(0)
+        bb.expect_uint32(0)
         data_size = bb.read_int()
-        bb.validate_byte(0)
+        bb.expect_byte(0)
         start_of_data = bb.get_position()
-        bb.validate_uint32(0)
+        bb.expect_uint32(0)
         count = bb.read_int()
 
         with log_block(f"Set({value_type})"):
@@ -425,10 +437,10 @@ class ArkProperty:
     # ---------------------------------------------------------------------------------------------
     @staticmethod
     def __read_struct_header(bb: "ArkBinaryParser", position: int = 0, in_array: bool = False, in_map: bool = False, nr_of_struct_names: int = 1) -> Tuple[int, int, bool]:
-        bb.validate_uint32(1)  # V14 marker
+        bb.expect_uint32(1)  # V14 marker
         for _ in range(nr_of_struct_names):
             _new_name = bb.read_name()
-            bb.validate_uint32(0)
+            bb.expect_uint32(0)
         data_size = bb.read_uint32()
         size_byte = bb.read_byte()  # V14 unknown byte
 
@@ -529,7 +541,7 @@ class ArkProperty:
     def read_soft_object_property_value(bb: "ArkBinaryParser") -> str:
         with log_block("SfO"):
             obj_name = bb.read_name()
-            bb.validate_bytes_as_string("00 00 00 00", 4)
+            bb.expect_bytes_as_string("00 00 00 00", 4)
             ArkSaveLogger.parser_log(f"Read soft object property {obj_name}")
             return obj_name
 
@@ -1,4 +1,4 @@
-from typing import List, Optional, Type, TypeVar, Dict, TYPE_CHECKING
+from typing import List, Optional, Type, TypeVar, Dict, Tuple, TYPE_CHECKING
 from dataclasses import dataclass, field
 
 # Import ArkProperty only for type checking to avoid circular import
@@ -14,8 +14,50 @@ T = TypeVar('T')
 class ArkPropertyContainer:
     properties: List['ArkProperty'] = field(default_factory=list)
 
+    # Lazily built lookup tables, see __build_index
+    _own_index: Optional[Dict[Tuple[str, int], Tuple[int, 'ArkProperty']]] = field(default=None, init=False, repr=False, compare=False)
+    _nested_index: Optional[Dict[str, Tuple[int, 'ArkProperty']]] = field(default=None, init=False, repr=False, compare=False)
+    _flat_index: Optional[Dict[str, 'ArkProperty']] = field(default=None, init=False, repr=False, compare=False)
+
+    def invalidate_index(self) -> None:
+        self._own_index = None
+        self._nested_index = None
+        self._flat_index = None
+
+    def __build_index(self) -> None:
+        # _own_index: (name, position) -> first direct property
+        # _nested_index: name -> first match in a nested container, with the index of the direct property holding it
+        # _flat_index: name -> first match in depth first order (direct or nested), used by name-only lookups
+        own_index = {}
+        nested_index = {}
+        flat_index = {}
+
+        for i, property in enumerate(self.properties):
+            key = (property.name, property.position)
+            if key not in own_index:
+                own_index[key] = (i, property)
+            if property.name not in flat_index:
+                flat_index[property.name] = property
+
+            if isinstance(property.value, ArkPropertyContainer):
+                for name, sub_property in property.value.get_flat_index().items():
+                    if name not in nested_index:
+                        nested_index[name] = (i, sub_property)
+                    if name not in flat_index:
+                        flat_index[name] = sub_property
+
+        self._own_index = own_index
+        self._nested_index = nested_index
+        self._flat_index = flat_index
+
+    def get_flat_index(self) -> Dict[str, 'ArkProperty']:
+        if self._flat_index is None:
+            self.__build_index()
+        return self._flat_index
+
     def read_properties(self, byte_buffer: "ArkBinaryParser", propertyClass: Type['ArkProperty'], next_object_index: int) -> None:
         last_property_position = byte_buffer.get_position()
+        self.invalidate_index()
         ArkSaveLogger.reset_struct_path()
         # ArkSaveLogger.open_hex_view(True)
         try:
@@ -52,14 +94,18 @@ class ArkPropertyContainer:
         return any(property.name == name for property in self.properties)
 
     def find_property(self, name: str, position: int = None) -> Optional['ArkProperty[T]']:
-        for property in self.properties:
-            if property.name == name and (position is None or property.position == position):
-                return property
-            elif isinstance(property.value, ArkPropertyContainer):
-                sub_property = property.value.find_property(name)
-                if sub_property:
-                    return sub_property
-        return None
+        if self._flat_index is None:
+            self.__build_index()
+
+        if position is None:
+            return self._flat_index.get(name)
+
+        # A direct match wins over a nested match unless the nested one comes from an earlier property
+        own = self._own_index.get((name, position))
+        nested = self._nested_index.get(name)
+        if own is not None and (nested is None or own[0] <= nested[0]):
+            return own[1]
+        return nested[1] if nested is not None else None
     
     def find_all_properties_of_name(self, name: str) -> List['ArkProperty[T]']:
         props = []
@@ -74,10 +120,10 @@ class ArkPropertyContainer:
         return props
 
     def find_property_by_position(self, name: str, position: int) -> Optional['ArkProperty[T]']:
-        for property in self.properties:
-            if property.name == name and property.position == position:
-                return property
-        return None
+        if self._own_index is None:
+            self.__build_index()
+        own = self._own_index.get((name, position))
+        return own[1] if own is not None else None
     
     def get_properties_before(self, name: str) -> List[str]:
         properties = []
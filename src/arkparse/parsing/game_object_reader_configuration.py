@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Optional, Callable
+from typing import Optional, Callable, Tuple
 from uuid import UUID
 
 
@@ -7,3 +7,7 @@ from uuid import UUID
 class GameObjectReaderConfiguration:
     uuid_filter: Optional[Callable[[UUID], bool]] = None
     blueprint_name_filter: Optional[Callable[[Optional[str]], bool]] = None
+    # SQL condition on the game table (key, value), evaluated inside SQLite before any row is parsed,
+    # e.g. "ark_prop_int(value, 'TargetingTeam') = ?" with sql_params (123,), see GameObjectSqlFunctions
+    sql_filter: Optional[str] = None
+    sql_params: Tuple = ()
@@ -10,22 +10,30 @@ if TYPE_CHECKING:
 @dataclass
 class ArkByteArray:
     size: int
-    data: bytes
+    data: memoryview # shares the memory of the parsed object
 
     def __init__(self, ark_binary_data: "ArkBinaryParser"):
-        ark_binary_data.validate_name("Bytes")
-        ark_binary_data.validate_name("ArrayProperty")
-        ark_binary_data.validate_uint32(1)
-        ark_binary_data.validate_name("ByteProperty")
-        ark_binary_data.validate_uint32(0)
+        ark_binary_data.expect_name("Bytes")
+        ark_binary_data.expect_name("ArrayProperty")
+        ark_binary_data.expect_uint32(1)
+        ark_binary_data.expect_name("ByteProperty")
+        ark_binary_data.expect_uint32(0)
 
         ark_binary_data.read_uint32() # total size
-        ark_binary_data.validate_byte(0)
+        ark_binary_data.expect_byte(0)
 
         self.size = ark_binary_data.read_uint32()
-        self.data = ark_binary_data.read_bytes(self.size) if self.size > 0 else b''
+        self.data = ark_binary_data.read_bytes_view(self.size) if self.size > 0 else memoryview(b'')
 
-        ark_binary_data.validate_name("None")
+        ark_binary_data.expect_name("None")
+
+    def __getstate__(self):
+        # Same as ArkProperty.bytes, pickled as a copy and restored as a view of it
+        return {"size": self.size, "data": self.data.tobytes()}
+
+    def __setstate__(self, state):
+        self.size = state["size"]
+        self.data = memoryview(state["data"])
 
 @dataclass
 class ArkCustomItemData:
@@ -68,7 +76,7 @@ class ArkCustomItemData:
         if ark_binary_data.peek_name() == "CustomDataSoftClasses":  # check if CustomDataSoftClasses is present
             self.custom_data_soft_classes = self.__read_custom_data_soft_classes(ark_binary_data)
 
-        ark_binary_data.validate_name("None")        
+        ark_binary_data.expect_name("None")        
 
         ArkSaveLogger.parser_log(f"CustomItemData of type {self.custom_data_name} read successfully, total size: {total_size} bytes")
         for string in self.strings:
@@ -95,7 +103,7 @@ class ArkCustomItemData:
         self.nr_of_arrays = nr_of_arrays
 
         if nr_of_arrays == 0:
-            ark_binary_data.validate_name("None")
+            ark_binary_data.expect_name("None")
             return
 
         for _ in range(nr_of_arrays):
@@ -107,21 +115,21 @@ class ArkCustomItemData:
         if ark_binary_data.position != arr_start + arr_size:
             raise ValueError(f"Expected to read {arr_size} bytes, but read {ark_binary_data.position - arr_start} bytes")
 
-        ark_binary_data.validate_name("None")
+        ark_binary_data.expect_name("None")
     
     def __read_array_header(self, ark_binary_data: "ArkBinaryParser"):
-        ark_binary_data.validate_name("ByteArrays")
-        ark_binary_data.validate_name("ArrayProperty")
-        ark_binary_data.validate_uint32(1)
-        ark_binary_data.validate_name("StructProperty")
-        ark_binary_data.validate_uint32(1)
-        ark_binary_data.validate_name("CustomItemByteArray")
-        ark_binary_data.validate_uint32(1)
-        ark_binary_data.validate_name("/Script/ShooterGame")
-        ark_binary_data.validate_uint32(0)
+        ark_binary_data.expect_name("ByteArrays")
+        ark_binary_data.expect_name("ArrayProperty")
+        ark_binary_data.expect_uint32(1)
+        ark_binary_data.expect_name("StructProperty")
+        ark_binary_data.expect_uint32(1)
+        ark_binary_data.expect_name("CustomItemByteArray")
+        ark_binary_data.expect_uint32(1)
+        ark_binary_data.expect_name("/Script/ShooterGame")
+        ark_binary_data.expect_uint32(0)
 
         arr_size = ark_binary_data.read_uint32()
-        ark_binary_data.validate_byte(0)
+        ark_binary_data.expect_byte(0)
         arr_start = ark_binary_data.position
 
         return arr_size, arr_start
@@ -129,29 +137,29 @@ class ArkCustomItemData:
     def __read_custom_data_doubles(self, ark_binary_data: "ArkBinaryParser"):
         self.__read_struct_start(ark_binary_data, "CustomDataDoubles", "CustomItemDoubles")
 
-        ark_binary_data.validate_name("Doubles")
-        ark_binary_data.validate_name("ArrayProperty")
-        ark_binary_data.validate_uint32(1)
-        ark_binary_data.validate_name("DoubleProperty")
-        ark_binary_data.validate_uint32(0)
+        ark_binary_data.expect_name("Doubles")
+        ark_binary_data.expect_name("ArrayProperty")
+        ark_binary_data.expect_uint32(1)
+        ark_binary_data.expect_name("DoubleProperty")
+        ark_binary_data.expect_uint32(0)
         ark_binary_data.read_uint32() # size of the data in bytes
-        ark_binary_data.validate_byte(0)
+        ark_binary_data.expect_byte(0)
         nr_of_values = ark_binary_data.read_uint32()
 
         doubles = [ark_binary_data.read_double() for _ in range(nr_of_values)]
 
-        ark_binary_data.validate_name("None")
+        ark_binary_data.expect_name("None")
 
         return doubles
     
     def __read_custom_data_strings(self, ark_binary_data: "ArkBinaryParser"):
-        ark_binary_data.validate_name("CustomDataStrings")
-        ark_binary_data.validate_name("ArrayProperty")
-        ark_binary_data.validate_uint32(1)
-        ark_binary_data.validate_name("StrProperty")
-        ark_binary_data.validate_uint32(0)
+        ark_binary_data.expect_name("CustomDataStrings")
+        ark_binary_data.expect_name("ArrayProperty")
+        ark_binary_data.expect_uint32(1)
+        ark_binary_data.expect_name("StrProperty")
+        ark_binary_data.expect_uint32(0)
         ark_binary_data.read_uint32() # size of the data in bytes
-        ark_binary_data.validate_byte(0)
+        ark_binary_data.expect_byte(0)
         nr_of_values = ark_binary_data.read_uint32()
 
         strings = [ark_binary_data.read_string() for _ in range(nr_of_values)]
@@ -159,13 +167,13 @@ class ArkCustomItemData:
         return strings
 
     def _read_custom_data_floats(self, ark_binary_data: "ArkBinaryParser"):
-        ark_binary_data.validate_name("CustomDataFloats")
-        ark_binary_data.validate_name("ArrayProperty")
-        ark_binary_data.validate_uint32(1)
-        ark_binary_data.validate_name("FloatProperty")
-        ark_binary_data.validate_uint32(0)
+        ark_binary_data.expect_name("CustomDataFloats")
+        ark_binary_data.expect_name("ArrayProperty")
+        ark_binary_data.expect_uint32(1)
+        ark_binary_data.expect_name("FloatProperty")
+        ark_binary_data.expect_uint32(0)
         ark_binary_data.read_uint32() # size of the data in bytes
-        ark_binary_data.validate_byte(0)
+        ark_binary_data.expect_byte(0)
         nr_of_values = ark_binary_data.read_uint32()
 
         floats = [ark_binary_data.read_float() for _ in range(nr_of_values)]
@@ -173,13 +181,13 @@ class ArkCustomItemData:
         return floats   
     
     def __read_custom_data_classes(self, ark_binary_data: "ArkBinaryParser"):
-        ark_binary_data.validate_name("CustomDataClasses")
-        ark_binary_data.validate_name("ArrayProperty")
-        ark_binary_data.validate_uint32(1)
-        ark_binary_data.validate_name("ObjectProperty")
-        ark_binary_data.validate_uint32(0)
+        ark_binary_data.expect_name("CustomDataClasses")
+        ark_binary_data.expect_name("ArrayProperty")
+        ark_binary_data.expect_uint32(1)
+        ark_binary_data.expect_name("ObjectProperty")
+        ark_binary_data.expect_uint32(0)
         ark_binary_data.read_uint32() # size of the data in bytes
-        ark_binary_data.validate_byte(0)
+        ark_binary_data.expect_byte(0)
         
         nr_of_values = ark_binary_data.read_uint32()
         objects = []
@@ -190,13 +198,13 @@ class ArkCustomItemData:
         return objects
     
     def __read_custom_data_objects(self, ark_binary_data: "ArkBinaryParser"):
-        ark_binary_data.validate_name("CustomDataObjects")
-        ark_binary_data.validate_name("ArrayProperty")
-        ark_binary_data.validate_uint32(1)
-        ark_binary_data.validate_name("ObjectProperty")
-        ark_binary_data.validate_uint32(0)
+        ark_binary_data.expect_name("CustomDataObjects")
+        ark_binary_data.expect_name("ArrayProperty")
+        ark_binary_data.expect_uint32(1)
+        ark_binary_data.expect_name("ObjectProperty")
+        ark_binary_data.expect_uint32(0)
         ark_binary_data.read_uint32() # size of the data in bytes
-        ark_binary_data.validate_byte(0)
+        ark_binary_data.expect_byte(0)
         
         nr_of_values = ark_binary_data.read_uint32()
         objects = []
@@ -207,13 +215,13 @@ class ArkCustomItemData:
         return objects
     
     def __read_custom_data_names(self, ark_binary_data: "ArkBinaryParser"):
-        ark_binary_data.validate_name("CustomDataNames")
-        ark_binary_data.validate_name("ArrayProperty")
-        ark_binary_data.validate_uint32(1)
-        ark_binary_data.validate_name("NameProperty")
-        ark_binary_data.validate_uint32(0)
+        ark_binary_data.expect_name("CustomDataNames")
+        ark_binary_data.expect_name("ArrayProperty")
+        ark_binary_data.expect_uint32(1)
+        ark_binary_data.expect_name("NameProperty")
+        ark_binary_data.expect_uint32(0)
         ark_binary_data.read_uint32() # size of the data in bytes
-        ark_binary_data.validate_byte(0)
+        ark_binary_data.expect_byte(0)
         nr_of_values = ark_binary_data.read_uint32()
 
         names = [ark_binary_data.read_name() for _ in range(nr_of_values)]
@@ -221,17 +229,17 @@ class ArkCustomItemData:
         return names
     
     def __read_painting_id_map(self, ark_binary_data: "ArkBinaryParser"):
-        ark_binary_data.validate_name("UniquePaintingIdMap")
-        ark_binary_data.validate_name("ArrayProperty")
-        ark_binary_data.validate_uint32(1)
-        ark_binary_data.validate_name("StructProperty")
-        ark_binary_data.validate_uint32(1)
-        ark_binary_data.validate_name("PaintingKeyValue")
-        ark_binary_data.validate_uint32(1)
-        ark_binary_data.validate_name("/Script/ShooterGame")
-        ark_binary_data.validate_uint32(0)
+        ark_binary_data.expect_name("UniquePaintingIdMap")
+        ark_binary_data.expect_name("ArrayProperty")
+        ark_binary_data.expect_uint32(1)
+        ark_binary_data.expect_name("StructProperty")
+        ark_binary_data.expect_uint32(1)
+        ark_binary_data.expect_name("PaintingKeyValue")
+        ark_binary_data.expect_uint32(1)
+        ark_binary_data.expect_name("/Script/ShooterGame")
+        ark_binary_data.expect_uint32(0)
         ark_binary_data.read_uint32() # size of the data in bytes
-        ark_binary_data.validate_byte(0)
+        ark_binary_data.expect_byte(0)
         nr_of_pairs = ark_binary_data.read_uint32()
 
         for _ in range(nr_of_pairs):
@@ -241,20 +249,20 @@ class ArkCustomItemData:
             self.painting_id_map.append(pair)
 
         if nr_of_pairs > 0:
-            ark_binary_data.validate_name("None")
+            ark_binary_data.expect_name("None")
         
     def __read_painting_revision_map(self, ark_binary_data: "ArkBinaryParser"):
-        ark_binary_data.validate_name("PaintingRevisionMap")
-        ark_binary_data.validate_name("ArrayProperty")
-        ark_binary_data.validate_uint32(1)
-        ark_binary_data.validate_name("StructProperty")
-        ark_binary_data.validate_uint32(1)
-        ark_binary_data.validate_name("PaintingKeyValue")
-        ark_binary_data.validate_uint32(1)
-        ark_binary_data.validate_name("/Script/ShooterGame")
-        ark_binary_data.validate_uint32(0)
+        ark_binary_data.expect_name("PaintingRevisionMap")
+        ark_binary_data.expect_name("ArrayProperty")
+        ark_binary_data.expect_uint32(1)
+        ark_binary_data.expect_name("StructProperty")
+        ark_binary_data.expect_uint32(1)
+        ark_binary_data.expect_name("PaintingKeyValue")
+        ark_binary_data.expect_uint32(1)
+        ark_binary_data.expect_name("/Script/ShooterGame")
+        ark_binary_data.expect_uint32(0)
         ark_binary_data.read_uint32()
-        ark_binary_data.validate_byte(0)
+        ark_binary_data.expect_byte(0)
         nr_of_pairs = ark_binary_data.read_uint32()
 
         for _ in range(nr_of_pairs):
@@ -264,49 +272,49 @@ class ArkCustomItemData:
             self.painting_revision_map.append(pair)
 
         if nr_of_pairs > 0:
-            ark_binary_data.validate_name("None")
+            ark_binary_data.expect_name("None")
         
     def __read_custom_data_name(self, ark_binary_data: "ArkBinaryParser"):
-        ark_binary_data.validate_name("CustomDataName")
-        ark_binary_data.validate_name("NameProperty")
-        ark_binary_data.validate_uint32(0)
+        ark_binary_data.expect_name("CustomDataName")
+        ark_binary_data.expect_name("NameProperty")
+        ark_binary_data.expect_uint32(0)
         ark_binary_data.read_uint32()  # size of the data in bytes
-        ark_binary_data.validate_byte(0)
+        ark_binary_data.expect_byte(0)
 
         name = ark_binary_data.read_name()
 
         return name
     
     def __read_custom_data_soft_classes(self, ark_binary_data: "ArkBinaryParser"):
-        ark_binary_data.validate_name("CustomDataSoftClasses")
-        ark_binary_data.validate_name("ArrayProperty")
-        ark_binary_data.validate_uint32(1)
-        ark_binary_data.validate_name("SoftObjectProperty")
-        ark_binary_data.validate_uint32(0)
+        ark_binary_data.expect_name("CustomDataSoftClasses")
+        ark_binary_data.expect_name("ArrayProperty")
+        ark_binary_data.expect_uint32(1)
+        ark_binary_data.expect_name("SoftObjectProperty")
+        ark_binary_data.expect_uint32(0)
         ark_binary_data.read_uint32()
-        ark_binary_data.validate_byte(0)
+        ark_binary_data.expect_byte(0)
 
         nr_of_values = ark_binary_data.read_uint32()
         soft_classes = []
 
         for _ in range(nr_of_values):
             obj_name = ark_binary_data.read_name()
-            ark_binary_data.validate_uint32(0)
+            ark_binary_data.expect_uint32(0)
             soft_classes.append(obj_name)
 
         return soft_classes
 
     def __read_struct_start(self, ark_binary_data: "ArkBinaryParser", name: str, content_type: str):
-        ark_binary_data.validate_name(name)
-        ark_binary_data.validate_name("StructProperty")
-        ark_binary_data.validate_uint32(1)
-        ark_binary_data.validate_name(content_type)
-        ark_binary_data.validate_uint32(1)
-        ark_binary_data.validate_name("/Script/ShooterGame")
-        ark_binary_data.validate_uint32(0)
+        ark_binary_data.expect_name(name)
+        ark_binary_data.expect_name("StructProperty")
+        ark_binary_data.expect_uint32(1)
+        ark_binary_data.expect_name(content_type)
+        ark_binary_data.expect_uint32(1)
+        ark_binary_data.expect_name("/Script/ShooterGame")
+        ark_binary_data.expect_uint32(0)
 
         data_size = ark_binary_data.read_uint32()
-        ark_binary_data.validate_byte(0)
+        ark_binary_data.expect_byte(0)
 
         return data_size
     
\ No newline at end of file
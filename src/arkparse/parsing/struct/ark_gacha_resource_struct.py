@@ -18,6 +18,6 @@ class ArkGachaResourceStruct:
         self.class_name = or_name.replace("BlueprintGeneratedClass ", "")
         name = ark_binary_data.peek_name()
         self.base_quantity = ark_binary_data.parse_float_property(name)
-        ark_binary_data.validate_name("None")
+        ark_binary_data.expect_name("None")
 
         ArkSaveLogger.parser_log(f"ArkGachaResourceStruct: {self.class_name}, {self.base_quantity}")
\ No newline at end of file
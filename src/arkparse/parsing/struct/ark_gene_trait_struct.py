@@ -22,6 +22,6 @@ class ArkGeneTraitStruct:
         self.class_name = or_name.replace("BlueprintGeneratedClass ", "")
         name = ark_binary_data.peek_name()
         self.name = ark_binary_data.parse_name_property(name)
-        ark_binary_data.validate_name("None")
+        ark_binary_data.expect_name("None")
 
         ArkSaveLogger.parser_log(f"ArkGeneTraitStruct: {self.unique_id}, {self.class_name}, {self.name}")
\ No newline at end of file
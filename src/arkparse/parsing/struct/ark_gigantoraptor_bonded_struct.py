@@ -21,6 +21,6 @@ class ArkGigantoraptorBondedStruct:
         self.dino_class = ark_binary_data.parse_soft_object_property(name)
         name = ark_binary_data.peek_name()
         self.dino_name = ark_binary_data.parse_string_property(name)
-        ark_binary_data.validate_name("None")
+        ark_binary_data.expect_name("None")
 
         ArkSaveLogger.parser_log(f"ArkGigantoraptorBondedStruct: {self.dino_class}, {self.dino_name} (ID1: {self.id1}, ID2: {self.id2})")
\ No newline at end of file
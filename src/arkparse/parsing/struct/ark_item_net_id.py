@@ -13,7 +13,7 @@ class ArkItemNetId:
     def __init__(self, byte_buffer: "ArkBinaryParser"):
         self.id1 = byte_buffer.parse_uint32_property("ItemID1")
         self.id2 = byte_buffer.parse_uint32_property("ItemID2")
-        byte_buffer.validate_name("None")
+        byte_buffer.expect_name("None")
 
         ArkSaveLogger.parser_log(f"ArkItemNetId: {self.id1}, {self.id2}")
 
@@ -10,17 +10,17 @@ class ArkKeyValuePair:
     value: str
 
     def __init__(self, binary_data: "ArkBinaryParser"):
-        binary_data.validate_name("Key")
-        binary_data.validate_name("IntProperty")
-        binary_data.validate_uint32(0)
-        binary_data.validate_uint32(4) #size 
-        binary_data.validate_byte(0)
+        binary_data.expect_name("Key")
+        binary_data.expect_name("IntProperty")
+        binary_data.expect_uint32(0)
+        binary_data.expect_uint32(4) #size 
+        binary_data.expect_byte(0)
         self.key = binary_data.read_int()
 
-        binary_data.validate_name("Value")
-        binary_data.validate_name("IntProperty")
-        binary_data.validate_uint32(0)
-        binary_data.validate_uint32(4)
-        binary_data.validate_byte(0)
+        binary_data.expect_name("Value")
+        binary_data.expect_name("IntProperty")
+        binary_data.expect_uint32(0)
+        binary_data.expect_uint32(4)
+        binary_data.expect_byte(0)
         self.value = binary_data.read_int()
 
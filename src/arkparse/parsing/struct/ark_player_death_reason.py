@@ -18,8 +18,8 @@ class ArkPlayerDeathReason:
         self.player_id = ark_binary_data.parse_int32_property("PlayerID")
         self.reason = ark_binary_data.parse_string_property("DeathReason")
         self.time = ark_binary_data.parse_double_property("DiedAtTime")
-        ark_binary_data.validate_name("DeathLocation")
+        ark_binary_data.expect_name("DeathLocation")
         self.location = ArkVector(ark_binary_data, from_struct=True)
-        ark_binary_data.validate_name("None")
+        ark_binary_data.expect_name("None")
 
         ArkSaveLogger.parser_log(f"ArkPlayerDeathReason: {self.player_id}, {self.reason}, {self.time}, {self.location}")
\ No newline at end of file
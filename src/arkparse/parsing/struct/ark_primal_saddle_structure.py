@@ -17,18 +17,18 @@ class ArkPrimalSaddleStructure:
 
 
     def __init__(self, ark_binary_data: "ArkBinaryParser"):
-        ark_binary_data.validate_name("DinoRelativeLocation")
+        ark_binary_data.expect_name("DinoRelativeLocation")
         self.location = ArkVector(ark_binary_data, from_struct=True)
-        ark_binary_data.validate_name("DinoRelativeRotation")
+        ark_binary_data.expect_name("DinoRelativeRotation")
         self.rotation = ArkRotator(ark_binary_data, from_struct=True)
         self.bone_name = ark_binary_data.parse_name_property("BoneName")
-        ark_binary_data.validate_name("MyStructure")
-        ark_binary_data.validate_name("ObjectProperty")
-        ark_binary_data.validate_uint32(0)
-        ark_binary_data.validate_uint32(0x12)
-        ark_binary_data.validate_byte(0)
-        ark_binary_data.validate_uint16(0)
+        ark_binary_data.expect_name("MyStructure")
+        ark_binary_data.expect_name("ObjectProperty")
+        ark_binary_data.expect_uint32(0)
+        ark_binary_data.expect_uint32(0x12)
+        ark_binary_data.expect_byte(0)
+        ark_binary_data.expect_uint16(0)
         self.my_structure = ark_binary_data.read_uuid()
-        ark_binary_data.validate_name("None")
+        ark_binary_data.expect_name("None")
 
         ArkSaveLogger.parser_log(f"ArkPrimalSaddleStructure: {self.location}, {self.rotation}, {self.bone_name}, {self.my_structure}")
\ No newline at end of file
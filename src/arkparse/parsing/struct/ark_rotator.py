@@ -12,14 +12,14 @@ class ArkRotator:
 
     def __init__(self, binary_data: "ArkBinaryParser", from_struct: bool = False):
         if from_struct:
-            binary_data.validate_name("StructProperty")
-            binary_data.validate_uint32(1)
-            binary_data.validate_name("Rotator")
-            binary_data.validate_uint32(1)
-            binary_data.validate_name("/Script/CoreUObject")
-            binary_data.validate_uint32(0)
-            binary_data.validate_uint32(0x18)
-            binary_data.validate_byte(8)
+            binary_data.expect_name("StructProperty")
+            binary_data.expect_uint32(1)
+            binary_data.expect_name("Rotator")
+            binary_data.expect_uint32(1)
+            binary_data.expect_name("/Script/CoreUObject")
+            binary_data.expect_uint32(0)
+            binary_data.expect_uint32(0x18)
+            binary_data.expect_byte(8)
 
         self.pitch = binary_data.read_double()
         self.yaw = binary_data.read_double()
@@ -16,20 +16,20 @@ class ArkServerCustomFolder:
         self.inventory_comp_type = ark_binary_data.parse_int32_property("InventoryCompType")
         self.name = ark_binary_data.parse_string_property("FolderName")
         self.__read_custom_folder_ids(ark_binary_data)
-        ark_binary_data.validate_name("None")
+        ark_binary_data.expect_name("None")
 
         ArkSaveLogger.parser_log(f"ArkServerCustomFolder: {self.inventory_comp_type}, {self.name}, {len(self.custom_folder_ids)} items")
 
     def __read_custom_folder_ids(self, ark_binary_data: "ArkBinaryParser"):
-        ark_binary_data.validate_name("CustomFolderItemIds")
-        ark_binary_data.validate_name("ArrayProperty")
-        ark_binary_data.validate_uint32(1)
-        ark_binary_data.validate_name("StructProperty")
-        ark_binary_data.validate_uint32(1)
-        ark_binary_data.validate_name("ItemNetID")
-        ark_binary_data.validate_uint32(1)
-        ark_binary_data.validate_name("/Script/ShooterGame")
-        ark_binary_data.validate_uint32(0)
+        ark_binary_data.expect_name("CustomFolderItemIds")
+        ark_binary_data.expect_name("ArrayProperty")
+        ark_binary_data.expect_uint32(1)
+        ark_binary_data.expect_name("StructProperty")
+        ark_binary_data.expect_uint32(1)
+        ark_binary_data.expect_name("ItemNetID")
+        ark_binary_data.expect_uint32(1)
+        ark_binary_data.expect_name("/Script/ShooterGame")
+        ark_binary_data.expect_uint32(0)
         byte = ark_binary_data.read_byte()  # V14 unknown byte
         pos = ark_binary_data.read_uint32()
         array_length = ark_binary_data.read_uint32()
@@ -16,33 +16,33 @@ class ArkTrackedActorIdCategoryPairWithBool:
 
     def __init__(self, byte_buffer: "ArkBinaryParser"):
 
-        byte_buffer.validate_string("ID")
-        byte_buffer.validate_string("IntProperty")
-        byte_buffer.validate_uint32(0)
-        byte_buffer.validate_uint32(4)
+        byte_buffer.expect_string("ID")
+        byte_buffer.expect_string("IntProperty")
+        byte_buffer.expect_uint32(0)
+        byte_buffer.expect_uint32(4)
         byte_buffer.skip_bytes(1)
 
         self.id_ = byte_buffer.read_int()
 
-        byte_buffer.validate_string("Category")
-        byte_buffer.validate_string("ByteProperty")
+        byte_buffer.expect_string("Category")
+        byte_buffer.expect_string("ByteProperty")
 
         byte_buffer.read_uint32()
         
-        byte_buffer.validate_string("ETrackedActorCategory")
-        byte_buffer.validate_uint32(1)
-        byte_buffer.validate_string("/Script/ShooterGame")
-        byte_buffer.validate_uint32(0)
+        byte_buffer.expect_string("ETrackedActorCategory")
+        byte_buffer.expect_uint32(1)
+        byte_buffer.expect_string("/Script/ShooterGame")
+        byte_buffer.expect_uint32(0)
         self.cat_byte = byte_buffer.read_byte()
-        byte_buffer.validate_uint32(0)
+        byte_buffer.expect_uint32(0)
         self.category = ArkEnumValue(byte_buffer.read_string())
 
-        byte_buffer.validate_string("BoolVal")
-        byte_buffer.validate_string("BoolProperty")
-        byte_buffer.validate_uint64(0)
+        byte_buffer.expect_string("BoolVal")
+        byte_buffer.expect_string("BoolProperty")
+        byte_buffer.expect_uint64(0)
         self.bool_ = byte_buffer.read_byte() != 0
 
-        byte_buffer.validate_string("None")
+        byte_buffer.expect_string("None")
 
         ArkSaveLogger.parser_log(f"Read tracked actor id category pair with bool: {self}")
 
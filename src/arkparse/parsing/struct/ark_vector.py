@@ -13,14 +13,14 @@ class ArkVector:
 
     def __init__(self, byte_buffer: "ArkBinaryParser" = None, x: float = 0.0, y: float = 0.0, z: float = 0.0, from_struct: bool = False):
         if from_struct:
-            byte_buffer.validate_name("StructProperty")
-            byte_buffer.validate_uint32(1)
-            byte_buffer.validate_name("Vector")
-            byte_buffer.validate_uint32(1)
-            byte_buffer.validate_name("/Script/CoreUObject")
-            byte_buffer.validate_uint32(0)
-            byte_buffer.validate_uint32(0x18)
-            byte_buffer.validate_byte(8)
+            byte_buffer.expect_name("StructProperty")
+            byte_buffer.expect_uint32(1)
+            byte_buffer.expect_name("Vector")
+            byte_buffer.expect_uint32(1)
+            byte_buffer.expect_name("/Script/CoreUObject")
+            byte_buffer.expect_uint32(0)
+            byte_buffer.expect_uint32(0x18)
+            byte_buffer.expect_byte(8)
 
         if byte_buffer:
             self.x = byte_buffer.read_double()
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from uuid import UUID
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 from arkparse.logging import ArkSaveLogger
 
 if TYPE_CHECKING:
@@ -20,6 +20,9 @@ class ObjectReference:
     value: any
 
     def __init__(self, reader: "ArkBinaryParser" = None):
+        # TYPE_UUID references keep the raw 16 bytes, value (the UUID string) and uuid are only built on first access
+        self.raw: Optional[bytes] = None
+        self._uuid = None
         if reader is None:
             self.value = None
             return
@@ -34,7 +37,7 @@ class ObjectReference:
                 self.value = reader.read_name()
             elif type == ObjectReference.TYPE_UUID:
                 self.type = ObjectReference.TYPE_UUID
-                self.value = reader.read_uuid_as_string()
+                self.raw = reader.read_bytes(16)
             elif type == ObjectReference.TYPE_ID:
                 self.type = ObjectReference.TYPE_ID
                 self.value = reader.read_int()
@@ -60,6 +63,29 @@ class ObjectReference:
             self.type = ObjectReference.TYPE_PATH_NO_TYPE
             self.value = reader.read_string()
 
+    def __getattr__(self, name: str):
+        # Only called for attributes that are not set, for value that is a UUID reference not formatted yet
+        raw = self.__dict__.get("raw")
+        if name == "value" and raw is not None:
+            self.value = str(self.uuid)
+            return self.value
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    @property
+    def uuid(self) -> Optional[UUID]:
+        """The referenced object as UUID, None for non UUID references"""
+        if self.raw is None:
+            return None
+        if self._uuid is None:
+            self._uuid = UUID(bytes=self.raw)
+        return self._uuid
+
+    def to_json_dict(self) -> dict:
+        """JSON form used by DefaultJsonEncoder, type and value like before references kept their raw bytes"""
+        result = {"type": self.type} if "type" in self.__dict__ else {}
+        result["value"] = self.value
+        return result
+
 def get_uuid_reference_bytes(uuid: UUID) -> bytes:
     bytes_ = bytearray()
     bytes_.extend(0x0000.to_bytes(2, byteorder="little"))
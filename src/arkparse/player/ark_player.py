@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Union
 from uuid import UUID
 
 from arkparse.parsing import ArkPropertyContainer
@@ -85,7 +85,7 @@ class ArkPlayer:
         self.config = ArkCharacterConfig(props)
         self.stats = ArkCharacterStats(props)
     
-    def __init__(self, file: Path, from_store: bool):
+    def __init__(self, file: Union[Path, bytes, memoryview], from_store: bool):
         _archive = ArkArchive(file, from_store)
         
         self.player_data = _archive.get_object_by_class("/Game/PrimalEarth/CoreBlueprints/PrimalPlayerDataBP.PrimalPlayerDataBP_C")
@@ -100,7 +100,7 @@ class ArkPlayer:
 
     def get_location_and_inventory(self, save: AsaSave, pawn: ArkGameObject):
         self.location = ActorTransform(vector = pawn.get_property_value("SavedBaseWorldLocation"))
-        inv_uuid = UUID(pawn.get_property_value("MyInventoryComponent").value)
+        inv_uuid = pawn.get_property_value("MyInventoryComponent").uuid
         reader = ArkBinaryParser(save.get_game_obj_binary(inv_uuid), save.save_context)
         self.inventory = Inventory(inv_uuid, reader, save=save)
 
@@ -1,24 +1,55 @@
+import functools
 import logging
 import sqlite3
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Optional, Collection
+from typing import Callable, Dict, Optional, Collection, Iterable, Iterator, List, Set, Tuple, Union
 import uuid
 
 from arkparse.logging import ArkSaveLogger
 
 from arkparse.parsing.game_object_reader_configuration import GameObjectReaderConfiguration
 from arkparse.parsing.ark_binary_parser import ArkBinaryParser
+from arkparse.parsing.struct import ActorTransform
 from arkparse.object_model.misc.__parsed_object_base import ParsedObjectBase
 
 from .header_location import HeaderLocation
 from arkparse.object_model.ark_game_object import ArkGameObject
 from .save_context import SaveContext
+from .save_index import SaveIndex
+from .blob_reader import BlobReader
+from .compaction import CompactionReport, DeletionReport, collect_deletion, find_garbage
+from .extraction import ACTOR_TRANSFORMS, ExtractionReport, write_subset
+from .sql_functions import GameObjectSqlFunctions
 from arkparse.utils import TEMP_FILES_DIR
+from arkparse.utils.byte_search import MultiPatternSearch, search_table
 
 logger = logging.getLogger(__name__)
 
+def _serialized_write(method):
+    # Runs a modifying method holding the write lock, on the read-write connection (see AsaSave.write_session)
+    @functools.wraps(method)
+    def wrapper(self: "AsaSave", *args, **kwargs):
+        with self.write_session():
+            return method(self, *args, **kwargs)
+    return wrapper
+
 class AsaSave:
     MAX_IN_LIST = 10000
+    # Seconds a connection waits for a lock held by another connection (readers of other threads or the writer)
+    LOCK_TIMEOUT = 60
+    # Keys per "WHERE key IN (...)" query, below the host parameter limit of older SQLite builds
+    PREFETCH_CHUNK_SIZE = 900
+    # Objects whose binaries (and referenced components) are prefetched and released together by the apis
+    PREFETCH_BATCH_SIZE = 5000
+    # Properties referencing component objects that are loaded together with their owner
+    PREFETCH_REFERENCE_PROPERTIES = ("MyCharacterStatusComponent", "MyInventoryComponent", "InventoryItems")
+    # Leading bytes of an object that hold its class name, a name id or (without name table) a string
+    CLASS_NAME_PREFIX_SIZE = 1024
+    # uuid + ActorTransform (6 doubles and a uint64)
+    ACTOR_TRANSFORM_ENTRY_SIZE = 16 + 7 * 8
+    ACTOR_TRANSFORM_CHUNK_ENTRIES = 65536
     nr_parsed = 0
     parsed_objects: Dict[uuid.UUID, ArkGameObject] = {}
 
@@ -27,12 +58,24 @@ class AsaSave:
     last_name_end = 0   
     faulty_objects = 0
 
-    def __init__(self, path: Path = None, contents: bytes = None, read_only: bool = False):
+    def __init__(self, path: Path = None, contents: bytes = None, read_only: bool = False, trusted: bool = False,
+                 working_copy: Path = None, save_context: SaveContext = None):
+        """
+        Loads the save from path or contents into a temporary working copy. With working_copy and save_context,
+        the working copy of another (loaded) save is opened read-only instead, without copying it or reading the
+        header and actor transforms again, e.g. in worker processes. That copy is not removed by this instance.
+        """
 
         # create temp copy of file
         temp_save_path = TEMP_FILES_DIR / (str(uuid.uuid4()) + ".ark")
-
-        if path is not None:
+        self.owns_working_copy = working_copy is None
+
+        if working_copy is not None:
+            if save_context is None:
+                raise ValueError("The save context of the working copy must be provided")
+            temp_save_path = Path(working_copy)
+            read_only = True
+        elif path is not None:
             with open(path, 'rb') as file:
                 with open(temp_save_path, 'wb') as temp_file:
                     temp_file.write(file.read())
@@ -43,31 +86,126 @@ class AsaSave:
             raise ValueError("Either path or contents must be provided")
 
         self.save_dir = path.parent if path is not None else None
+        self.save_path = path
+        # Optional sidecar index, see use_index
+        self.index: Optional[SaveIndex] = None
+        self.index_snapshot: Optional[int] = None
         self.sqlite_db = temp_save_path
-        self.save_context = SaveContext()
+        self.save_context = save_context if save_context is not None else SaveContext()
+        self.prefetched_binaries: Dict[uuid.UUID, bytes] = {}
+        if save_context is None:
+            # Trusted saves are parsed without the expect_* checks, keep strict (default) for debugging.
+            # A context passed in keeps its own setting.
+            self.save_context.trusted = trusted
         self.var_objects = {}
         self.var_objects["placed_structs"] = {}
         self.var_objects["g_placed_structs"] = {}
         
+        # Only write sessions use the read-write connection, every thread (also the opening one) reads
+        # through its own read-only connection to the same file, see read_session and write_session
+        self.owner_thread = threading.get_ident()
+        self.write_lock = threading.RLock()
+        self.__local = threading.local()
+        self.__thread_connections: List[sqlite3.Connection] = []
+        self.__thread_connections_lock = threading.Lock()
+
+        # ark_class, ark_prop_int, ... for filtering in SQL, see select_obj_uuids
+        self.sql_functions = GameObjectSqlFunctions(self.save_context)
 
         conn_str = f"file:{temp_save_path}?mode={'ro' if read_only else 'rw'}"
-        self.connection = sqlite3.connect(conn_str, uri=True)
+        self.connection = sqlite3.connect(conn_str, uri=True, timeout=self.LOCK_TIMEOUT, check_same_thread=False)
+        self.sql_functions.register(self.__connection)
+        if not read_only:
+            # Readers do not block the writer (and the other way around) in WAL mode, with a rollback
+            # journal a commit waits until no other connection is reading, see store_db for the copies
+            self.__connection.execute("PRAGMA journal_mode=WAL")
         
-        self.list_all_items_in_db()
-        self.read_header()
-        self.read_actor_locations()
+        if working_copy is None:
+            self.list_all_items_in_db()
+            self.read_header()
+            self.read_actor_locations()
         self.profile_data_in_db = self.profile_data_in_saves()
 
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Read-only connection of the calling thread, the read-write connection inside a write session"""
+        if getattr(self.__local, "writing", 0) > 0:
+            return self.__connection
+        connection = getattr(self.__local, "connection", None)
+        if connection is None:
+            connection = self.__open_thread_connection()
+        return connection
+
+    @connection.setter
+    def connection(self, connection: sqlite3.Connection):
+        self.__connection = connection
+
+    def __open_thread_connection(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(f"file:{self.sqlite_db}?mode=ro", uri=True, timeout=self.LOCK_TIMEOUT, check_same_thread=False)
+        self.sql_functions.register(connection)
+        self.__local.connection = connection
+        with self.__thread_connections_lock:
+            self.__thread_connections.append(connection)
+        return connection
+
+    def __close_thread_connection(self):
+        connection = getattr(self.__local, "connection", None)
+        if connection is None:
+            return
+        self.__local.connection = None
+        with self.__thread_connections_lock:
+            if connection in self.__thread_connections:
+                self.__thread_connections.remove(connection)
+        connection.close()
+
+    @contextmanager
+    def read_session(self) -> Iterator[sqlite3.Connection]:
+        """
+        Scope for reading the save from another thread than the one that loaded it, for example per request of a
+        web service. Every thread reads through its own read-only connection to the same file, sharing the save
+        context (name table, actor transforms) and the parsed object cache with all other threads, so loading is
+        not repeated. The connection is closed when the outermost session of the thread ends. Without a session
+        (and for the opening thread) the connection stays open until the save is closed.
+        """
+        depth = getattr(self.__local, "sessions", 0)
+        self.__local.sessions = depth + 1
+        try:
+            yield self.connection
+        finally:
+            self.__local.sessions = depth
+            if depth == 0 and threading.get_ident() != self.owner_thread:
+                self.__close_thread_connection()
+
+    @contextmanager
+    def write_session(self) -> Iterator[sqlite3.Connection]:
+        """
+        Holds the write lock and routes self.connection of the calling thread to the read-write connection,
+        so modifications from several threads are applied one at a time. All modifying methods of AsaSave
+        use it, callers can use it to group several modifications and the reads they depend on. Outside a
+        write session no thread uses the read-write connection, so a commit or rollback of the writer is
+        never mixed up with the reads of another thread.
+        """
+        with self.write_lock:
+            self.__local.writing = getattr(self.__local, "writing", 0) + 1
+            try:
+                yield self.__connection
+            finally:
+                self.__local.writing -= 1
+
     def __del__(self):
         self.close()
 
-        # clean up temp file
-        if self.sqlite_db.exists():
-            self.sqlite_db.unlink()
+        # clean up temp file (and the WAL files, normally removed when the last connection closes)
+        if not self.owns_working_copy:
+            return
+        for path in (self.sqlite_db, Path(f"{self.sqlite_db}-wal"), Path(f"{self.sqlite_db}-shm")):
+            if path.exists():
+                path.unlink()
 
     def profile_data_in_saves(self) -> bool:
-        parser: ArkBinaryParser = self.get_custom_value("GameModeCustomBytes")
-        if len(parser.byte_buffer) < 30:
+        # Only the size is needed, GameModeCustomBytes can be hundreds of MB
+        blob = self.get_custom_blob("GameModeCustomBytes")
+        if blob is None or len(blob) < 30:
             ArkSaveLogger.save_log("GameModeCustomBytes is too short, profile data not in saves")
             return False
         return True
@@ -90,14 +228,31 @@ class AsaSave:
                 ArkSaveLogger.save_log(f"Custom key: {row[0]}")
 
     def read_actor_locations(self):
-        actor_transforms = self.get_custom_value("ActorTransforms")
+        actor_transforms = self.get_custom_blob("ActorTransforms")
         ArkSaveLogger.save_log("Actor transforms table retrieved")
         if actor_transforms:
-            at, atp = actor_transforms.read_actor_transforms()
+            at, atp = self.__read_actor_transforms(actor_transforms)
             self.save_context.actor_transforms = at
             self.save_context.actor_transform_positions = atp
         # print(f"Lenght of actor transforms: {len(self.save_context.actor_transforms)}")
 
+    def __read_actor_transforms(self, blob: BlobReader) -> Tuple[Dict[uuid.UUID, ActorTransform], Dict[uuid.UUID, int]]:
+        # Same as ArkBinaryParser.read_actor_transforms, chunk by chunk of whole entries,
+        # positions are the offsets of the uuid of every entry
+        actor_transforms = {}
+        actor_transform_positions = {}
+        termination_uuid = uuid.UUID(int=0)
+        for offset, chunk in blob.chunks(self.ACTOR_TRANSFORM_ENTRY_SIZE * self.ACTOR_TRANSFORM_CHUNK_ENTRIES):
+            reader = ArkBinaryParser(chunk, self.save_context)
+            while reader.size() - reader.position >= 16:
+                position = offset + reader.position
+                obj_uuid = reader.read_uuid()
+                if obj_uuid == termination_uuid:
+                    return actor_transforms, actor_transform_positions
+                actor_transforms[obj_uuid] = ActorTransform(reader)
+                actor_transform_positions[obj_uuid] = position
+        return actor_transforms, actor_transform_positions
+
     def read_header(self):
         header_data = self.get_custom_value("SaveHeader")
         ArkSaveLogger.set_file(header_data, "header.bin")
@@ -160,6 +315,7 @@ class AsaSave:
             raise e
         return result
     
+    @_serialized_write
     def add_name_to_name_table(self, name: str):
         header_data = self.get_custom_value("SaveHeader")
         self.name_count += 1
@@ -194,6 +350,10 @@ class AsaSave:
         return parts
     
     def get_game_obj_binary(self, obj_uuid: uuid.UUID) -> Optional[bytes]:
+        prefetched = self.prefetched_binaries.get(obj_uuid)
+        if prefetched is not None:
+            return prefetched
+
         query = "SELECT value FROM game WHERE key = ?"
         cursor = self.connection.cursor()
         cursor.execute(query, (self.uuid_to_byte_array(obj_uuid),))
@@ -203,43 +363,151 @@ class AsaSave:
 
         return row[0]
     
+    def prefetch_game_objects(self, obj_uuids: Iterable[uuid.UUID]) -> Dict[uuid.UUID, Optional['ArkGameObject']]:
+        """
+        Loads the binaries of the given objects with chunked "WHERE key IN (...)" queries
+        and parses the ones that are not cached yet, so that constructing the object model
+        afterwards does not need a query per object.
+        """
+        obj_uuids = list(dict.fromkeys(obj_uuids))
+        missing = [u for u in obj_uuids if u not in self.prefetched_binaries]
+        cursor = self.connection.cursor()
+
+        for i in range(0, len(missing), self.PREFETCH_CHUNK_SIZE):
+            chunk = missing[i:i + self.PREFETCH_CHUNK_SIZE]
+            query = f"SELECT key, value FROM game WHERE key IN ({','.join('?' * len(chunk))})"
+            cursor.execute(query, [self.uuid_to_byte_array(u) for u in chunk])
+            for key, value in cursor.fetchall():
+                obj_uuid = self.byte_array_to_uuid(key)
+                self.prefetched_binaries[obj_uuid] = value
+
+                if obj_uuid not in self.parsed_objects:
+                    reader = ArkBinaryParser(value, self.save_context)
+                    obj = self.parse_as_predefined_object(obj_uuid, reader.read_name(), reader)
+                    if obj:
+                        self.parsed_objects[obj_uuid] = obj
+
+        ArkSaveLogger.save_log(f"Prefetched {len(missing)} objects in {(len(missing) + self.PREFETCH_CHUNK_SIZE - 1) // self.PREFETCH_CHUNK_SIZE} queries")
+        return {u: self.parsed_objects.get(u) for u in obj_uuids}
+
+    def prefetch_references(self, objects: Iterable['ArkGameObject'], properties: Iterable[str] = PREFETCH_REFERENCE_PROPERTIES, depth: int = 2) -> List[uuid.UUID]:
+        """
+        Prefetches the given objects and everything they reference through the given properties,
+        following the references depth levels deep (dino -> inventory -> items). Returns the uuids
+        of the binaries that were loaded, to release them with release_prefetched.
+        """
+        objects = [obj for obj in objects if obj is not None]
+        loaded = [obj.uuid for obj in objects if obj.uuid not in self.prefetched_binaries]
+        self.prefetch_game_objects(obj.uuid for obj in objects)
+
+        for _ in range(depth):
+            referenced = []
+            for obj in objects:
+                for name in properties:
+                    value = obj.get_property_value(name)
+                    if value is None:
+                        continue
+                    for ref in (value if isinstance(value, list) else [value]):
+                        ref_uuid = getattr(ref, "uuid", None)
+                        if ref_uuid is not None:
+                            referenced.append(ref_uuid)
+
+            if len(referenced) == 0:
+                break
+            loaded += [obj_uuid for obj_uuid in referenced if obj_uuid not in self.prefetched_binaries]
+            objects = [obj for obj in self.prefetch_game_objects(referenced).values() if obj is not None]
+
+        return list(dict.fromkeys(loaded))
+
+    @contextmanager
+    def prefetched_references(self, objects: Iterable['ArkGameObject'], properties: Iterable[str] = PREFETCH_REFERENCE_PROPERTIES, depth: int = 2):
+        """Prefetches like prefetch_references for the duration of the block, the loaded binaries are released after it"""
+        loaded = self.prefetch_references(objects, properties, depth)
+        try:
+            yield loaded
+        finally:
+            self.release_prefetched(loaded)
+
+    def release_prefetched(self, obj_uuids: Iterable[uuid.UUID]):
+        for obj_uuid in obj_uuids:
+            self.prefetched_binaries.pop(obj_uuid, None)
+
+    def clear_prefetched(self):
+        self.prefetched_binaries.clear()
+
     def get_parser_for_game_object(self, obj_uuid: uuid.UUID) -> Optional[ArkBinaryParser]:
         binary = self.get_game_obj_binary(obj_uuid)
         if binary is None:
             return None
         return ArkBinaryParser(binary, self.save_context)
     
-    def find_value_in_game_table_objects(self, value: bytes):
-        query = "SELECT key, value FROM game"
-        cursor = self.connection.cursor()
-        cursor.execute(query)
-        for row in cursor:
-            reader = ArkBinaryParser(row[1], self.save_context)
-            result = reader.find_byte_sequence(value, adjust_offset=0)
-
-            for r in result:
-                print(f"Found at {row[0]}, index: {r}")
-
-                obj = self.get_game_object_by_id(self.byte_array_to_uuid(row[0]))
+    def find_values(self, patterns: Iterable[bytes], tables: Iterable[str] = ("game", "custom"), workers: int = 1) -> List[Tuple[Union[uuid.UUID, str], int, bytes]]:
+        """
+        Searches all blobs of the given tables for any of the patterns in a single pass per blob.
+        Returns (row key, offset, pattern) tuples, row keys are UUIDs for the game table.
+        With workers > 1 each table is split over that many processes reading the save file.
+        """
+        patterns = list(patterns)
+        search = MultiPatternSearch(patterns)
+        results = []
+        for table in tables:
+            if workers is not None and workers > 1:
+                rows = search_table(self.sqlite_db, table, patterns, workers)
+            else:
+                cursor = self.connection.cursor()
+                cursor.execute(f"SELECT key, value FROM {table}")
+                rows = search.search_rows(cursor)
+
+            if table == "game":
+                rows = [(self.byte_array_to_uuid(key), offset, pattern) for key, offset, pattern in rows]
+            results.extend(rows)
+        return results
+
+    def find_value_in_game_table_objects(self, value: bytes, workers: int = 1):
+        last_key = None
+        for key, offset, _ in self.find_values([value], tables=("game",), workers=workers):
+            print(f"Found at {key}, index: {offset}")
+
+            if key != last_key:
+                last_key = key
+                obj = self.get_game_object_by_id(key)
                 if obj:
                     print(f"Object: {obj.blueprint}")
             
-    def find_value_in_custom_tables(self, value: bytes):
-        query = "SELECT key, value FROM custom"
-        cursor = self.connection.cursor()
-        cursor.execute(query)
-        for row in cursor:
-            reader = ArkBinaryParser(row[1], self.save_context)
-            result = reader.find_byte_sequence(value, adjust_offset=0)
-
-            for r in result:
-                print(f"Found at {row[0]}, index: {r}")
+    def find_value_in_custom_tables(self, value: bytes, workers: int = 1):
+        for key, offset, _ in self.find_values([value], tables=("custom",), workers=workers):
+            print(f"Found at {key}, index: {offset}")
 
     def get_obj_uuids(self) -> Collection[uuid.UUID]:
         query = "SELECT key FROM game"
         cursor = self.connection.cursor()
         cursor.execute(query)
         return [self.byte_array_to_uuid(row[0]) for row in cursor]
+
+    def select_obj_uuids(self, where: str, params: Iterable = ()) -> List[uuid.UUID]:
+        """
+        Returns the uuids of the game table rows matching an SQL condition on the key and value columns, for example
+        "ark_class(value) LIKE '%Turret%' AND ark_prop_int(value, 'TargetingTeam') = ?", see GameObjectSqlFunctions
+        """
+        cursor = self.connection.execute(f"SELECT key FROM game WHERE {where}", tuple(params))
+        return [self.byte_array_to_uuid(row[0]) for row in cursor]
+    
+    def select_obj_uuids_in_bounds(self, bounds: Tuple[Tuple[float, float], Tuple[float, float]], team: int = None) -> List[uuid.UUID]:
+        """
+        Returns the uuids of the objects with an actor transform inside bounds, ((min x, min y), (max x, max y))
+        in world coordinates, and with the given targeting team if set, e.g. to select a base
+        """
+        (min_x, min_y), (max_x, max_y) = bounds
+        result = [obj_uuid for obj_uuid, transform in self.save_context.actor_transforms.items()
+                  if min_x <= transform.x <= max_x and min_y <= transform.y <= max_y]
+        if team is None:
+            return result
+
+        in_team = []
+        for i in range(0, len(result), self.PREFETCH_CHUNK_SIZE):
+            chunk = [self.uuid_to_byte_array(obj_uuid) for obj_uuid in result[i:i + self.PREFETCH_CHUNK_SIZE]]
+            in_team += self.select_obj_uuids(f"key IN ({','.join('?' * len(chunk))}) AND ark_prop_int(value, 'TargetingTeam') = ?", chunk + [team])
+        return in_team
     
     def print_tables_and_sizes(self):
         query = "SELECT name FROM sqlite_master WHERE type='table'"
@@ -268,7 +536,9 @@ class AsaSave:
     def add_to_db(self, obj: ParsedObjectBase):
         self.add_obj_to_db(obj.object.uuid, obj.binary.byte_buffer)
         
+    @_serialized_write
     def add_obj_to_db(self, obj_uuid: uuid.UUID, obj_data: bytes):
+        self.prefetched_binaries.pop(obj_uuid, None)
         query = "INSERT INTO game (key, value) VALUES (?, ?)"
         with self.connection as conn:
             conn.execute(query, (self.uuid_to_byte_array(obj_uuid), obj_data))
@@ -276,7 +546,9 @@ class AsaSave:
 
         self.get_game_object_by_id(obj_uuid, reparse=True)
 
+    @_serialized_write
     def modify_game_obj(self, obj_uuid: uuid.UUID, obj_data: bytes):
+        self.prefetched_binaries.pop(obj_uuid, None)
         query = "UPDATE game SET value = ? WHERE key = ?"
         with self.connection as conn:
             conn.execute(query, (obj_data, self.uuid_to_byte_array(obj_uuid)))
@@ -284,7 +556,9 @@ class AsaSave:
 
         self.get_game_object_by_id(obj_uuid, reparse=True)
 
+    @_serialized_write
     def remove_obj_from_db(self, obj_uuid: uuid.UUID):
+        self.prefetched_binaries.pop(obj_uuid, None)
         query = "DELETE FROM game WHERE key = ?"
         with self.connection as conn:
             conn.execute(query, (self.uuid_to_byte_array(obj_uuid),))
@@ -293,6 +567,7 @@ class AsaSave:
         if obj_uuid in self.parsed_objects:
             self.parsed_objects.pop(obj_uuid)
 
+    @_serialized_write
     def add_actor_transform(self, uuid: uuid.UUID, binary_data: bytes, no_store: bool = False):
         actor_transforms = self.get_custom_value("ActorTransforms")
 
@@ -310,6 +585,7 @@ class AsaSave:
                 conn.execute(query, (actor_transforms.byte_buffer,))
                 conn.commit()
 
+    @_serialized_write
     def add_actor_transforms(self, new_actor_transforms: bytes):
         actor_transforms = self.get_custom_value("ActorTransforms")
         if actor_transforms:
@@ -321,6 +597,7 @@ class AsaSave:
                 conn.execute(query, (actor_transforms.byte_buffer,))
                 conn.commit()
 
+    @_serialized_write
     def modify_actor_transform(self, uuid: uuid.UUID, binary_data: bytes):
         actor_transforms = self.get_custom_value("ActorTransforms")
 
@@ -334,13 +611,161 @@ class AsaSave:
             with self.connection as conn:
                 conn.execute(query, (actor_transforms.byte_buffer,))
 
+    def delete(self, objects: Iterable[Union[uuid.UUID, ArkGameObject, ParsedObjectBase]], cascade: bool = True) -> DeletionReport:
+        """
+        Deletes the objects (uuids, game objects or object model instances) in one transaction, with one
+        rewrite of the actor transforms. With cascade their inventories, the items in them and their status
+        components are deleted too, see compaction.collect_deletion. Returns what was deleted.
+        """
+        obj_uuids = [self.__uuid_of(obj) for obj in objects]
+        with self.write_session() as conn:
+            report = collect_deletion(self, obj_uuids, cascade)
+            deleted = report.deleted_objects
+            with conn:
+                self.__delete_rows(conn, deleted)
+                report.actor_transforms = self.__rewrite_actor_transforms(conn, set(deleted))
+            self.__forget_objects(deleted)
+
+        ArkSaveLogger.save_log(f"{report}")
+        return report
+
+    @staticmethod
+    def __uuid_of(obj: Union[uuid.UUID, ArkGameObject, ParsedObjectBase]) -> uuid.UUID:
+        if isinstance(obj, uuid.UUID):
+            return obj
+        if isinstance(obj, ParsedObjectBase):
+            return obj.object.uuid
+        return obj.uuid
+
+    def compact(self, dry_run: bool = False, vacuum: bool = True) -> CompactionReport:
+        """
+        Garbage collects the save: items, inventories and status components that no other object
+        references (see compaction.find_garbage) and actor transforms of objects that are not in the
+        game table. With dry_run only the report is made. Otherwise the objects are deleted and the
+        actor transforms rewritten in one transaction, after which the database is vacuumed.
+        """
+        with self.write_session() as conn:
+            report = find_garbage(self)
+            report.dry_run = dry_run
+            report.size_before = self.get_db_size()
+            if dry_run:
+                return report
+
+            garbage = report.unreachable_objects
+            with conn:
+                self.__delete_rows(conn, garbage)
+                self.__rewrite_actor_transforms(conn, set(report.stale_actor_transforms))
+            self.__forget_objects(garbage + report.stale_actor_transforms)
+
+            if vacuum:
+                conn.execute("VACUUM")
+            report.size_after = self.get_db_size()
+
+        ArkSaveLogger.save_log(f"Compacted save: {report}")
+        return report
+
+    def extract(self, path: Path, objects: Iterable[Union[uuid.UUID, ArkGameObject, ParsedObjectBase]], cascade: bool = True) -> ExtractionReport:
+        """
+        Writes a new, minimal save to path with the header and name table of this save, the objects (uuids, game
+        objects or object model instances) and their actor transforms. With cascade their inventories, the items in
+        them and their status components are included too, the same objects a cascading delete would remove.
+        GameModeCustomBytes (profile and tribe data) is copied unchanged.
+        References to objects outside the subset are kept as they are. This save is not modified.
+        """
+        obj_uuids = [self.__uuid_of(obj) for obj in objects]
+        # No modifications in between, the subset is copied from the (committed) database file
+        with self.write_session():
+            selection = collect_deletion(self, obj_uuids, cascade)
+            extracted = selection.deleted_objects
+            included = set(extracted)
+            custom = {}
+            filtered = self.__filter_actor_transforms(lambda obj_uuid: obj_uuid in included)
+            if filtered is not None:
+                custom[ACTOR_TRANSFORMS] = filtered[0]
+            size = write_subset(self.sqlite_db, Path(path), extracted, custom, self.PREFETCH_CHUNK_SIZE)
+
+        report = ExtractionReport(path=Path(path), objects=selection.deleted, missing=selection.missing, size=size)
+        report.actor_transforms = 0 if filtered is None else len(filtered[1])
+        blob = self.get_custom_blob("GameModeCustomBytes")
+        report.game_mode_custom_bytes = 0 if blob is None else len(blob)
+
+        ArkSaveLogger.save_log(f"{report}")
+        return report
+
+    def get_db_size(self) -> int:
+        """Size of the save database in bytes"""
+        page_count = self.connection.execute("PRAGMA page_count").fetchone()[0]
+        page_size = self.connection.execute("PRAGMA page_size").fetchone()[0]
+        return page_count * page_size
+
+    def __delete_rows(self, conn: sqlite3.Connection, obj_uuids: List[uuid.UUID]):
+        # Part of the caller's transaction
+        for i in range(0, len(obj_uuids), self.PREFETCH_CHUNK_SIZE):
+            chunk = [self.uuid_to_byte_array(obj_uuid) for obj_uuid in obj_uuids[i:i + self.PREFETCH_CHUNK_SIZE]]
+            conn.execute(f"DELETE FROM game WHERE key IN ({','.join('?' * len(chunk))})", chunk)
+
+    def __rewrite_actor_transforms(self, conn: sqlite3.Connection, removed: Set[uuid.UUID]) -> int:
+        """Writes ActorTransforms without the entries of the removed uuids (in the caller's transaction), returns the number removed"""
+        if len(removed) == 0:
+            return 0
+        filtered = self.__filter_actor_transforms(lambda obj_uuid: obj_uuid not in removed)
+        if filtered is None:
+            return 0
+
+        data, kept_positions, nr_removed = filtered
+        if nr_removed > 0:
+            conn.execute("UPDATE custom SET value = ? WHERE key = 'ActorTransforms'", (data,))
+            self.save_context.actor_transform_positions.update(kept_positions)
+        return nr_removed
+
+    def __filter_actor_transforms(self, keep: Callable[[uuid.UUID], bool]) -> Optional[Tuple[bytes, Dict[uuid.UUID, int], int]]:
+        """ActorTransforms with only the entries for which keep is true, their new positions and the number left out"""
+        actor_transforms = self.get_custom_value("ActorTransforms")
+        if actor_transforms is None:
+            return None
+
+        data = actor_transforms.get_bytes()
+        kept = []
+        kept_positions = {}
+        position = 0
+        nr_removed = 0
+        terminator = bytes(16)
+        while position + 16 <= len(data) and data[position:position + 16] != terminator:
+            entry = data[position:position + self.ACTOR_TRANSFORM_ENTRY_SIZE]
+            obj_uuid = self.byte_array_to_uuid(entry[:16])
+            if keep(obj_uuid):
+                kept_positions[obj_uuid] = len(kept) * self.ACTOR_TRANSFORM_ENTRY_SIZE
+                kept.append(entry)
+            else:
+                nr_removed += 1
+            position += self.ACTOR_TRANSFORM_ENTRY_SIZE
+
+        # Everything from the terminating uuid on is kept as is
+        return b"".join(kept) + data[position:], kept_positions, nr_removed
+
+    def __forget_objects(self, obj_uuids: Iterable[uuid.UUID]):
+        for obj_uuid in obj_uuids:
+            self.parsed_objects.pop(obj_uuid, None)
+            self.prefetched_binaries.pop(obj_uuid, None)
+            self.save_context.actor_transforms.pop(obj_uuid, None)
+            self.save_context.actor_transform_positions.pop(obj_uuid, None)
+
+    def get_snapshot_id(self) -> int:
+        """Changes whenever the save is modified through this instance, usable as cache key for derived data"""
+        # Only the read-write connection makes changes
+        return self.__connection.total_changes
+
     def reset_caching(self):
         self.parsed_objects.clear()
+        self.prefetched_binaries.clear()
 
     def store_db(self, path: Path):
         path.parent.mkdir(parents=True, exist_ok=True)
         with sqlite3.connect(path) as new_conn:
             self.connection.backup(new_conn)
+            # The backup is in WAL mode like the working copy, store it as a regular save file
+            new_conn.execute("PRAGMA journal_mode=DELETE")
+        new_conn.close()
         
         logger.info(f"Database successfully backed up to {path}")
 
@@ -353,9 +778,70 @@ class AsaSave:
             return result[0]
         return 0
 
+    def use_index(self, index_path: Path = None, rebuild: bool = False) -> SaveIndex:
+        """
+        Attaches the sidecar index of the save file (stored next to it by default), building it when it
+        is missing or the save file changed. While the loaded save is unmodified, get_game_objects
+        selects the rows to read from the index instead of scanning the whole game table.
+        """
+        if self.save_path is None:
+            raise ValueError("A save index can only be used for saves loaded from a file")
+        if self.get_snapshot_id() != 0:
+            raise ValueError("The save index must be attached before the save is modified")
+
+        if self.index is not None:
+            self.index.close()
+        self.index = SaveIndex.open(self, self.save_path, index_path, rebuild)
+        self.index_snapshot = self.get_snapshot_id()
+        return self.index
+
+    def __index_is_usable(self) -> bool:
+        return self.index is not None and self.index_snapshot == self.get_snapshot_id()
+
+    def __iter_game_objects_from_index(self, reader_config: GameObjectReaderConfiguration) -> Iterator[Tuple[uuid.UUID, 'ArkGameObject', bytes]]:
+        classes = self.index.classes()
+        if reader_config.blueprint_name_filter:
+            classes = [c for c in classes if reader_config.blueprint_name_filter(c)]
+        obj_uuids = self.index.select(classes=classes)
+        self.faulty_objects = 0
+
+        cursor = self.connection.cursor()
+        for i in range(0, len(obj_uuids), self.PREFETCH_CHUNK_SIZE):
+            chunk = obj_uuids[i:i + self.PREFETCH_CHUNK_SIZE]
+            cursor.execute(f"SELECT key, value FROM game WHERE key IN ({','.join('?' * len(chunk))})", [self.uuid_to_byte_array(u) for u in chunk])
+            for key, value in cursor.fetchall():
+                obj_uuid = self.byte_array_to_uuid(key)
+                if obj_uuid in self.parsed_objects:
+                    yield obj_uuid, self.parsed_objects[obj_uuid], value
+                    continue
+                reader = ArkBinaryParser(value, self.save_context)
+                ArkSaveLogger.set_file(reader, "game_object.bin")
+                obj = self.parse_as_predefined_object(obj_uuid, reader.read_name(), reader)
+                if obj:
+                    self.parsed_objects[obj_uuid] = obj
+                    yield obj_uuid, obj, value
+
+        ArkSaveLogger.save_log(f"Selected {len(obj_uuids)} objects of {len(classes)} classes from the save index")
+        self.__report_faulty_objects()
+
+    def __report_faulty_objects(self):
+        if self.faulty_objects > 0:
+            ArkSaveLogger.set_log_level(ArkSaveLogger.LogTypes.ERROR, True)
+            ArkSaveLogger.error_log(f"{self.faulty_objects} objects could not be parsed, if possible, please report this to the developers.")
+            ArkSaveLogger.set_log_level(ArkSaveLogger.LogTypes.ERROR, False)
+
     def get_game_objects(self, reader_config: GameObjectReaderConfiguration = GameObjectReaderConfiguration()) -> Dict[uuid.UUID, 'ArkGameObject']:
+        return {obj_uuid: obj for obj_uuid, obj, _ in self.iter_game_objects(reader_config)}
+
+    def iter_game_objects(self, reader_config: GameObjectReaderConfiguration = GameObjectReaderConfiguration()) -> Iterator[Tuple[uuid.UUID, 'ArkGameObject', bytes]]:
+        """Yields (uuid, game object, binary) of the objects get_game_objects returns, one row at a time"""
+        if reader_config.uuid_filter is None and reader_config.sql_filter is None and self.__index_is_usable():
+            yield from self.__iter_game_objects_from_index(reader_config)
+            return
+
         query = "SELECT key, value FROM game"
-        game_objects = {}
+        if reader_config.sql_filter is not None:
+            query += f" WHERE {reader_config.sql_filter}"
         row_index = 0
         objects = []
         self.faulty_objects = 0
@@ -363,7 +849,7 @@ class AsaSave:
         ArkSaveLogger.enter_struct("GameObjects")
 
         with self.connection as conn:   
-            cursor = conn.execute(query)
+            cursor = conn.execute(query, tuple(reader_config.sql_params))
             for row in cursor:
                 if row_index < 0:
                     row_index += 1
@@ -397,36 +883,51 @@ class AsaSave:
                     ark_game_object = self.parse_as_predefined_object(obj_uuid, class_name, byte_buffer)
                     
                     if ark_game_object:
-                        game_objects[obj_uuid] = ark_game_object
                         self.parsed_objects[obj_uuid] = ark_game_object
+                        yield obj_uuid, ark_game_object, row[1]
                 else:
-                    game_objects[obj_uuid] = self.parsed_objects[obj_uuid]
+                    yield obj_uuid, self.parsed_objects[obj_uuid], row[1]
 
 
         for o in self.var_objects:
             sorted_properties = sorted(self.var_objects[o].items(), key=lambda item: item[1], reverse=True)
             for p, count in sorted_properties:
                 print("  - " + p + " " + str(count))
-        
-        if self.faulty_objects > 0:
-            ArkSaveLogger.set_log_level(ArkSaveLogger.LogTypes.ERROR, True)
-            ArkSaveLogger.error_log(f"{self.faulty_objects} objects could not be parsed, if possible, please report this to the developers.")
-            ArkSaveLogger.set_log_level(ArkSaveLogger.LogTypes.ERROR, False)
-        
-        return game_objects
+
+        self.__report_faulty_objects()
     
     def get_all_present_classes(self):
-        query = "SELECT value FROM game"
+        # Only the leading bytes of every object are needed for its class name
+        query = "SELECT rowid, substr(value, 1, ?) FROM game"
         classes = []
         with self.connection as conn:
-            cursor = conn.execute(query)
-            for row in cursor:
-                byte_buffer = ArkBinaryParser(row[0], self.save_context)
-                class_name = byte_buffer.read_name()
+            cursor = conn.execute(query, (self.CLASS_NAME_PREFIX_SIZE,))
+            for rowid, prefix in cursor:
+                class_name = self.__read_class_name(rowid, prefix)
                 if class_name not in classes:
                     classes.append(class_name)
         return classes
 
+    def get_game_obj_class_name(self, obj_uuid: uuid.UUID) -> Optional[str]:
+        """Reads the class name of an object from its leading bytes, without loading the whole object"""
+        blob = BlobReader.open(self.connection, "game", self.uuid_to_byte_array(obj_uuid))
+        if blob is None:
+            raise ValueError(f"Object with UUID {obj_uuid} not found in database")
+        return self.__read_class_name(blob.rowid, blob.read(0, self.CLASS_NAME_PREFIX_SIZE))
+
+    def __read_class_name(self, rowid: int, prefix: bytes) -> Optional[str]:
+        try:
+            return ArkBinaryParser(prefix, self.save_context).read_name()
+        except Exception:
+            # Class name longer than the prefix, read the whole object
+            row = self.connection.execute("SELECT value FROM game WHERE rowid = ?", (rowid,)).fetchone()
+            return ArkBinaryParser(row[0], self.save_context).read_name()
+
+    def query(self, target: type) -> "ObjectQuery":
+        """Starts a declarative query for the given object model class (Dino, TamedDino, Structure, StructureWithInventory)"""
+        from arkparse.api.object_query import ObjectQuery
+        return ObjectQuery(self, target)
+
     def get_game_object_by_id(self, obj_uuid: uuid.UUID, reparse: bool = False) -> Optional['ArkGameObject']:
         if obj_uuid in self.parsed_objects and not reparse:
             return self.parsed_objects[obj_uuid]
@@ -439,6 +940,10 @@ class AsaSave:
 
         return obj
 
+    def get_custom_blob(self, key: str) -> Optional[BlobReader]:
+        """Reader for a custom value that reads it in parts, for large values like GameModeCustomBytes or ActorTransforms"""
+        return BlobReader.open(self.connection, "custom", key)
+
     def get_custom_value(self, key: str) -> Optional['ArkBinaryParser']:
         query = f"SELECT value FROM custom WHERE key = ? LIMIT 1"
         cursor = self.connection.cursor()
@@ -449,8 +954,16 @@ class AsaSave:
         return None
 
     def close(self):
-        if self.connection:
-            self.connection.close()
+        if self.index is not None:
+            self.index.close()
+            self.index = None
+        with self.__thread_connections_lock:
+            thread_connections = list(self.__thread_connections)
+            self.__thread_connections.clear()
+        for connection in thread_connections:
+            connection.close()
+        if self.__connection:
+            self.__connection.close()
 
     def remove_leading_slash(self, path: str) -> Path:
         return Path(path.lstrip('/'))
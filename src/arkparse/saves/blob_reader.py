@@ -0,0 +1,74 @@
+import sqlite3
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Optional, Tuple
+
+from arkparse.utils.byte_search import ByteLike, MultiPatternSearch
+
+
+class BlobReader:
+    """
+    Reads one value of a save table in parts instead of loading the whole blob into memory.
+
+    Uses incremental blob I/O (Connection.blobopen, Python 3.11+) and falls back to substr()
+    queries on older versions. The row is located once by its rowid, every read only
+    transfers the requested bytes.
+    """
+    CHUNK_SIZE = 8 * 1024 * 1024
+
+    def __init__(self, connection: sqlite3.Connection, table: str, rowid: int, size: int):
+        self.connection = connection
+        self.table = table
+        self.rowid = rowid
+        self.size = size
+
+    @classmethod
+    def open(cls, connection: sqlite3.Connection, table: str, key) -> Optional["BlobReader"]:
+        row = connection.execute(f"SELECT rowid, length(value) FROM {table} WHERE key = ? LIMIT 1", (key,)).fetchone()
+        if row is None or row[1] is None:
+            return None
+        return cls(connection, table, row[0], row[1])
+
+    def __len__(self) -> int:
+        return self.size
+
+    def read(self, offset: int = 0, size: int = None) -> bytes:
+        """Reads size bytes (or up to the end) from offset, clamped to the blob"""
+        with self.__handle() as blob:
+            return self.__read(blob, offset, size)
+
+    def chunks(self, chunk_size: int = CHUNK_SIZE, overlap: int = 0) -> Iterator[Tuple[int, bytes]]:
+        """Yields (offset, bytes) per chunk, every chunk extends overlap bytes into the next one"""
+        with self.__handle() as blob:
+            for offset in range(0, self.size, chunk_size):
+                yield offset, self.__read(blob, offset, chunk_size + overlap)
+
+    def find_all(self, patterns: Iterable[ByteLike], chunk_size: int = CHUNK_SIZE) -> Iterator[Tuple[int, bytes]]:
+        """Yields (offset, pattern) for every occurrence of the patterns, ordered by offset, reading chunk by chunk"""
+        search = MultiPatternSearch(patterns)
+        if len(search.patterns) == 0:
+            return
+        # Chunks overlap so a match crossing a chunk boundary is found, in the chunk it starts in only
+        overlap = max(len(p) for p in search.patterns) - 1
+        for offset, data in self.chunks(chunk_size, overlap):
+            for position, pattern in search.find_all(data):
+                if position < chunk_size:
+                    yield offset + position, pattern
+
+    @contextmanager
+    def __handle(self):
+        if not hasattr(self.connection, "blobopen"):
+            yield None
+            return
+        with self.connection.blobopen(self.table, "value", self.rowid, readonly=True) as blob:
+            yield blob
+
+    def __read(self, blob, offset: int, size: Optional[int]) -> bytes:
+        offset = max(0, min(offset, self.size))
+        size = self.size - offset if size is None else max(0, min(size, self.size - offset))
+        if size == 0:
+            return b""
+        if blob is not None:
+            blob.seek(offset)
+            return blob.read(size)
+        row = self.connection.execute(f"SELECT substr(value, ?, ?) FROM {self.table} WHERE rowid = ?", (offset + 1, size, self.rowid)).fetchone()
+        return bytes(row[0])
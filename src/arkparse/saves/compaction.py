@@ -0,0 +1,273 @@
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, TYPE_CHECKING
+from uuid import UUID
+
+from arkparse.logging import ArkSaveLogger
+from arkparse.parsing.ark_binary_parser import ArkBinaryParser
+from arkparse.parsing.ark_property import ArkProperty
+from arkparse.parsing.ark_property_container import ArkPropertyContainer
+from arkparse.parsing.ark_set import ArkSet
+from arkparse.parsing.struct.object_reference import ObjectReference
+from arkparse.utils.byte_search import MultiPatternSearch
+
+from .save_context import SaveContext
+
+if TYPE_CHECKING:
+    from .asa_save import AsaSave
+
+ITEMS = "items"
+INVENTORIES = "inventories"
+STATUS_COMPONENTS = "status_components"
+# Objects passed to AsaSave.delete, as opposed to the ones deleted with them
+REQUESTED = "objects"
+
+
+def component_kind(class_name: Optional[str]) -> Optional[str]:
+    """Kind of object that only exists through the object referencing it (or, for items, its owner inventory)"""
+    if class_name is None:
+        return None
+    if "PrimalItem" in class_name:
+        return ITEMS
+    if "InventoryComponent" in class_name:
+        return INVENTORIES
+    if "StatusComponent" in class_name:
+        return STATUS_COMPONENTS
+    return None
+
+
+def object_references(value, found: Set[UUID] = None) -> Set[UUID]:
+    """uuids of all objects referenced by a game object or property value, at any depth"""
+    found = set() if found is None else found
+    stack = [value]
+    while stack:
+        current = stack.pop()
+        if current is None or isinstance(current, (str, bytes, bytearray, memoryview, int, float)):
+            continue
+        if isinstance(current, ObjectReference):
+            if current.uuid is not None:
+                found.add(current.uuid)
+        elif isinstance(current, ArkProperty):
+            stack.append(current.value)
+        elif isinstance(current, ArkPropertyContainer):
+            stack.extend(current.properties)
+        elif isinstance(current, ArkSet):
+            stack.extend(current.values)
+        elif isinstance(current, dict):
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        elif isinstance(current, (ArkBinaryParser, SaveContext)):
+            continue
+        elif type(current).__module__.startswith("arkparse") and hasattr(current, "__dict__"):
+            # Struct values, e.g. custom item data holding object references
+            stack.extend(vars(current).values())
+    return found
+
+
+def owner_inventory_of(obj) -> Optional[UUID]:
+    inventory = obj.get_property_value("OwnerInventory")
+    return inventory.uuid if isinstance(inventory, ObjectReference) else None
+
+
+@dataclass
+class CompactionReport:
+    """
+    Result of AsaSave.compact: the unreachable objects per kind (items, inventories, status_components)
+    and the actor transforms of objects that are not in the game table (anymore).
+    Sizes are those of the save database in bytes, size_after is only set when the save was compacted.
+    """
+    unreachable: Dict[str, List[UUID]] = field(default_factory=dict)
+    stale_actor_transforms: List[UUID] = field(default_factory=list)
+    unparsed_objects: int = 0
+    dry_run: bool = True
+    size_before: int = 0
+    size_after: Optional[int] = None
+
+    @property
+    def unreachable_objects(self) -> List[UUID]:
+        return [obj_uuid for uuids in self.unreachable.values() for obj_uuid in uuids]
+
+    def __str__(self) -> str:
+        counts = ", ".join(f"{len(uuids)} {kind}" for kind, uuids in self.unreachable.items())
+        result = f"Unreachable: {counts or 'none'}; stale actor transforms: {len(self.stale_actor_transforms)}"
+        if self.size_after is not None:
+            result += f"; size {self.size_before} -> {self.size_after} bytes"
+        return result
+
+
+def find_garbage(save: "AsaSave") -> CompactionReport:
+    """
+    Finds the items, inventories and status components that cannot be reached from any other object.
+
+    Every object that is not one of these kinds is a root. An object is reachable when a reachable
+    object references it, or for items, when its OwnerInventory is reachable. Objects that cannot be
+    parsed are roots as well, and any candidate whose uuid occurs in their binary is kept.
+    """
+    context = save.save_context
+    candidates: Dict[UUID, str] = {}
+    references: Dict[UUID, Set[UUID]] = {}
+    items_of_inventory: Dict[UUID, List[UUID]] = {}
+    roots: List[UUID] = []
+    unparsed: List[bytes] = []
+    all_uuids: Set[UUID] = set()
+
+    cursor = save.connection.cursor()
+    for key, value in cursor.execute("SELECT key, value FROM game"):
+        obj_uuid = UUID(bytes=key)
+        all_uuids.add(obj_uuid)
+        obj = save.parsed_objects.get(obj_uuid)
+        class_name = obj.blueprint if obj is not None else None
+        if obj is None:
+            try:
+                reader = ArkBinaryParser(value, context)
+                class_name = reader.read_name()
+                obj = save.parse_as_predefined_object(obj_uuid, class_name, reader)
+            except Exception as e:
+                ArkSaveLogger.warning_log(f"Could not parse object {obj_uuid} while looking for garbage: {e}")
+                obj = None
+
+        if not obj:
+            roots.append(obj_uuid)
+            unparsed.append(key)
+            continue
+
+        references[obj_uuid] = object_references(obj)
+        kind = component_kind(class_name)
+        owner_inventory = owner_inventory_of(obj) if kind == ITEMS else None
+        if kind is None or (kind == ITEMS and owner_inventory is None):
+            roots.append(obj_uuid)
+            continue
+
+        candidates[obj_uuid] = kind
+        if owner_inventory is not None:
+            items_of_inventory.setdefault(owner_inventory, []).append(obj_uuid)
+
+    def mark(seeds: Iterable[UUID], reachable: Set[UUID]):
+        stack = list(seeds)
+        reachable.update(stack)
+        while stack:
+            current = stack.pop()
+            for ref in list(references.get(current, ())) + items_of_inventory.get(current, []):
+                if ref in candidates and ref not in reachable:
+                    reachable.add(ref)
+                    stack.append(ref)
+
+    reachable: Set[UUID] = set()
+    mark(roots, reachable)
+    garbage = [obj_uuid for obj_uuid in candidates if obj_uuid not in reachable]
+
+    if len(unparsed) > 0 and len(garbage) > 0:
+        # References of unparsed objects are unknown, keep every candidate their binary mentions
+        search = MultiPatternSearch(obj_uuid.bytes for obj_uuid in garbage)
+        mentioned: Set[UUID] = set()
+        for i in range(0, len(unparsed), save.PREFETCH_CHUNK_SIZE):
+            chunk = unparsed[i:i + save.PREFETCH_CHUNK_SIZE]
+            rows = save.connection.execute(f"SELECT key, value FROM game WHERE key IN ({','.join('?' * len(chunk))})", chunk)
+            mentioned.update(UUID(bytes=pattern) for _, _, pattern in search.search_rows(rows))
+        mark(mentioned, reachable)
+        garbage = [obj_uuid for obj_uuid in garbage if obj_uuid not in reachable]
+
+    report = CompactionReport(unparsed_objects=len(unparsed))
+    for obj_uuid in garbage:
+        report.unreachable.setdefault(candidates[obj_uuid], []).append(obj_uuid)
+    garbage_set = set(garbage)
+    report.stale_actor_transforms = [obj_uuid for obj_uuid in context.actor_transforms
+                                     if obj_uuid not in all_uuids or obj_uuid in garbage_set]
+
+    ArkSaveLogger.save_log(f"Garbage collection: {report}")
+    return report
+
+
+def _is_cryopod(class_name: Optional[str]) -> bool:
+    return class_name is not None and "Cryopod" in class_name
+
+
+@dataclass
+class DeletionReport:
+    """
+    Result of AsaSave.delete: the deleted objects per kind, "objects" for the requested ones and
+    items, inventories and status_components for the ones deleted with them. Deleted cryopods are
+    listed separately as well, the dino and saddle stored in them are deleted with the item.
+    Requested uuids that are not in the save are listed as missing.
+    """
+    deleted: Dict[str, List[UUID]] = field(default_factory=dict)
+    cryopods: List[UUID] = field(default_factory=list)
+    missing: List[UUID] = field(default_factory=list)
+    actor_transforms: int = 0
+
+    @property
+    def deleted_objects(self) -> List[UUID]:
+        return [obj_uuid for uuids in self.deleted.values() for obj_uuid in uuids]
+
+    def __str__(self) -> str:
+        counts = ", ".join(f"{len(uuids)} {kind}" for kind, uuids in self.deleted.items())
+        return f"Deleted: {counts or 'nothing'} ({len(self.cryopods)} cryopods); " \
+               f"actor transforms: {self.actor_transforms}; missing: {len(self.missing)}"
+
+
+def collect_deletion(save: "AsaSave", obj_uuids: Iterable[UUID], cascade: bool = True) -> DeletionReport:
+    """
+    Determines what deleting the objects removes. With cascade, every inventory, item and status component
+    referenced by a deleted object is deleted as well, recursively, so a structure or dino takes its inventory,
+    the items in it and its status component along. OwnerInventory references are not followed, deleting an
+    item does not delete the inventory holding it. Objects are read in chunks, only candidate components are parsed.
+    """
+    requested = list(dict.fromkeys(obj_uuids))
+    kinds: Dict[UUID, str] = {obj_uuid: REQUESTED for obj_uuid in requested}
+    report = DeletionReport()
+    context = save.save_context
+
+    frontier = requested
+    while len(frontier) > 0:
+        next_frontier: List[UUID] = []
+        for i in range(0, len(frontier), save.PREFETCH_CHUNK_SIZE):
+            chunk = frontier[i:i + save.PREFETCH_CHUNK_SIZE]
+            query = f"SELECT key, value FROM game WHERE key IN ({','.join('?' * len(chunk))})"
+            found = set()
+            for key, value in save.connection.execute(query, [obj_uuid.bytes for obj_uuid in chunk]):
+                obj_uuid = UUID(bytes=key)
+                obj = save.parsed_objects.get(obj_uuid)
+                try:
+                    reader = ArkBinaryParser(value, context)
+                    class_name = obj.blueprint if obj is not None else reader.read_name()
+                except Exception as e:
+                    ArkSaveLogger.warning_log(f"Could not read class of object {obj_uuid} while deleting: {e}")
+                    class_name = None
+
+                kind = kinds[obj_uuid]
+                if kind != REQUESTED:
+                    # Referenced objects are only deleted when they are components
+                    kind = component_kind(class_name)
+                    if kind is None:
+                        kinds.pop(obj_uuid)
+                        continue
+                    kinds[obj_uuid] = kind
+
+                found.add(obj_uuid)
+                report.deleted.setdefault(kind, []).append(obj_uuid)
+                if _is_cryopod(class_name):
+                    report.cryopods.append(obj_uuid)
+
+                if not cascade:
+                    continue
+                if obj is None:
+                    try:
+                        obj = save.parse_as_predefined_object(obj_uuid, class_name, reader)
+                    except Exception as e:
+                        ArkSaveLogger.warning_log(f"Could not parse object {obj_uuid} while deleting, not deleting its components: {e}")
+                if not obj:
+                    continue
+
+                for ref in object_references([p for p in obj.properties if p.name != "OwnerInventory"]):
+                    if ref not in kinds:
+                        kinds[ref] = None
+                        next_frontier.append(ref)
+
+            for obj_uuid in chunk:
+                if obj_uuid not in found:
+                    if kinds.get(obj_uuid) == REQUESTED:
+                        report.missing.append(obj_uuid)
+                    kinds.pop(obj_uuid, None)
+        frontier = next_frontier
+
+    return report
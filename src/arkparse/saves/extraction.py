@@ -0,0 +1,69 @@
+import sqlite3
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+from uuid import UUID
+
+# Custom value that is rebuilt for the subset instead of copied
+ACTOR_TRANSFORMS = "ActorTransforms"
+
+
+@dataclass
+class ExtractionReport:
+    """
+    Result of AsaSave.extract: the written objects per kind, "objects" for the selected ones and items,
+    inventories and status_components for the ones taken along. Selected uuids that are not in the save
+    are listed as missing. Sizes are in bytes, game_mode_custom_bytes is the size of the copied value.
+    """
+    path: Optional[Path] = None
+    objects: Dict[str, List[UUID]] = field(default_factory=dict)
+    missing: List[UUID] = field(default_factory=list)
+    actor_transforms: int = 0
+    game_mode_custom_bytes: int = 0
+    size: int = 0
+
+    @property
+    def extracted_objects(self) -> List[UUID]:
+        return [obj_uuid for uuids in self.objects.values() for obj_uuid in uuids]
+
+    def __str__(self) -> str:
+        counts = ", ".join(f"{len(uuids)} {kind}" for kind, uuids in self.objects.items())
+        return f"Extracted: {counts or 'nothing'}; actor transforms: {self.actor_transforms}; " \
+               f"missing: {len(self.missing)}; {self.size} bytes written to {self.path}"
+
+
+def write_subset(source_db: Path, path: Path, obj_uuids: List[UUID], custom: Dict[str, Optional[bytes]], chunk_size: int = 900) -> int:
+    """
+    Creates a new save database at path with the schema of the source database, the game rows of the
+    given objects and every custom value of the source, except the ones in custom which are written
+    with the given value instead (or left out when it is None). Rows are copied inside SQLite, the
+    object binaries are never loaded. Returns the size of the new database in bytes.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.exists():
+        path.unlink()
+
+    conn = sqlite3.connect(path, uri=True)
+    try:
+        conn.execute("ATTACH DATABASE ? AS source", (f"file:{source_db}?mode=ro",))
+        page_size = conn.execute("PRAGMA source.page_size").fetchone()[0]
+        # Only valid before the first table is created
+        conn.execute(f"PRAGMA main.page_size = {int(page_size)}")
+        schema = conn.execute("SELECT sql FROM source.sqlite_master WHERE sql IS NOT NULL AND type IN ('table', 'index') "
+                              "AND name NOT LIKE 'sqlite_%' ORDER BY type = 'index'").fetchall()
+
+        with conn:
+            for (sql,) in schema:
+                conn.execute(sql)
+            for i in range(0, len(obj_uuids), chunk_size):
+                chunk = [obj_uuid.bytes for obj_uuid in obj_uuids[i:i + chunk_size]]
+                conn.execute(f"INSERT INTO main.game SELECT * FROM source.game WHERE key IN ({','.join('?' * len(chunk))})", chunk)
+
+            replaced = list(custom.keys())
+            conn.execute(f"INSERT INTO main.custom SELECT * FROM source.custom WHERE key NOT IN ({','.join('?' * len(replaced))})", replaced)
+            conn.executemany("INSERT INTO main.custom (key, value) VALUES (?, ?)",
+                             [(key, value) for key, value in custom.items() if value is not None])
+        conn.execute("DETACH DATABASE source")
+    finally:
+        conn.close()
+    return path.stat().st_size
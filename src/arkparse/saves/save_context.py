@@ -22,6 +22,8 @@ class SaveContext:
         self.npc_zone_volumes: List["NpcZoneVolume"] = []
         self.all_uuids: List[uuid.UUID] = []
         self.generate_unknown: bool = False
+        # trusted saves skip the expect_* checks while parsing, only the position is advanced
+        self.trusted: bool = False
 
     def get_actor_transform(self, uuid_: uuid.UUID) -> Optional[ActorTransform]:
         return self.actor_transforms.get(uuid_)
@@ -0,0 +1,218 @@
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
+import uuid
+
+from arkparse.logging import ArkSaveLogger
+from arkparse.parsing.ark_binary_parser import ArkBinaryParser
+
+if TYPE_CHECKING:
+    from .asa_save import AsaSave
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value);
+CREATE TABLE IF NOT EXISTS objects (
+    uuid BLOB PRIMARY KEY,
+    class TEXT,
+    name_id INTEGER,
+    team INTEGER,
+    owner_id INTEGER,
+    owner TEXT,
+    parent_inventory BLOB,
+    x REAL,
+    y REAL,
+    z REAL,
+    level INTEGER
+);
+CREATE INDEX IF NOT EXISTS objects_class ON objects (class);
+CREATE INDEX IF NOT EXISTS objects_team ON objects (team);
+CREATE INDEX IF NOT EXISTS objects_parent_inventory ON objects (parent_inventory);
+"""
+
+_LEVEL_PROPERTIES = ("NumberOfLevelUpPointsApplied", "NumberOfLevelUpPointsAppliedTamed", "NumberOfMutationsAppliedTamed")
+_NR_OF_STATS = 12
+
+
+class SaveIndex:
+    """
+    Sidecar SQLite database describing every object of a save file: uuid, class name and name id,
+    targeting team, owner, parent inventory, location and (dino) level.
+
+    The index is keyed by the path, size and modification time of the save file and is rebuilt
+    when any of them changes. Selection queries are answered from the index, after which only
+    the matching rows of the game table need to be read and parsed.
+    """
+    VERSION = 1
+    SUFFIX = ".index.sqlite"
+    # Values per "IN (...)" clause, below the host parameter limit of older SQLite builds
+    MAX_IN_LIST = 900
+
+    def __init__(self, index_path: Path):
+        self.path = Path(index_path)
+        # Shared by the read sessions of all threads of the save, see AsaSave.read_session
+        self.connection = sqlite3.connect(self.path, check_same_thread=False)
+        self.connection.executescript(_SCHEMA)
+
+    def close(self):
+        if self.connection:
+            self.connection.close()
+            self.connection = None
+
+    @staticmethod
+    def default_path(save_path: Path) -> Path:
+        """The index is stored next to the save file, as <save file name>.index.sqlite"""
+        return save_path.with_name(save_path.name + SaveIndex.SUFFIX)
+
+    @staticmethod
+    def save_key(save_path: Path) -> Dict[str, object]:
+        stat = save_path.stat()
+        return {"version": SaveIndex.VERSION, "path": str(save_path.resolve()), "size": stat.st_size, "mtime": stat.st_mtime_ns}
+
+    @classmethod
+    def open(cls, save: "AsaSave", save_path: Path, index_path: Path = None, rebuild: bool = False) -> "SaveIndex":
+        """Opens the index of the save file, building it from the (unmodified) loaded save when it is missing or outdated"""
+        index = cls(index_path if index_path is not None else cls.default_path(save_path))
+        if rebuild or not index.is_current(save_path):
+            index.build(save, save_path)
+        else:
+            ArkSaveLogger.save_log(f"Using save index {index.path}")
+        return index
+
+    def is_current(self, save_path: Path) -> bool:
+        stored = dict(self.connection.execute("SELECT key, value FROM meta"))
+        return stored == self.save_key(save_path)
+
+    def build(self, save: "AsaSave", save_path: Path):
+        """Indexes every object of the save in one pass over the game table"""
+        context = save.save_context
+        rows: List[Tuple] = []
+        status_of_dino: Dict[uuid.UUID, uuid.UUID] = {}
+        level_of_status: Dict[uuid.UUID, int] = {}
+
+        for key, value in save.connection.execute("SELECT key, value FROM game"):
+            obj_uuid = save.byte_array_to_uuid(key)
+            reader = ArkBinaryParser(value, context)
+            name_id = int.from_bytes(value[:4], byteorder="little") if context.has_name_table() else None
+            try:
+                class_name = reader.read_name()
+            except Exception:
+                class_name = None
+            if class_name is None:
+                rows.append((key, None, name_id, None, None, None, None, None, None, None, None))
+                continue
+
+            obj = save.parsed_objects.get(obj_uuid)
+            if obj is None:
+                try:
+                    obj = save.parse_as_predefined_object(obj_uuid, class_name, reader)
+                except Exception as e:
+                    # Indexed by class only, like an object that is not parsed at all
+                    ArkSaveLogger.error_log(f"Error indexing object {obj_uuid} of type {class_name}: {e}")
+                    obj = None
+            if not obj:
+                rows.append((key, class_name, name_id, None, None, None, None, None, None, None, None))
+                continue
+
+            status = obj.get_property_value("MyCharacterStatusComponent")
+            if status is not None and obj.get_property_value("SavedBaseWorldLocation") is not None:
+                status_of_dino[obj_uuid] = status.uuid
+            if "StatusComponent" in class_name:
+                level_of_status[obj_uuid] = self.__level(obj)
+
+            location = obj.get_property_value("SavedBaseWorldLocation")
+            if location is None:
+                location = context.actor_transforms.get(obj_uuid)
+            inventory = obj.get_property_value("OwnerInventory")
+            owner = obj.get_property_value("OwningPlayerName")
+            if owner is None:
+                owner = obj.get_property_value("OwnerName", default=obj.get_property_value("TamerString"))
+
+            rows.append((key, class_name, name_id,
+                         obj.get_property_value("TargetingTeam"),
+                         obj.get_property_value("OwningPlayerID"),
+                         owner,
+                         inventory.uuid.bytes if getattr(inventory, "uuid", None) is not None else None,
+                         location.x if location is not None else None,
+                         location.y if location is not None else None,
+                         location.z if location is not None else None,
+                         None))
+
+        # The level is stored on the dino (or player pawn), not on its status component
+        levels = [(level_of_status[status_uuid], dino_uuid.bytes) for dino_uuid, status_uuid in status_of_dino.items() if status_uuid in level_of_status]
+
+        with self.connection as conn:
+            conn.execute("DELETE FROM objects")
+            conn.execute("DELETE FROM meta")
+            conn.executemany("INSERT OR REPLACE INTO objects VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            conn.executemany("UPDATE objects SET level = ? WHERE uuid = ?", levels)
+            conn.executemany("INSERT INTO meta (key, value) VALUES (?, ?)", self.save_key(save_path).items())
+
+        ArkSaveLogger.save_log(f"Built save index {self.path} with {len(rows)} objects")
+
+    @staticmethod
+    def __level(status) -> int:
+        # Same as DinoStats.current_level
+        level = 1
+        for prop in _LEVEL_PROPERTIES:
+            for i in range(_NR_OF_STATS):
+                value = status.get_property_value(prop, position=i)
+                level += 0 if value is None else value
+        return level
+
+    def classes(self) -> List[str]:
+        return [row[0] for row in self.connection.execute("SELECT DISTINCT class FROM objects WHERE class IS NOT NULL")]
+
+    def select(self, classes: Iterable[str] = None, team: int = None, owner_id: int = None, parent_inventory: uuid.UUID = None,
+               min_level: int = None, max_level: int = None,
+               bounds: Tuple[Tuple[float, float], Tuple[float, float]] = None) -> List[uuid.UUID]:
+        """
+        Returns the uuids of the indexed objects matching all given criteria,
+        bounds is ((min x, min y), (max x, max y)) in world coordinates.
+        """
+        conditions = []
+        params = []
+        if team is not None:
+            conditions.append("team = ?")
+            params.append(team)
+        if owner_id is not None:
+            conditions.append("owner_id = ?")
+            params.append(owner_id)
+        if parent_inventory is not None:
+            conditions.append("parent_inventory = ?")
+            params.append(parent_inventory.bytes)
+        if min_level is not None:
+            conditions.append("level >= ?")
+            params.append(min_level)
+        if max_level is not None:
+            conditions.append("level <= ?")
+            params.append(max_level)
+        if bounds is not None:
+            conditions.append("x BETWEEN ? AND ? AND y BETWEEN ? AND ?")
+            params += [bounds[0][0], bounds[1][0], bounds[0][1], bounds[1][1]]
+
+        if classes is None:
+            return self.__select(conditions, params)
+
+        classes = list(classes)
+        result = []
+        for i in range(0, len(classes), self.MAX_IN_LIST):
+            chunk = classes[i:i + self.MAX_IN_LIST]
+            result += self.__select(conditions + [f"class IN ({','.join('?' * len(chunk))})"], params + chunk)
+        return result
+
+    def __select(self, conditions: List[str], params: List[object]) -> List[uuid.UUID]:
+        query = "SELECT uuid FROM objects"
+        if len(conditions) > 0:
+            query += " WHERE " + " AND ".join(conditions)
+        return [uuid.UUID(bytes=row[0]) for row in self.connection.execute(query, params)]
+
+    def get(self, obj_uuid: uuid.UUID) -> Optional[Dict[str, object]]:
+        cursor = self.connection.execute("SELECT * FROM objects WHERE uuid = ?", (obj_uuid.bytes,))
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        result = dict(zip([c[0] for c in cursor.description], row))
+        result["uuid"] = obj_uuid
+        if result["parent_inventory"] is not None:
+            result["parent_inventory"] = uuid.UUID(bytes=result["parent_inventory"])
+        return result
@@ -0,0 +1,145 @@
+import sqlite3
+from typing import Any, Dict, Optional, TYPE_CHECKING
+
+from arkparse.parsing.ark_binary_parser import ArkBinaryParser
+from arkparse.parsing.ark_property import ArkProperty
+
+if TYPE_CHECKING:
+    from .save_context import SaveContext
+
+
+class GameObjectSqlFunctions:
+    """
+    SQL functions on the raw object blobs of the game table, so objects can be filtered inside SQLite:
+
+        SELECT key FROM game WHERE ark_class(value) LIKE '%Turret%' AND ark_prop_int(value, 'TargetingTeam') = 123
+
+    ark_class(value)                          class name (blueprint) of the object
+    ark_has_prop(value, name)                 1 if the object has a top level property with that name, else 0
+    ark_prop_int(value, name[, position])     value of an integer or boolean property, NULL if absent
+    ark_prop_real(value, name[, position])    value of a numeric property, NULL if absent
+    ark_prop_text(value, name[, position])    value of a string or name property, NULL if absent
+
+    Only top level properties are decoded, from the start of the object up to the requested
+    property. With a name table, objects that do not contain the id of the property name at all
+    are rejected without decoding anything. Objects that cannot be decoded evaluate to NULL.
+    """
+    def __init__(self, save_context: "SaveContext"):
+        self.save_context = save_context
+        self.class_names: Dict[bytes, Optional[str]] = {}
+        self.name_ids: Dict[str, Optional[bytes]] = {}
+        self.nr_of_names = -1
+
+    def register(self, connection: sqlite3.Connection):
+        for name, nr_args, func in (("ark_class", 1, self.ark_class),
+                                    ("ark_has_prop", 2, self.ark_has_prop),
+                                    ("ark_prop_int", 2, self.ark_prop_int),
+                                    ("ark_prop_int", 3, self.ark_prop_int),
+                                    ("ark_prop_real", 2, self.ark_prop_real),
+                                    ("ark_prop_real", 3, self.ark_prop_real),
+                                    ("ark_prop_text", 2, self.ark_prop_text),
+                                    ("ark_prop_text", 3, self.ark_prop_text)):
+            connection.create_function(name, nr_args, func, deterministic=True)
+
+    def ark_class(self, value: bytes) -> Optional[str]:
+        if value is None or len(value) < 4:
+            return None
+        if not self.__by_name_id():
+            return self.__read_class(value)
+
+        self.__sync_names()
+        # With a name table the first 4 bytes of every row are the id of its class name
+        name_id = bytes(value[:4])
+        if name_id not in self.class_names:
+            self.class_names[name_id] = self.__read_class(value)
+        return self.class_names[name_id]
+
+    def ark_has_prop(self, value: bytes, name: str) -> int:
+        return 0 if self.find_property(value, name) is None else 1
+
+    def ark_prop_int(self, value: bytes, name: str, position: int = None) -> Optional[int]:
+        prop_value = self.__value(value, name, position)
+        if isinstance(prop_value, (bool, int)):
+            return int(prop_value)
+        return None
+
+    def ark_prop_real(self, value: bytes, name: str, position: int = None) -> Optional[float]:
+        prop_value = self.__value(value, name, position)
+        if isinstance(prop_value, (bool, int, float)):
+            return float(prop_value)
+        return None
+
+    def ark_prop_text(self, value: bytes, name: str, position: int = None) -> Optional[str]:
+        prop_value = self.__value(value, name, position)
+        if isinstance(prop_value, str):
+            return prop_value
+        return None
+
+    def find_property(self, value: bytes, name: str, position: int = None) -> Optional[ArkProperty]:
+        """Decodes the top level properties of the object until the one with the given name (and position) is found"""
+        if value is None or name is None:
+            return None
+
+        if self.__by_name_id():
+            name_id = self.__name_id(name)
+            if name_id is None or name_id not in value:
+                return None
+
+        try:
+            reader = ArkBinaryParser(value, self.save_context)
+            if not self.__skip_header(reader):
+                return None
+            while reader.has_more():
+                prop = ArkProperty.read_property(reader)
+                if prop is None:
+                    return None
+                if prop.name == name and (position is None or prop.position == position):
+                    return prop
+        except Exception:
+            return None
+        return None
+
+    def __value(self, value: bytes, name: str, position: Optional[int]) -> Any:
+        prop = self.find_property(value, name, position)
+        return None if prop is None else prop.value
+
+    def __by_name_id(self) -> bool:
+        return self.save_context.has_name_table() and self.save_context.constant_name_table is None
+
+    def __sync_names(self):
+        # Names can be added to the table after loading, drop the cached lookups when it grows
+        if len(self.save_context.names) != self.nr_of_names:
+            self.name_ids.clear()
+            self.class_names.clear()
+            self.nr_of_names = len(self.save_context.names)
+
+    def __name_id(self, name: str) -> Optional[bytes]:
+        self.__sync_names()
+        if name not in self.name_ids:
+            name_id = self.save_context.get_name_id(name)
+            self.name_ids[name] = None if name_id is None else name_id.to_bytes(4, byteorder="little")
+        return self.name_ids[name]
+
+    def __read_class(self, value: bytes) -> Optional[str]:
+        try:
+            return ArkBinaryParser(value, self.save_context).read_name()
+        except Exception:
+            return None
+
+    @staticmethod
+    def __skip_header(reader: ArkBinaryParser) -> bool:
+        # Same layout as the header read in ArkGameObject
+        class_name = reader.read_name()
+        reader.read_uint32()
+        reader.read_names(reader.read_int())
+        if class_name is None or "AnimSequence" in class_name:
+            return False
+        reader.read_part()
+        reader.read_short()
+        return True
+
+
+def register_sql_functions(connection: sqlite3.Connection, save_context: "SaveContext") -> GameObjectSqlFunctions:
+    functions = GameObjectSqlFunctions(save_context)
+    functions.register(connection)
+    return functions
@@ -0,0 +1,135 @@
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+ByteLike = Union[bytes, bytearray, memoryview]
+
+
+class MultiPatternSearch:
+    """
+    Finds all occurrences of a set of byte patterns in a single pass (Aho-Corasick).
+
+    Matches may overlap and are returned as (offset, pattern) tuples ordered by offset.
+    For a handful of patterns a plain bytes.find per pattern is faster than walking
+    the automaton in Python, so that path is used below FIND_PATTERN_LIMIT patterns.
+    """
+    FIND_PATTERN_LIMIT = 256
+
+    def __init__(self, patterns: Iterable[ByteLike]):
+        self.patterns: List[bytes] = list(dict.fromkeys(bytes(p) for p in patterns))
+        if any(len(p) == 0 for p in self.patterns):
+            raise ValueError("Cannot search for an empty pattern")
+
+        self._delta: Optional[List[List[int]]] = None
+        self._outputs: Optional[List[Tuple[bytes, ...]]] = None
+        if len(self.patterns) > self.FIND_PATTERN_LIMIT:
+            self.__build_automaton()
+
+    def __build_automaton(self) -> None:
+        goto: List[Dict[int, int]] = [{}]
+        outputs: List[List[bytes]] = [[]]
+
+        for pattern in self.patterns:
+            state = 0
+            for b in pattern:
+                nxt = goto[state].get(b)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][b] = nxt
+                    goto.append({})
+                    outputs.append([])
+                state = nxt
+            outputs[state].append(pattern)
+
+        # Breadth first: resolve failure links into a full transition table
+        delta: List[List[int]] = [None] * len(goto)
+        delta[0] = [goto[0].get(b, 0) for b in range(256)]
+        queue = list(goto[0].values())
+        fail = [0] * len(goto)
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            fallback = delta[fail[state]]
+            row = list(fallback)
+            for b, nxt in goto[state].items():
+                row[b] = nxt
+                fail[nxt] = fallback[b]
+                queue.append(nxt)
+            delta[state] = row
+            outputs[state] = outputs[state] + outputs[fail[state]]
+
+        self._delta = delta
+        self._outputs = [tuple(o) for o in outputs]
+
+    def find_all(self, data: ByteLike) -> List[Tuple[int, bytes]]:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+
+        if self._delta is None:
+            matches = []
+            for pattern in self.patterns:
+                pos = data.find(pattern)
+                while pos != -1:
+                    matches.append((pos, pattern))
+                    pos = data.find(pattern, pos + 1)
+            matches.sort(key=lambda m: m[0])
+            return matches
+
+        delta = self._delta
+        outputs = self._outputs
+        matches = []
+        state = 0
+        for i, b in enumerate(data):
+            state = delta[state][b]
+            if outputs[state]:
+                for pattern in outputs[state]:
+                    matches.append((i - len(pattern) + 1, pattern))
+        matches.sort(key=lambda m: m[0])
+        return matches
+
+    def search_rows(self, rows: Iterable[Tuple[Any, ByteLike]]) -> List[Tuple[Any, int, bytes]]:
+        results = []
+        for key, value in rows:
+            if value is None:
+                continue
+            for offset, pattern in self.find_all(value):
+                results.append((key, offset, pattern))
+        return results
+
+
+def _search_table_range(db_path: str, table: str, patterns: List[bytes], first_rowid: int, last_rowid: int) -> List[Tuple[Any, int, bytes]]:
+    connection = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        cursor = connection.execute(f"SELECT key, value FROM {table} WHERE rowid BETWEEN ? AND ?", (first_rowid, last_rowid))
+        return MultiPatternSearch(patterns).search_rows(cursor)
+    finally:
+        connection.close()
+
+
+def search_table(db_path: Path, table: str, patterns: Iterable[ByteLike], workers: int) -> List[Tuple[Any, int, bytes]]:
+    """
+    Searches every value blob of a save table for the given patterns, split into rowid
+    ranges that are scanned by separate processes on their own read-only connections.
+    Returns (raw row key, offset, pattern) tuples in table order.
+    """
+    patterns = list(dict.fromkeys(bytes(p) for p in patterns))
+    connection = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        rowids = [row[0] for row in connection.execute(f"SELECT rowid FROM {table} ORDER BY rowid")]
+    finally:
+        connection.close()
+
+    if len(rowids) == 0:
+        return []
+
+    chunk = (len(rowids) + workers - 1) // workers
+    ranges = [(rowids[i], rowids[min(i + chunk, len(rowids)) - 1]) for i in range(0, len(rowids), chunk)]
+
+    results = []
+    with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+        futures = [executor.submit(_search_table_range, str(db_path), table, patterns, first, last) for first, last in ranges]
+        for future in futures:
+            results.extend(future.result())
+    return results
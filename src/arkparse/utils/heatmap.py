@@ -0,0 +1,65 @@
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from arkparse.enums import ArkMap
+from arkparse.parsing.struct.actor_transform import ActorTransform, MapCoordinateParameters
+
+# Map coordinates (lat, long) span 0 to 100
+MAP_COORDINATE_RANGE = 100
+
+
+def build_heatmap_layers(objects: Iterable[Any], map: ArkMap, resolution: int = 100,
+                         layers: Dict[str, Callable[[Any], bool]] = None,
+                         group_by: Callable[[Any], Any] = None,
+                         get_location: Callable[[Any], Optional[ActorTransform]] = lambda obj: obj.location,
+                         min_in_section: int = 1) -> Dict[str, "np.ndarray"]:
+    """
+    Builds several heatmaps in one pass over the objects.
+
+    Every layer predicate selects the objects counted in that layer, group_by adds a layer per
+    returned key (for example per tribe id). Without layers or group_by a single "all" layer is made.
+    Each heatmap is a (resolution x resolution) array indexed [lat][long], cells with fewer than
+    min_in_section objects are set to 0.
+    """
+    import numpy as np
+
+    if layers is None and group_by is None:
+        layers = {"all": lambda obj: True}
+    layers = layers or {}
+
+    x = []
+    y = []
+    memberships = {name: [] for name in layers}
+    groups: Dict[Any, list] = {}
+
+    for obj in objects:
+        location = get_location(obj)
+        if location is None or location.in_cryopod:
+            continue
+
+        index = len(x)
+        x.append(location.x)
+        y.append(location.y)
+        for name, predicate in layers.items():
+            memberships[name].append(predicate(obj))
+        if group_by is not None:
+            groups.setdefault(group_by(obj), []).append(index)
+
+    params = MapCoordinateParameters(map)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    # Same conversion as MapCoordinateParameters.transform_to, for all objects at once
+    lat = np.round(y / params.longitude_scale + params.longitude_shift, 2)
+    long = np.round(x / params.latitude_scale + params.latitude_shift, 2)
+
+    def histogram(selection) -> "np.ndarray":
+        heatmap, _, _ = np.histogram2d(lat[selection], long[selection], bins=resolution,
+                                       range=[[0, MAP_COORDINATE_RANGE], [0, MAP_COORDINATE_RANGE]])
+        heatmap = heatmap.astype(np.int64)
+        if min_in_section > 1:
+            heatmap[heatmap < min_in_section] = 0
+        return heatmap
+
+    result = {name: histogram(np.asarray(selected, dtype=bool)) for name, selected in memberships.items()}
+    for key, indices in groups.items():
+        result[f"{key}"] = histogram(np.asarray(indices, dtype=np.int64))
+    return result
@@ -1,5 +1,67 @@
+import json
 from json import JSONEncoder
+from pathlib import Path
 
 class DefaultJsonEncoder(JSONEncoder):
     def default(self, o):
+        # Objects with cached or lazily built attributes provide their own JSON form
+        if hasattr(type(o), "to_json_dict"):
+            return o.to_json_dict()
         return o.__dict__
+
+class JsonStreamWriter:
+    """
+    Writes records to a file one at a time instead of building the whole document in memory.
+
+    Formats:
+        json:  indented JSON array, identical to json.dumps(records, indent=4)
+        array: compact JSON array
+        jsonl: JSON Lines, one compact object per line
+    """
+    FORMATS = ("json", "array", "jsonl")
+    EXTENSIONS = {"json": ".json", "array": ".json", "jsonl": ".jsonl"}
+
+    def __init__(self, path: Path, format: str = "jsonl"):
+        if format not in self.FORMATS:
+            raise ValueError(f"Unknown JSON format '{format}', expected one of {self.FORMATS}")
+        self.format = format
+        self.count = 0
+        self.file = open(path, "w")
+
+    def __enter__(self) -> "JsonStreamWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def serialize(self, record) -> str:
+        return JsonStreamWriter.serialize_record(record, self.format)
+
+    @staticmethod
+    def serialize_record(record, format: str) -> str:
+        if format == "json":
+            # Indent the record as if it was an element of the indented array
+            return json.dumps(record, indent=4, cls=DefaultJsonEncoder).replace("\n", "\n    ")
+        return json.dumps(record, separators=(",", ":"), cls=DefaultJsonEncoder)
+
+    def write(self, record):
+        self.write_serialized(self.serialize(record))
+
+    def write_serialized(self, text: str):
+        """Writes a record that was already serialized with serialize_record, for example by a worker process"""
+        if self.format == "jsonl":
+            self.file.write(text + "\n")
+        elif self.format == "json":
+            self.file.write(("[\n    " if self.count == 0 else ",\n    ") + text)
+        else:
+            self.file.write(("[" if self.count == 0 else ",") + text)
+        self.count += 1
+
+    def close(self):
+        if self.file.closed:
+            return
+        if self.format == "json":
+            self.file.write("[]" if self.count == 0 else "\n]")
+        elif self.format == "array":
+            self.file.write("[]" if self.count == 0 else "]")
+        self.file.close()
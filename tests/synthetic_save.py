@@ -0,0 +1,114 @@
+"""
+Builds small save databases for the tests: a save header with a name table, game objects with
+object references, arrays of object references, int, double, bool and string properties, actor
+transforms and GameModeCustomBytes. Tribe archives (*.arktribe) can be built as well.
+"""
+import sqlite3
+import struct
+from pathlib import Path
+from typing import Dict, List, Optional
+from uuid import UUID, uuid4
+
+WALL = "/Game/Structures/Wall.Wall_C"
+INVENTORY = "/Script/ShooterGame.PrimalInventoryComponent"
+STONE = "/Game/Items/PrimalItem_Stone.PrimalItem_Stone_C"
+RAPTOR = "/Game/Dinos/Raptor_Character_BP.Raptor_Character_BP_C"
+RAPTOR_STATUS = "/Game/Dinos/DinoCharacterStatusComponent_BP.DinoCharacterStatusComponent_BP_C"
+
+ACTOR_TRANSFORMS_TAIL = bytes(16) + b"tail"
+
+
+def string(value: str) -> bytes:
+    data = value.encode() + b"\0"
+    return struct.pack("<i", len(data)) + data
+
+
+def actor_transform(obj_uuid: UUID, x: float, y: float = 0) -> bytes:
+    return obj_uuid.bytes + struct.pack("<6dQ", x, y, 0, 0, 0, 0, 0)
+
+
+class SyntheticSave:
+    def __init__(self):
+        self.names: Dict[str, int] = {}
+        self.objects: Dict[UUID, bytes] = {}
+        # Actor transforms in save order, (uuid, x, y)
+        self.locations: List[tuple] = []
+        for name in ("None", "ObjectProperty", "ArrayProperty", "IntProperty", "DoubleProperty", "BoolProperty", "StrProperty"):
+            self.name_id(name)
+
+    def name_id(self, name: str) -> int:
+        return self.names.setdefault(name, len(self.names) + 1)
+
+    def name(self, name: str) -> bytes:
+        return struct.pack("<II", self.name_id(name), 0)
+
+    def reference(self, obj_uuid: UUID) -> bytes:
+        return struct.pack("<h", 0) + obj_uuid.bytes
+
+    def property(self, key: str, value) -> bytes:
+        if isinstance(value, list):
+            array = struct.pack("<I", len(value)) + b"".join(self.reference(v) for v in value)
+            return self.name(key) + self.name("ArrayProperty") + struct.pack("<i", len(value)) + self.name("ObjectProperty") \
+                + struct.pack("<iIB", 0, len(array), 0) + array
+        if isinstance(value, bool):
+            return self.name(key) + self.name("BoolProperty") + struct.pack("<ii", 0, 0) + struct.pack("<B", value)
+        if isinstance(value, int):
+            return self.name(key) + self.name("IntProperty") + struct.pack("<ii", 4, 0) + b"\0" + struct.pack("<i", value)
+        if isinstance(value, float):
+            return self.name(key) + self.name("DoubleProperty") + struct.pack("<ii", 8, 0) + b"\0" + struct.pack("<d", value)
+        if isinstance(value, str):
+            data = string(value)
+            return self.name(key) + self.name("StrProperty") + struct.pack("<ii", len(data), 0) + b"\0" + data
+        return self.name(key) + self.name("ObjectProperty") + struct.pack("<ii", 18, 0) + b"\0" + self.reference(value)
+
+    def game_object(self, class_name: str, **properties) -> bytes:
+        data = self.name(class_name) + struct.pack("<Ii", 0, 0) + struct.pack("<ih", 0, 0)
+        for key, value in properties.items():
+            data += self.property(key, value)
+        return data + self.name("None") + struct.pack("<i", 0) + bytes(16)
+
+    def add(self, class_name: str, obj_uuid: Optional[UUID] = None, location: Optional[tuple] = None, **properties) -> UUID:
+        """Adds a game object, with an actor transform at location (x, y) if given, and returns its uuid"""
+        obj_uuid = obj_uuid if obj_uuid is not None else uuid4()
+        self.objects[obj_uuid] = self.game_object(class_name, **properties)
+        if location is not None:
+            self.locations.append((obj_uuid, *location))
+        return obj_uuid
+
+    def header(self) -> bytes:
+        header = struct.pack("<hIIidI", 14, 0, 0, 0, 0.0, 0) + struct.pack("<I", 1) + string("TheIsland_WP") + struct.pack("<I", 0xFFFFFFFF)
+        header = header[:10] + struct.pack("<i", len(header)) + header[14:]
+        return header + struct.pack("<i", len(self.names)) + b"".join(struct.pack("<I", i) + string(n) for n, i in self.names.items())
+
+    def actor_transforms(self) -> bytes:
+        return b"".join(actor_transform(obj_uuid, x, y) for obj_uuid, x, y in self.locations) + ACTOR_TRANSFORMS_TAIL
+
+    def write(self, path: Path, game_mode_custom_bytes: bytes = bytes(8)) -> Path:
+        conn = sqlite3.connect(path)
+        conn.execute("CREATE TABLE game (key BLOB PRIMARY KEY, value BLOB)")
+        conn.execute("CREATE TABLE custom (key TEXT PRIMARY KEY, value BLOB)")
+        conn.executemany("INSERT INTO game VALUES (?, ?)", [(obj_uuid.bytes, value) for obj_uuid, value in self.objects.items()])
+        conn.executemany("INSERT INTO custom VALUES (?, ?)", [("SaveHeader", self.header()), ("ActorTransforms", self.actor_transforms()),
+                                                               ("GameModeCustomBytes", game_mode_custom_bytes)])
+        conn.commit()
+        conn.close()
+        return path
+
+
+def _archive_property(key: str, type_name: str, value: bytes) -> bytes:
+    return string(key) + string(type_name) + struct.pack("<ii", len(value), 0) + b"\0" + value
+
+
+def tribe_archive(tribe_id: int, name: str, owner_id: int = 1) -> bytes:
+    """A 5.5 format tribe archive (names stored as strings) with the properties ArkTribe requires"""
+    body = _archive_property("TribeName", "StrProperty", string(name)) \
+        + _archive_property("OwnerPlayerDataId", "UInt32Property", struct.pack("<I", owner_id)) \
+        + _archive_property("TribeID", "IntProperty", struct.pack("<i", tribe_id)) + string("None")
+    properties = string("TribeData") + string("StructProperty") + struct.pack("<I", 1) + string("TribeData") \
+        + struct.pack("<I", 1) + string("/Script/ShooterGame") + struct.pack("<II", 0, len(body)) + b"\0" + body + string("None")
+
+    header = struct.pack("<iiii", 7, 0, 0, 1)
+    obj = uuid4().bytes + string("/Script/ShooterGame.PrimalTribeData") + struct.pack("<IIIiI", 0, 0, 0, 0, 0)
+    properties_offset = len(header) + len(obj) + 8
+    # Properties start one byte after the offset
+    return header + obj + struct.pack("<iI", properties_offset, 0) + b"\0" + properties
@@ -0,0 +1,123 @@
+import random
+import sqlite3
+from pathlib import Path
+from uuid import UUID
+
+import pytest
+
+from arkparse.saves.asa_save import AsaSave
+from arkparse.saves.blob_reader import BlobReader
+from arkparse.utils.byte_search import MultiPatternSearch, search_table
+
+from synthetic_save import STONE, WALL, SyntheticSave
+
+
+def _find_path(patterns) -> MultiPatternSearch:
+    search = MultiPatternSearch(patterns)
+    assert search._delta is None
+    return search
+
+
+def _automaton(patterns, monkeypatch) -> MultiPatternSearch:
+    monkeypatch.setattr(MultiPatternSearch, "FIND_PATTERN_LIMIT", 0)
+    search = MultiPatternSearch(patterns)
+    assert search._delta is not None
+    return search
+
+
+@pytest.mark.parametrize("patterns, data, expected", [
+    ([b"ab"], b"xxabxab", [(2, b"ab"), (5, b"ab")]),
+    # Overlapping occurrences of one pattern
+    ([b"aa"], b"aaaa", [(0, b"aa"), (1, b"aa"), (2, b"aa")]),
+    # A pattern inside another one, and one sharing a prefix
+    ([b"he", b"she", b"hers", b"his"], b"ushers", [(1, b"she"), (2, b"he"), (2, b"hers")]),
+    ([b"\x00\x01", b"\x01"], b"\x00\x01\x01", [(0, b"\x00\x01"), (1, b"\x01"), (2, b"\x01")]),
+    ([b"abc"], b"ab", []),
+])
+def test_find_all_vectors(patterns, data, expected, monkeypatch):
+    assert sorted(_find_path(patterns).find_all(data)) == expected
+    assert sorted(_find_path(patterns).find_all(memoryview(data))) == expected
+    assert sorted(_automaton(patterns, monkeypatch).find_all(data)) == expected
+
+
+def test_duplicate_and_empty_patterns():
+    assert MultiPatternSearch([b"ab", bytearray(b"ab"), memoryview(b"ab")]).patterns == [b"ab"]
+    with pytest.raises(ValueError):
+        MultiPatternSearch([b"ab", b""])
+
+
+def test_automaton_matches_find_path():
+    rng = random.Random(30)
+    # Over FIND_PATTERN_LIMIT short patterns of a small alphabet, so they overlap and nest
+    patterns = list(dict.fromkeys(bytes(rng.randrange(4) for _ in range(rng.randrange(1, 6))) for _ in range(2000)))
+    assert len(patterns) > MultiPatternSearch.FIND_PATTERN_LIMIT
+    automaton = MultiPatternSearch(patterns)
+    assert automaton._delta is not None
+
+    for _ in range(20):
+        data = bytes(rng.randrange(5) for _ in range(rng.randrange(200)))
+        expected = []
+        for pattern in patterns:
+            expected += [(i, pattern) for i in range(len(data)) if data.startswith(pattern, i)]
+        matches = automaton.find_all(data)
+        assert [offset for offset, _ in matches] == sorted(offset for offset, _ in matches)
+        assert sorted(matches) == sorted(expected)
+
+
+def _blob(tmp_path: Path, value: bytes) -> BlobReader:
+    connection = sqlite3.connect(tmp_path / "blob.db")
+    connection.execute("CREATE TABLE custom (key TEXT PRIMARY KEY, value BLOB)")
+    connection.execute("INSERT INTO custom VALUES ('value', ?)", (value,))
+    return BlobReader.open(connection, "custom", "value")
+
+
+@pytest.mark.parametrize("automaton", [False, True])
+def test_blob_find_all_across_chunks(tmp_path: Path, monkeypatch, automaton):
+    if automaton:
+        monkeypatch.setattr(MultiPatternSearch, "FIND_PATTERN_LIMIT", 0)
+    # With chunks of 8 bytes, "crossing" starts at 6 and ends in the second chunk, "ing" lies in the overlap
+    value = b"abcdefcrossing--crossingxx"
+    patterns = [b"crossing", b"ing", b"x"]
+    blob = _blob(tmp_path, value)
+
+    expected = sorted(MultiPatternSearch(patterns).find_all(value))
+    assert (6, b"crossing") in expected
+    for chunk_size in (1, 3, 8, 16, len(value), 1024):
+        matches = list(blob.find_all(patterns, chunk_size=chunk_size))
+        assert [offset for offset, _ in matches] == sorted(offset for offset, _ in matches)
+        # Every match once, also the ones in the overlap of two chunks
+        assert sorted(matches) == expected
+
+
+@pytest.fixture
+def save(tmp_path: Path) -> AsaSave:
+    builder = SyntheticSave()
+    builder.add(WALL, location=(0, 0), BoxName="needle in a wall", TargetingTeam=0x0A0B0C0D)
+    for i in range(10):
+        builder.add(STONE, BoxName=f"stone {i} needle")
+    builder.add(WALL, BoxName="haystack")
+    return AsaSave(builder.write(tmp_path / "save.ark"))
+
+
+def test_find_values(save: AsaSave):
+    patterns = [b"needle", b"dle in", bytes.fromhex("0D0C0B0A")]
+    matches = save.find_values(patterns, tables=("game",))
+
+    by_pattern = {pattern: {key for key, _, p in matches if p == pattern} for pattern in patterns}
+    assert len(by_pattern[b"needle"]) == 11
+    assert len(by_pattern[b"dle in"]) == len(by_pattern[bytes.fromhex("0D0C0B0A")]) == 1
+    assert all(isinstance(key, UUID) for key in by_pattern[b"needle"])
+    for key, offset, pattern in matches:
+        assert save.get_game_obj_binary(key)[offset:offset + len(pattern)] == pattern
+
+    # Custom rows are keyed by name
+    assert {key for key, _, _ in save.find_values([b"TheIsland_WP"], tables=("custom",))} == {"SaveHeader"}
+
+
+def test_find_values_with_workers(save: AsaSave):
+    patterns = [b"needle", b"stone", b"e"]
+    expected = save.find_values(patterns)
+
+    assert sorted(save.find_values(patterns, workers=2), key=str) == sorted(expected, key=str)
+    assert sorted(search_table(save.sqlite_db, "game", patterns, 3)) == \
+        sorted((key.bytes, offset, pattern) for key, offset, pattern in expected if isinstance(key, UUID))
@@ -0,0 +1,94 @@
+import pickle
+import struct
+from uuid import uuid4
+
+import pytest
+
+from arkparse.object_model.ark_game_object import ArkGameObject
+from arkparse.parsing import ArkBinaryParser
+from arkparse.parsing.struct.ark_custom_item_data import ArkByteArray
+from arkparse.saves.save_context import SaveContext
+
+from synthetic_save import WALL, SyntheticSave
+
+# The parser buffer can be bytes, or a memoryview when parsing embedded or custom data
+BUFFER_TYPES = [bytes, memoryview]
+
+
+def _context(builder: SyntheticSave) -> SaveContext:
+    context = SaveContext()
+    context.names = {name_id: name for name, name_id in builder.names.items()}
+    return context
+
+
+def _byte_array(builder: SyntheticSave, data: bytes) -> bytes:
+    return builder.name("Bytes") + builder.name("ArrayProperty") + struct.pack("<I", 1) + builder.name("ByteProperty") \
+        + struct.pack("<II", 0, len(data) + 4) + b"\0" + struct.pack("<I", len(data)) + data + builder.name("None")
+
+
+@pytest.mark.parametrize("buffer_type", BUFFER_TYPES)
+def test_read_bytes_copies_and_read_bytes_view_shares(buffer_type):
+    data = bytes(range(16))
+    parser = ArkBinaryParser(buffer_type(data))
+    parser.set_position(2)
+
+    copied = parser.read_bytes(4)
+    view = parser.read_bytes_view(4)
+    assert type(copied) is bytes and type(view) is memoryview
+    assert copied == data[2:6] and view == data[6:10]
+    assert parser.get_position() == 10
+
+    # Slicing a view gives a view of the same memory
+    assert view[1:3] == data[7:9] and type(view[1:3]) is memoryview
+    assert view.obj is parser.get_view().obj
+    assert bytes(view) == data[6:10]
+    assert hash(view) == hash(data[6:10])
+    assert pickle.loads(pickle.dumps(copied)) == copied
+    with pytest.raises(TypeError):
+        pickle.dumps(view)
+
+    with pytest.raises(ValueError):
+        parser.read_bytes_view(7)
+    assert parser.get_position() == 10
+
+
+@pytest.mark.parametrize("buffer_type", BUFFER_TYPES)
+def test_property_bytes_is_a_view(buffer_type):
+    builder = SyntheticSave()
+    data = builder.game_object(WALL, TargetingTeam=7, BoxName="Stash")
+    context = _context(builder)
+    obj = ArkGameObject(uuid4(), "", ArkBinaryParser(buffer_type(data), context))
+
+    team, box_name = obj.properties
+    assert type(team.bytes) is memoryview
+    # The property from its name up to and including its value
+    assert bytes(team.bytes) == builder.property("TargetingTeam", 7)
+    assert team.bytes == builder.property("TargetingTeam", 7)
+    assert bytes(box_name.bytes[-6:]) == b"Stash\0"
+    assert hash(team.bytes) == hash(builder.property("TargetingTeam", 7))
+
+    copy = pickle.loads(pickle.dumps(obj))
+    assert type(copy.properties[0].bytes) is memoryview
+    assert [bytes(p.bytes) for p in copy.properties] == [bytes(p.bytes) for p in obj.properties]
+    assert [(p.name, p.value) for p in copy.properties] == [("TargetingTeam", 7), ("BoxName", "Stash")]
+
+
+@pytest.mark.parametrize("buffer_type", BUFFER_TYPES)
+def test_byte_array_data_is_a_view(buffer_type):
+    builder = SyntheticSave()
+    payload = b"\x01\x02\xF0\xFF"
+    data = _byte_array(builder, payload) + _byte_array(builder, b"")
+    parser = ArkBinaryParser(buffer_type(data), _context(builder))
+
+    array, empty = ArkByteArray(parser), ArkByteArray(parser)
+    assert parser.get_position() == len(data)
+    assert type(array.data) is memoryview and type(empty.data) is memoryview
+    assert (array.size, bytes(array.data)) == (4, payload)
+    assert array.data == payload and array.data[1:3] == payload[1:3]
+    assert hash(array.data) == hash(payload)
+    assert (empty.size, bytes(empty.data)) == (0, b"")
+
+    copy = pickle.loads(pickle.dumps(array))
+    assert type(copy.data) is memoryview
+    assert (copy.size, bytes(copy.data)) == (4, payload)
+    assert copy == array
@@ -0,0 +1,138 @@
+from pathlib import Path
+from typing import Dict, Tuple
+from uuid import UUID, uuid4
+
+import pytest
+
+from arkparse.saves.asa_save import AsaSave
+from arkparse.saves.compaction import INVENTORIES, ITEMS, REQUESTED, STATUS_COMPONENTS
+
+from synthetic_save import ACTOR_TRANSFORMS_TAIL, INVENTORY, RAPTOR, RAPTOR_STATUS, STONE, WALL, SyntheticSave, actor_transform
+
+
+def _game_uuids(save: AsaSave) -> set:
+    return {UUID(bytes=key) for (key,) in save.connection.execute("SELECT key FROM game")}
+
+
+def _actor_transforms(save: AsaSave) -> bytes:
+    return save.get_custom_value("ActorTransforms").get_bytes()
+
+
+@pytest.fixture
+def base(tmp_path: Path) -> Tuple[AsaSave, Dict[str, UUID]]:
+    """
+    A wall with an inventory holding two items and linked to a second wall, a dino with a
+    status component, and a third wall whose inventory holds a single item
+    """
+    ids = {key: uuid4() for key in ("wall", "inventory", "item_a", "item_b", "linked_wall", "dino", "status",
+                                    "other_wall", "other_inventory", "other_item")}
+    builder = SyntheticSave()
+    builder.add(WALL, ids["wall"], (0, 0), MyInventoryComponent=ids["inventory"], LinkedStructures=[ids["linked_wall"]], TargetingTeam=1)
+    builder.add(INVENTORY, ids["inventory"], InventoryItems=[ids["item_a"], ids["item_b"]])
+    builder.add(STONE, ids["item_a"], OwnerInventory=ids["inventory"])
+    builder.add(STONE, ids["item_b"], OwnerInventory=ids["inventory"])
+    builder.add(WALL, ids["linked_wall"], (1, 0), TargetingTeam=1)
+    builder.add(RAPTOR, ids["dino"], (2, 0), MyCharacterStatusComponent=ids["status"])
+    builder.add(RAPTOR_STATUS, ids["status"])
+    builder.add(WALL, ids["other_wall"], (3, 0), MyInventoryComponent=ids["other_inventory"])
+    builder.add(INVENTORY, ids["other_inventory"], InventoryItems=[ids["other_item"]])
+    builder.add(STONE, ids["other_item"], OwnerInventory=ids["other_inventory"])
+    save = AsaSave(builder.write(tmp_path / "base.ark"))
+    return save, ids
+
+
+def test_delete_cascades_to_components(base):
+    save, ids = base
+    report = save.delete([ids["wall"], ids["dino"]])
+
+    assert set(report.deleted[REQUESTED]) == {ids["wall"], ids["dino"]}
+    assert report.deleted[INVENTORIES] == [ids["inventory"]]
+    assert set(report.deleted[ITEMS]) == {ids["item_a"], ids["item_b"]}
+    assert report.deleted[STATUS_COMPONENTS] == [ids["status"]]
+    assert report.missing == []
+
+    # The linked wall is referenced, but it is not a component
+    assert _game_uuids(save) == {ids["linked_wall"], ids["other_wall"], ids["other_inventory"], ids["other_item"]}
+
+
+def test_delete_without_cascade(base):
+    save, ids = base
+    report = save.delete([ids["wall"]], cascade=False)
+
+    assert report.deleted_objects == [ids["wall"]]
+    assert ids["inventory"] in _game_uuids(save)
+
+
+def test_delete_does_not_follow_owner_inventory(base):
+    save, ids = base
+    report = save.delete([ids["other_item"]])
+
+    assert report.deleted_objects == [ids["other_item"]]
+    assert {ids["other_wall"], ids["other_inventory"]} <= _game_uuids(save)
+
+
+def test_delete_reports_missing(base):
+    save, ids = base
+    missing = uuid4()
+    report = save.delete([ids["linked_wall"], missing])
+
+    assert report.deleted_objects == [ids["linked_wall"]]
+    assert report.missing == [missing]
+
+
+def test_delete_filters_actor_transforms(base):
+    save, ids = base
+    report = save.delete([ids["wall"], ids["dino"]])
+
+    assert report.actor_transforms == 2
+    # The remaining 72 byte entries keep their order, the terminator and everything after it are kept as is
+    expected = actor_transform(ids["linked_wall"], 1) + actor_transform(ids["other_wall"], 3) + ACTOR_TRANSFORMS_TAIL
+    assert _actor_transforms(save) == expected
+    assert set(save.save_context.actor_transforms) == {ids["linked_wall"], ids["other_wall"]}
+
+
+@pytest.fixture
+def garbage(tmp_path: Path) -> Tuple[AsaSave, Dict[str, UUID]]:
+    """
+    A wall with an inventory and an item, next to an inventory (with an item) and a status component
+    nothing references, an item without owner inventory and an actor transform of a missing object
+    """
+    ids = {key: uuid4() for key in ("wall", "inventory", "item", "orphan_inventory", "orphan_item",
+                                    "orphan_status", "loose_item", "gone")}
+    builder = SyntheticSave()
+    builder.add(WALL, ids["wall"], (0, 0), MyInventoryComponent=ids["inventory"])
+    builder.add(INVENTORY, ids["inventory"], InventoryItems=[ids["item"]])
+    builder.add(STONE, ids["item"], OwnerInventory=ids["inventory"])
+    builder.add(INVENTORY, ids["orphan_inventory"], InventoryItems=[ids["orphan_item"]])
+    builder.add(STONE, ids["orphan_item"], OwnerInventory=ids["orphan_inventory"])
+    builder.add(RAPTOR_STATUS, ids["orphan_status"])
+    builder.add(STONE, ids["loose_item"])
+    # An actor transform without object
+    builder.locations.append((ids["gone"], 1, 0))
+    save = AsaSave(builder.write(tmp_path / "garbage.ark"))
+    return save, ids
+
+
+def test_compact_dry_run(garbage):
+    save, ids = garbage
+    before = _game_uuids(save)
+    transforms = _actor_transforms(save)
+    report = save.compact(dry_run=True)
+
+    assert report.unreachable[INVENTORIES] == [ids["orphan_inventory"]]
+    assert report.unreachable[ITEMS] == [ids["orphan_item"]]
+    assert report.unreachable[STATUS_COMPONENTS] == [ids["orphan_status"]]
+    assert report.stale_actor_transforms == [ids["gone"]]
+    assert report.size_after is None
+    assert _game_uuids(save) == before
+    assert _actor_transforms(save) == transforms
+
+
+def test_compact(garbage):
+    save, ids = garbage
+    report = save.compact()
+
+    assert set(report.unreachable_objects) == {ids["orphan_inventory"], ids["orphan_item"], ids["orphan_status"]}
+    assert _game_uuids(save) == {ids["wall"], ids["inventory"], ids["item"], ids["loose_item"]}
+    assert _actor_transforms(save) == actor_transform(ids["wall"], 0) + ACTOR_TRANSFORMS_TAIL
+    assert report.size_after is not None
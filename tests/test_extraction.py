@@ -0,0 +1,124 @@
+import struct
+from pathlib import Path
+from typing import Dict, Tuple
+from uuid import UUID, uuid4
+
+import pytest
+
+from arkparse.api.player_api import PlayerApi
+from arkparse.saves.asa_save import AsaSave
+from arkparse.saves.compaction import INVENTORIES, ITEMS, REQUESTED, STATUS_COMPONENTS
+from arkparse.saves.extraction import write_subset
+
+from synthetic_save import ACTOR_TRANSFORMS_TAIL, INVENTORY, RAPTOR, RAPTOR_STATUS, STONE, WALL, SyntheticSave, actor_transform
+
+GAME_MODE_CUSTOM_BYTES = struct.pack("<Q", 1234)
+
+
+def _game_uuids(save: AsaSave) -> set:
+    return {UUID(bytes=key) for (key,) in save.connection.execute("SELECT key FROM game")}
+
+
+def _custom(save: AsaSave, key: str) -> bytes:
+    return save.get_custom_value(key).get_bytes()
+
+
+@pytest.fixture
+def base(tmp_path: Path) -> Tuple[AsaSave, Dict[str, UUID]]:
+    """A base of team 1 (a wall with a stocked inventory and a linked wall), a dino with a status component and a wall of team 2"""
+    ids = {key: uuid4() for key in ("wall", "inventory", "item_a", "item_b", "linked_wall", "dino", "status", "other_wall")}
+    builder = SyntheticSave()
+    builder.add(WALL, ids["wall"], (0, 0), MyInventoryComponent=ids["inventory"], LinkedStructures=[ids["linked_wall"]], TargetingTeam=1)
+    builder.add(INVENTORY, ids["inventory"], InventoryItems=[ids["item_a"], ids["item_b"]])
+    builder.add(STONE, ids["item_a"], OwnerInventory=ids["inventory"])
+    builder.add(STONE, ids["item_b"], OwnerInventory=ids["inventory"])
+    builder.add(WALL, ids["linked_wall"], (1, 0), TargetingTeam=1)
+    builder.add(RAPTOR, ids["dino"], (2, 0), MyCharacterStatusComponent=ids["status"], TargetingTeam=1)
+    builder.add(RAPTOR_STATUS, ids["status"])
+    builder.add(WALL, ids["other_wall"], (5000, 0), TargetingTeam=2)
+    save = AsaSave(builder.write(tmp_path / "base.ark", GAME_MODE_CUSTOM_BYTES))
+    return save, ids
+
+
+def test_extract_reopens_with_header_and_name_table(base, tmp_path: Path):
+    save, ids = base
+    report = save.extract(tmp_path / "subset.ark", [ids["wall"]])
+    subset = AsaSave(report.path)
+
+    assert _custom(subset, "SaveHeader") == _custom(save, "SaveHeader")
+    assert subset.save_context.names == save.save_context.names
+    assert _custom(subset, "GameModeCustomBytes") == GAME_MODE_CUSTOM_BYTES
+    assert report.game_mode_custom_bytes == len(GAME_MODE_CUSTOM_BYTES)
+    # The source is not modified
+    assert len(_game_uuids(save)) == 8
+
+    # Objects parse as in the source, references outside the subset are kept
+    wall = subset.get_game_object_by_id(ids["wall"], reparse=True)
+    assert wall.blueprint == WALL
+    assert wall.get_property_value("TargetingTeam") == 1
+    assert wall.get_property_value("MyInventoryComponent").value == str(ids["inventory"])
+    assert [r.value for r in wall.get_array_property_value("LinkedStructures")] == [str(ids["linked_wall"])]
+
+
+def test_extract_includes_the_cascade(base, tmp_path: Path):
+    save, ids = base
+    report = save.extract(tmp_path / "subset.ark", [ids["wall"], ids["dino"]])
+
+    assert set(report.objects[REQUESTED]) == {ids["wall"], ids["dino"]}
+    assert report.objects[INVENTORIES] == [ids["inventory"]]
+    assert set(report.objects[ITEMS]) == {ids["item_a"], ids["item_b"]}
+    assert report.objects[STATUS_COMPONENTS] == [ids["status"]]
+    assert _game_uuids(AsaSave(report.path)) == {ids["wall"], ids["inventory"], ids["item_a"], ids["item_b"], ids["dino"], ids["status"]}
+
+
+def test_extract_without_cascade(base, tmp_path: Path):
+    save, ids = base
+    missing = uuid4()
+    report = save.extract(tmp_path / "subset.ark", [ids["wall"], missing], cascade=False)
+
+    assert report.extracted_objects == [ids["wall"]]
+    assert report.missing == [missing]
+    assert _game_uuids(AsaSave(report.path)) == {ids["wall"]}
+
+
+def test_extract_filters_actor_transforms(base, tmp_path: Path):
+    save, ids = base
+    report = save.extract(tmp_path / "subset.ark", [ids["dino"], ids["wall"]])
+    subset = AsaSave(report.path)
+
+    # Entries keep the order of the source, components without transform add none
+    assert report.actor_transforms == 2
+    assert _custom(subset, "ActorTransforms") == actor_transform(ids["wall"], 0) + actor_transform(ids["dino"], 2) + ACTOR_TRANSFORMS_TAIL
+    assert set(subset.save_context.actor_transforms) == {ids["wall"], ids["dino"]}
+
+
+def test_extract_base_in_bounds(base, tmp_path: Path):
+    save, ids = base
+    selected = save.select_obj_uuids_in_bounds(((-10, -10), (10, 10)), team=1)
+    assert set(selected) == {ids["wall"], ids["linked_wall"], ids["dino"]}
+    assert save.select_obj_uuids_in_bounds(((-10, -10), (10000, 10)), team=2) == [ids["other_wall"]]
+
+    report = PlayerApi(save).extract_tribe(tmp_path / "tribe.ark", 1, bounds=((-10, -10), (1.5, 10)))
+    assert _game_uuids(AsaSave(report.path)) == {ids["wall"], ids["inventory"], ids["item_a"], ids["item_b"], ids["linked_wall"]}
+
+
+def test_extract_tribe(base, tmp_path: Path):
+    save, ids = base
+    report = PlayerApi(save).extract_tribe(tmp_path / "tribe.ark", 2)
+    subset = AsaSave(report.path)
+
+    assert _game_uuids(subset) == {ids["other_wall"]}
+    assert _custom(subset, "GameModeCustomBytes") == GAME_MODE_CUSTOM_BYTES
+
+
+def test_write_subset_replaces_custom_values(base, tmp_path: Path):
+    save, ids = base
+    path = tmp_path / "subset.ark"
+    size = write_subset(save.sqlite_db, path, [ids["other_wall"]], {"ActorTransforms": b"replaced", "GameModeCustomBytes": None}, chunk_size=1)
+    subset = AsaSave(path)
+
+    assert size == path.stat().st_size
+    assert _game_uuids(subset) == {ids["other_wall"]}
+    assert _custom(subset, "ActorTransforms") == b"replaced"
+    assert subset.get_custom_value("GameModeCustomBytes") is None
+    assert _custom(subset, "SaveHeader") == _custom(save, "SaveHeader")
@@ -0,0 +1,138 @@
+import random
+import struct
+import zlib
+from collections import deque
+
+import pytest
+
+from arkparse.parsing.ark_binary_parser import ArkBinaryParser
+
+wildcard_decompress = ArkBinaryParser._ArkBinaryParser__wildcard_decompress
+
+
+def reference_decompress(input_buffer: bytes) -> bytes:
+    """The byte at a time implementation the table driven one replaced"""
+    fifo_queue = deque()
+    output_buffer = bytearray()
+    escape = switch = False
+    pos = 0
+    while pos < len(input_buffer) or fifo_queue:
+        if fifo_queue:
+            output_buffer.append(fifo_queue.popleft())
+            continue
+        next_byte = input_buffer[pos]
+        pos += 1
+        if switch:
+            output_buffer.append(0xF0 | ((next_byte & 0xF0) >> 4))
+            fifo_queue.append(0xF0 | (next_byte & 0x0F))
+            switch = False
+            continue
+        if not escape:
+            if next_byte == 0xF0:
+                escape = True
+                continue
+            elif next_byte == 0xF1:
+                switch = True
+                continue
+            elif 0xF2 <= next_byte < 0xFF:
+                fifo_queue.extend([0] * (next_byte & 0x0F))
+                continue
+            elif next_byte == 0xFF:
+                if pos + 2 > len(input_buffer):
+                    raise ValueError("Unexpected end of stream after 0xFF")
+                b1, b2 = input_buffer[pos], input_buffer[pos + 1]
+                pos += 2
+                fifo_queue.extend([0, 0, 0, b1, 0, 0, 0, b2, 0, 0, 0])
+                continue
+        escape = False
+        output_buffer.append(next_byte)
+    return bytes(output_buffer)
+
+
+@pytest.mark.parametrize("compressed, expected", [
+    (b"", b""),
+    (b"\x01\x02\x03", b"\x01\x02\x03"),
+    # Escape: the next byte is copied as is, even an escape code
+    (b"\x01\xF0\xF5\x02", b"\x01\xF5\x02"),
+    (b"\xF0\xF0", b"\xF0"),
+    # Switch: both nibbles of the next byte expand to 0xFX
+    (b"\xF1\x3C", b"\xF3\xFC"),
+    (b"\x07\xF1\xFF\x08", b"\x07\xFF\xFF\x08"),
+    # Padding: 0xF2 - 0xFE insert 2 - 14 zero bytes
+    (b"\x01\xF2\x02", b"\x01" + bytes(2) + b"\x02"),
+    (b"\xFE", bytes(14)),
+    (b"\xF5\xF3", bytes(5) + bytes(3)),
+    # 0xFF: two bytes, each preceded by three zeroes, and three trailing zeroes
+    (b"\xFF\xAA\xBB\x01", b"\x00\x00\x00\xAA\x00\x00\x00\xBB\x00\x00\x00\x01"),
+    # Escape codes at the end of the stream add nothing
+    (b"\x01\xF0", b"\x01"),
+    (b"\x01\xF1", b"\x01"),
+])
+def test_wildcard_vectors(compressed, expected):
+    assert wildcard_decompress(compressed) == expected
+    assert wildcard_decompress(memoryview(compressed)) == expected
+    assert reference_decompress(compressed) == expected
+
+
+@pytest.mark.parametrize("compressed", [b"\xFF", b"\xFF\x01", b"\x01\x02\xFF\x03"])
+def test_wildcard_truncated_ff(compressed):
+    with pytest.raises(ValueError, match="after 0xFF"):
+        wildcard_decompress(compressed)
+
+
+def test_wildcard_matches_reference():
+    rng = random.Random(27)
+    for _ in range(200):
+        # Dense in escape codes, so that they follow each other and end the stream
+        data = bytes(rng.choice((rng.randrange(0xF0), rng.randrange(0xF0, 0x100))) for _ in range(rng.randrange(64)))
+        try:
+            expected = reference_decompress(data)
+        except ValueError:
+            with pytest.raises(ValueError):
+                wildcard_decompress(data)
+            continue
+        assert wildcard_decompress(data) == expected
+
+
+def _payload(content: bytes) -> bytes:
+    """Embedded data of content followed by an empty name table, content must not hold escape codes"""
+    inflated = content + struct.pack("<I", 0)
+    return struct.pack("<III", 0x0407, len(inflated), len(content)) + zlib.compress(inflated)
+
+
+@pytest.fixture
+def empty_cache():
+    ArkBinaryParser.clear_inflated_cache()
+    yield
+    ArkBinaryParser.clear_inflated_cache()
+
+
+def test_inflated_cache_hit_and_eviction(empty_cache, monkeypatch):
+    # Every inflated payload is 7 bytes, room for two of them
+    monkeypatch.setattr(ArkBinaryParser, "INFLATED_CACHE_MAX_BYTES", 16)
+    first, second, third = _payload(b"\x01\x02\x03"), _payload(b"\x02\x03\x04"), _payload(b"\x03\x04\x05")
+
+    first_buffer = ArkBinaryParser.from_deflated_data(first).byte_buffer
+    assert bytes(first_buffer) == b"\x01\x02\x03" + struct.pack("<I", 0)
+    # Lists of ints are looked up by the same key
+    assert ArkBinaryParser.from_deflated_data(list(first)).byte_buffer is first_buffer
+
+    second_buffer = ArkBinaryParser.from_deflated_data(second).byte_buffer
+    # The hit makes the first payload the most recently used one, the second is evicted for the third
+    assert ArkBinaryParser.from_deflated_data(first).byte_buffer is first_buffer
+    third_buffer = ArkBinaryParser.from_deflated_data(third).byte_buffer
+
+    assert len(ArkBinaryParser._inflated_cache) == 2
+    assert ArkBinaryParser._inflated_cache_bytes == 14
+    assert ArkBinaryParser.from_deflated_data(first).byte_buffer is first_buffer
+    assert ArkBinaryParser.from_deflated_data(third).byte_buffer is third_buffer
+    reinflated = ArkBinaryParser.from_deflated_data(second).byte_buffer
+    assert reinflated == second_buffer and reinflated is not second_buffer
+
+
+def test_inflated_cache_skips_oversized_payloads(empty_cache, monkeypatch):
+    monkeypatch.setattr(ArkBinaryParser, "INFLATED_CACHE_MAX_BYTES", 4)
+    ArkBinaryParser.from_deflated_data(_payload(b"\x01\x02\x03"))
+
+    assert len(ArkBinaryParser._inflated_cache) == 0
+    assert ArkBinaryParser._inflated_cache_bytes == 0
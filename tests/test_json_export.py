@@ -0,0 +1,139 @@
+import json
+from pathlib import Path
+from typing import Dict, Tuple
+from uuid import UUID, uuid4
+
+import pytest
+
+import arkparse.api.json_api as json_api
+from arkparse.api.json_api import JsonApi
+from arkparse.classes.equipment import Equipment as EqClasses
+from arkparse.classes.player import Player
+from arkparse.saves.asa_save import AsaSave
+
+from synthetic_save import INVENTORY, RAPTOR, STONE, WALL, SyntheticSave
+
+WEAPON = EqClasses.weapons.all_bps[0]
+ARMOR = EqClasses.armor.all_bps[0]
+SHIELD = EqClasses.shield.all_bps[0]
+SADDLE = EqClasses.saddles.all_bps[0]
+CRYOPOD = "/Game/Extinction/CoreBlueprints/Weapons/PrimalItem_WeaponEmptyCryopod.PrimalItem_WeaponEmptyCryopod_C"
+
+KINDS = ("armors", "weapons", "shields", "saddles", "player_pawns", "items", "dinos", "structures")
+
+
+@pytest.fixture
+def base(tmp_path: Path) -> Tuple[AsaSave, Dict[str, UUID]]:
+    """One object of every export kind, next to engrams of a weapon, an item and a cryopod"""
+    ids = {key: uuid4() for key in ("weapon", "weapon_engram", "armor", "shield", "saddle", "pawn", "pawn_inventory", "stone",
+                                    "stone_engram", "wild", "tame", "cryopod", "cryopod_engram", "wall")}
+    builder = SyntheticSave()
+    builder.add(WEAPON, ids["weapon"], OwnerInventory=ids["pawn_inventory"])
+    builder.add(WEAPON, ids["weapon_engram"], bIsEngram=True)
+    builder.add(ARMOR, ids["armor"])
+    builder.add(SHIELD, ids["shield"])
+    builder.add(SADDLE, ids["saddle"])
+    builder.add(Player.pawn_male, ids["pawn"], (0, 0), MyInventoryComponent=ids["pawn_inventory"], LinkedPlayerDataID=5,
+                PlayerName="Player", TargetingTeam=3)
+    builder.add(INVENTORY, ids["pawn_inventory"], InventoryItems=[ids["weapon"]])
+    builder.add(STONE, ids["stone"])
+    builder.add(STONE, ids["stone_engram"], bIsEngram=True)
+    builder.add(RAPTOR, ids["wild"], (1, 1))
+    builder.add(RAPTOR, ids["tame"], (1, 1), TamedTimeStamp=12.5, TamedName="Rex")
+    builder.add(CRYOPOD, ids["cryopod"])
+    builder.add(CRYOPOD, ids["cryopod_engram"], bIsEngram=True)
+    builder.add(WALL, ids["wall"], (2, 2), TargetingTeam=1)
+    AsaSave.parsed_objects.clear()
+    return AsaSave(builder.write(tmp_path / "save.ark")), ids
+
+
+def _read(folder: Path, kind: str) -> list:
+    with open(folder / f"{kind}.json") as f:
+        records = json.load(f)
+    return sorted(records, key=lambda record: json.dumps(record, sort_keys=True))
+
+
+def _per_kind_exports(save: AsaSave, folder: Path):
+    api = JsonApi(save)
+    api.export_armors(export_folder_path=folder)
+    api.export_weapons(export_folder_path=folder)
+    api.export_shields(export_folder_path=folder)
+    api.export_saddles(export_folder_path=folder)
+    api.export_player_pawns(export_folder_path=folder)
+    api.export_items(export_folder_path=folder)
+    api.export_dinos(export_folder_path=folder)
+    api.export_structures(export_folder_path=folder)
+
+
+def _uuids(records: list) -> set:
+    return {UUID(record["UUID"]) for record in records}
+
+
+def test_export_all_matches_per_kind_exports(base, tmp_path: Path):
+    save, ids = base
+    _per_kind_exports(save, tmp_path / "per_kind")
+    JsonApi(save).export_all(export_folder_path=tmp_path / "all")
+
+    for kind in KINDS:
+        assert _read(tmp_path / "all", kind) == _read(tmp_path / "per_kind", kind), kind
+
+    # Engrams are left out of the equipment and items
+    assert _uuids(_read(tmp_path / "all", "weapons")) == {ids["weapon"]}
+    assert _uuids(_read(tmp_path / "all", "items")) == {ids[key] for key in ("weapon", "armor", "shield", "saddle", "stone", "cryopod")}
+    assert _uuids(_read(tmp_path / "all", "player_pawns")) == {ids["pawn"]}
+    assert _uuids(_read(tmp_path / "all", "structures")) == {ids["wall"]}
+
+
+def test_export_items_with_engrams(base, tmp_path: Path):
+    save, ids = base
+    JsonApi(save).export_items(export_folder_path=tmp_path, include_engrams=True)
+
+    assert {ids["weapon_engram"], ids["stone_engram"], ids["cryopod_engram"]} <= _uuids(_read(tmp_path, "items"))
+
+
+class _CryopodStub:
+    """Stands in for Cryopod, whose dino is decoded from embedded data the synthetic save does not have"""
+    def __init__(self, uuid, reader, game_object=None):
+        self.dino = self
+        self.uuid = uuid
+
+    def to_json_obj(self):
+        return {"UUID": str(self.uuid), "ClassName": "cryopodded"}
+
+
+@pytest.mark.parametrize("options, expected", [
+    ({}, {"wild", "tame", "cryopod"}),
+    ({"include_cryopodded": False}, {"wild", "tame"}),
+    ({"include_wilds": False}, {"tame", "cryopod"}),
+    ({"include_tames": False}, {"wild", "cryopod"}),
+])
+def test_dino_filters(base, tmp_path: Path, monkeypatch, options, expected):
+    save, ids = base
+    monkeypatch.setattr(json_api, "Cryopod", _CryopodStub)
+    JsonApi(save).export_dinos(export_folder_path=tmp_path, **options)
+
+    # The cryopod engram is never opened
+    assert _uuids(_read(tmp_path, "dinos")) == {ids[key] for key in expected}
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_export_all_with_workers(base, tmp_path: Path, ordered):
+    save, _ = base
+    JsonApi(save).export_all(export_folder_path=tmp_path / "single")
+    JsonApi(save).export_all(export_folder_path=tmp_path / "parallel", workers=2, ordered=ordered)
+
+    for kind in KINDS:
+        assert _read(tmp_path / "parallel", kind) == _read(tmp_path / "single", kind), kind
+
+
+def test_export_all_with_workers_in_small_tasks(base, tmp_path: Path, monkeypatch):
+    save, _ = base
+    # Every worker task covers a few rows, so records of one kind come from several tasks
+    monkeypatch.setattr(json_api, "EXPORT_TASK_ROWS", 3)
+    JsonApi(save).export_all(export_folder_path=tmp_path / "single")
+    JsonApi(save).export_all(export_folder_path=tmp_path / "parallel", workers=2, format="jsonl")
+
+    for kind in KINDS:
+        with open(tmp_path / "parallel" / f"{kind}.jsonl") as f:
+            records = sorted((json.loads(line) for line in f if line.strip()), key=lambda record: json.dumps(record, sort_keys=True))
+        assert records == _read(tmp_path / "single", kind), kind
@@ -0,0 +1,148 @@
+from pathlib import Path
+from typing import Dict, Tuple
+from uuid import UUID, uuid4
+
+import pytest
+
+from arkparse.api.object_query import ObjectQuery
+from arkparse.enums import ArkMap
+from arkparse.logging import ArkSaveLogger
+from arkparse.object_model.dinos.dino import Dino
+from arkparse.object_model.structures import Structure, StructureWithInventory
+from arkparse.saves.asa_save import AsaSave
+
+from synthetic_save import INVENTORY, STONE, WALL, SyntheticSave
+
+FENCE = "/Game/Structures/Fence.Fence_C"
+
+
+def _build(tmp_path: Path, extra_names: int = 0) -> Tuple[AsaSave, Dict[str, UUID]]:
+    """Walls of three teams with their health, a fence, a wall without health and an inventory with an item"""
+    ids = {key: uuid4() for key in ("wall_1", "wall_2", "wall_3", "fence", "bare_wall", "inventory", "item")}
+    builder = SyntheticSave()
+    builder.add(WALL, ids["wall_1"], (0, 0), TargetingTeam=1, Health=100.0, MyInventoryComponent=ids["inventory"], CurrentItemCount=1)
+    builder.add(WALL, ids["wall_2"], (100, 0), TargetingTeam=2, Health=250.0)
+    builder.add(WALL, ids["wall_3"], (300000, 300000), TargetingTeam=3, Health=500.0)
+    builder.add(FENCE, ids["fence"], (200, 0), TargetingTeam=1, Health=250.0)
+    builder.add(WALL, ids["bare_wall"], (300, 0))
+    builder.add(INVENTORY, ids["inventory"], InventoryItems=[ids["item"]])
+    builder.add(STONE, ids["item"], OwnerInventory=ids["inventory"])
+    # Structure classes that are in the name table, but not in the save
+    for i in range(extra_names):
+        builder.name_id(f"/Game/Structures/Unused{i}.Unused{i}_C")
+    AsaSave.parsed_objects.clear()
+    return AsaSave(builder.write(tmp_path / "save.ark")), ids
+
+
+@pytest.fixture
+def base(tmp_path: Path) -> Tuple[AsaSave, Dict[str, UUID]]:
+    return _build(tmp_path)
+
+
+def _uuids(query: ObjectQuery) -> set:
+    return set(query.all())
+
+
+@pytest.fixture
+def api_log(monkeypatch) -> list:
+    messages = []
+    monkeypatch.setattr(ArkSaveLogger, "api_log", messages.append)
+    return messages
+
+
+def _read_classes(save: AsaSave, monkeypatch) -> list:
+    """Class names of the game table rows the queries read"""
+    read = []
+    original = ObjectQuery._ObjectQuery__rows
+
+    def rows(query):
+        for key, value in original(query):
+            read.append(save.save_context.get_name(int.from_bytes(value[:4], byteorder="little")))
+            yield key, value
+
+    monkeypatch.setattr(ObjectQuery, "_ObjectQuery__rows", rows)
+    return read
+
+
+def test_class_prefilter(base, api_log, monkeypatch):
+    save, ids = base
+    read = _read_classes(save, monkeypatch)
+
+    assert _uuids(save.query(Structure)) == {ids["wall_1"], ids["wall_2"], ids["wall_3"], ids["fence"], ids["bare_wall"]}
+    assert api_log == ["Query prefiltered on 2 class name ids"]
+    # Only rows with a structure class name id are read
+    assert sorted(set(read)) == [FENCE, WALL]
+
+    api_log.clear()
+    assert _uuids(save.query(Structure).where(class_in=[FENCE])) == {ids["fence"]}
+    assert api_log == ["Query prefiltered on 1 class name ids"]
+
+    # No class in the name table matches, nothing is read
+    read.clear()
+    assert _uuids(save.query(Dino)) == set()
+    assert read == []
+
+
+def test_class_prefilter_fallback(tmp_path: Path, api_log, monkeypatch):
+    # More structure class names than fit in one IN list, every row is scanned instead
+    save, ids = _build(tmp_path, extra_names=AsaSave.PREFETCH_CHUNK_SIZE)
+    read = _read_classes(save, monkeypatch)
+
+    assert _uuids(save.query(Structure)) == {ids["wall_1"], ids["wall_2"], ids["wall_3"], ids["fence"], ids["bare_wall"]}
+    assert api_log == []
+    assert sorted(read) == sorted([WALL] * 4 + [FENCE, INVENTORY, STONE])
+
+    # A narrower class filter fits again
+    assert _uuids(save.query(Structure).where(class_in=[WALL])) == {ids["wall_1"], ids["wall_2"], ids["wall_3"], ids["bare_wall"]}
+    assert api_log == ["Query prefiltered on 1 class name ids"]
+
+
+@pytest.mark.parametrize("criteria, expected", [
+    ({"owner_tribe": 1}, {"wall_1", "fence"}),
+    ({"owner_tribe__ne": 1}, {"wall_2", "wall_3", "bare_wall"}),
+    ({"Health__gt": 250.0}, {"wall_3"}),
+    ({"Health__gte": 250.0}, {"wall_2", "wall_3", "fence"}),
+    ({"Health__lt": 250.0}, {"wall_1"}),
+    ({"Health__lte": 250.0}, {"wall_1", "wall_2", "fence"}),
+    ({"owner_tribe__in": [2, 3]}, {"wall_2", "wall_3"}),
+    ({"owner_tribe__in": [1], "Health__gt": 100.0}, {"fence"}),
+    ({"blueprint": FENCE}, {"fence"}),
+    ({"owner_tribe": 1, "class_in": [WALL]}, {"wall_1"}),
+])
+def test_operators(base, criteria, expected):
+    save, ids = base
+    assert _uuids(save.query(Structure).where(**criteria)) == {ids[key] for key in expected}
+
+
+def test_unknown_operator(base):
+    save, _ = base
+    with pytest.raises(ValueError, match="Unknown operator"):
+        save.query(Structure).where(Health__between=(1, 2))
+    with pytest.raises(ValueError, match="Unsupported query target"):
+        ObjectQuery(save, str)
+
+
+def test_structure_with_inventory(base):
+    save, ids = base
+    result = save.query(StructureWithInventory).all()
+
+    assert set(result) == {ids["wall_1"]}
+    assert isinstance(result[ids["wall_1"]], StructureWithInventory)
+
+
+def test_near(base):
+    save, ids = base
+    coords = save.save_context.actor_transforms[ids["wall_3"]].as_map_coords(ArkMap.THE_ISLAND)
+
+    assert _uuids(save.query(Structure).near(ArkMap.THE_ISLAND, coords, 0.5)) == {ids["wall_3"]}
+    near_origin = save.save_context.actor_transforms[ids["wall_1"]].as_map_coords(ArkMap.THE_ISLAND)
+    assert _uuids(save.query(Structure).where(owner_tribe=1).near(ArkMap.THE_ISLAND, near_origin, 0.5)) == {ids["wall_1"], ids["fence"]}
+
+
+def test_limit(base):
+    save, ids = base
+    assert len(save.query(Structure).limit(2).all()) == 2
+    assert save.query(Structure).where(Health__gt=250.0).limit(5).all().keys() == {ids["wall_3"]}
+    assert save.query(Structure).limit(0).all() == {}
+    assert save.query(Structure).where(owner_tribe=3).first().object.uuid == ids["wall_3"]
+    assert save.query(Structure).where(owner_tribe=4).first() is None
@@ -0,0 +1,49 @@
+import json
+import pickle
+import struct
+from uuid import uuid4
+
+from arkparse.parsing import ArkBinaryParser
+from arkparse.parsing.struct.object_reference import ObjectReference
+from arkparse.saves.save_context import SaveContext
+from arkparse.utils.json_utils import DefaultJsonEncoder
+
+
+def _reader(data: bytes) -> ArkBinaryParser:
+    context = SaveContext()
+    context.names = {1: "None", 7: "/Game/PrimalEarth/CoreBlueprints/Inventories/PrimalInventoryBP_Player.PrimalInventoryBP_Player_C"}
+    return ArkBinaryParser(data, context)
+
+
+def test_uuid_reference_json_round_trip():
+    obj_uuid = uuid4()
+    ref = ObjectReference(_reader(struct.pack("<h", ObjectReference.TYPE_UUID) + obj_uuid.bytes))
+
+    # Nothing is formatted while parsing, but the export is the same as before
+    assert "value" not in vars(ref)
+    exported = json.loads(json.dumps(ref, cls=DefaultJsonEncoder))
+    assert exported == {"type": ObjectReference.TYPE_UUID, "value": str(obj_uuid)}
+    assert ref.uuid == obj_uuid
+    assert ref.value == str(obj_uuid)
+
+
+def test_path_reference_json_round_trip():
+    ref = ObjectReference(_reader(struct.pack("<hII", ObjectReference.TYPE_PATH, 7, 0)))
+
+    exported = json.loads(json.dumps({"OwnerInventory": ref}, cls=DefaultJsonEncoder))
+    assert exported == {"OwnerInventory": {"type": ObjectReference.TYPE_PATH, "value": _reader(b"").save_context.names[7]}}
+    assert ref.uuid is None
+
+
+def test_empty_reference_json():
+    assert json.loads(json.dumps(ObjectReference(), cls=DefaultJsonEncoder)) == {"value": None}
+
+
+def test_uuid_reference_equality_and_pickle():
+    obj_uuid = uuid4()
+    data = struct.pack("<h", ObjectReference.TYPE_UUID) + obj_uuid.bytes
+    ref = ObjectReference(_reader(data))
+
+    assert ref == ObjectReference(_reader(data))
+    copy = pickle.loads(pickle.dumps(ref))
+    assert copy.uuid == obj_uuid and copy.value == str(obj_uuid)
@@ -0,0 +1,38 @@
+import pickle
+from pathlib import Path
+
+import pytest
+
+from arkparse.api.player_api import PlayerApi
+from arkparse.ark_tribe import ArkTribe
+from arkparse.saves.asa_save import AsaSave
+
+from synthetic_save import WALL, SyntheticSave, tribe_archive
+
+
+@pytest.fixture
+def save_with_tribe_files(tmp_path: Path) -> AsaSave:
+    # GameModeCustomBytes is too short to hold profile data, so the archives are read from the save directory
+    builder = SyntheticSave()
+    builder.add(WALL, location=(0, 0))
+    for tribe_id, name in ((1001, "Alpha"), (1002, "Beta"), (1003, "Gamma")):
+        (tmp_path / f"{tribe_id}.arktribe").write_bytes(tribe_archive(tribe_id, name))
+    return AsaSave(builder.write(tmp_path / "TheIsland_WP.ark"))
+
+
+def test_decoded_tribe_can_be_pickled():
+    tribe = ArkTribe(tribe_archive(1001, "Alpha"), True)
+    # Caches the view of the parser buffer, as parsing a property list does
+    tribe._archive.data.get_view()
+
+    copy = pickle.loads(pickle.dumps(tribe))
+    assert (copy.name, copy.tribe_id, copy.owner_id) == ("Alpha", 1001, 1)
+    assert bytes(copy.properties.properties[0].bytes) == bytes(tribe.properties.properties[0].bytes)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_tribes_decoded_with_workers(save_with_tribe_files, workers):
+    api = PlayerApi(save_with_tribe_files, workers=workers)
+
+    assert sorted((tribe.tribe_id, tribe.name) for tribe in api.tribes) == [(1001, "Alpha"), (1002, "Beta"), (1003, "Gamma")]
+    assert api.tribes_by_name["Beta"].tribe_id == 1002
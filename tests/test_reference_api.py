@@ -0,0 +1,58 @@
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from arkparse.api import ReferenceApi, StructureApi
+from arkparse.saves.asa_save import AsaSave
+
+from synthetic_save import INVENTORY, STONE, WALL, SyntheticSave
+
+
+@pytest.fixture
+def base(tmp_path: Path):
+    builder = SyntheticSave()
+    ids = {key: uuid4() for key in ("wall", "inventory", "item", "linked_wall", "loose_item")}
+    builder.add(WALL, ids["wall"], (0, 0), MyInventoryComponent=ids["inventory"], LinkedStructures=[ids["linked_wall"]],
+                TargetingTeam=1234, OwningPlayerID=42, CurrentItemCount=1)
+    builder.add(INVENTORY, ids["inventory"], InventoryItems=[ids["item"]])
+    builder.add(STONE, ids["item"], OwnerInventory=ids["inventory"])
+    builder.add(WALL, ids["linked_wall"], (1, 0), LinkedStructures=[ids["wall"]])
+    builder.add(STONE, ids["loose_item"])
+    return builder, AsaSave(builder.write(tmp_path / "save.ark")), ids
+
+
+def test_who_references(base):
+    _, save, ids = base
+    api = ReferenceApi(save)
+
+    assert set(api.who_references(ids["inventory"])) == {(ids["wall"], "MyInventoryComponent"), (ids["item"], "OwnerInventory")}
+    assert api.who_references(ids["inventory"], "OwnerInventory") == [(ids["item"], "OwnerInventory")]
+    assert api.who_references(ids["linked_wall"]) == [(ids["wall"], "LinkedStructures")]
+    assert api.who_references(ids["loose_item"]) == []
+
+
+def test_resolve_owner_chain(base):
+    _, save, ids = base
+    chain = ReferenceApi(save).resolve_owner_chain(ids["item"])
+
+    assert (chain.inventory, chain.container, chain.container_class) == (ids["inventory"], ids["wall"], WALL)
+    assert (chain.tribe_id, chain.player_id) == (1234, 42)
+
+    loose = ReferenceApi(save).resolve_owner_chain(ids["loose_item"])
+    assert loose.inventory is None and loose.container is None
+
+
+def test_container_of_inventory_follows_changes(base):
+    builder, save, ids = base
+    api = StructureApi(save)
+    assert api.get_container_of_inventory(ids["inventory"]).object.uuid == ids["wall"]
+
+    # A container deleted after the index was built is no longer returned
+    save.delete([ids["wall"]], cascade=False)
+    assert api.get_container_of_inventory(ids["inventory"]) is None
+
+    # and one added afterwards is found
+    new_wall = uuid4()
+    save.add_obj_to_db(new_wall, builder.game_object(WALL, MyInventoryComponent=ids["inventory"], CurrentItemCount=1))
+    assert api.get_container_of_inventory(ids["inventory"]).object.uuid == new_wall
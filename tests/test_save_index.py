@@ -0,0 +1,120 @@
+import os
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from arkparse.logging import ArkSaveLogger
+from arkparse.parsing import GameObjectReaderConfiguration
+from arkparse.saves.asa_save import AsaSave
+from arkparse.saves.save_index import SaveIndex
+
+from synthetic_save import INVENTORY, STONE, WALL, SyntheticSave
+
+
+@pytest.fixture
+def indexed(tmp_path: Path):
+    """Two walls of different teams and owners, one with an inventory holding a stone, and a loose stone"""
+    builder = SyntheticSave()
+    ids = {key: uuid4() for key in ("wall", "inventory", "item", "other_wall", "loose_item")}
+    builder.add(WALL, ids["wall"], (100, 100), MyInventoryComponent=ids["inventory"], TargetingTeam=1, OwningPlayerID=10)
+    builder.add(INVENTORY, ids["inventory"], InventoryItems=[ids["item"]])
+    builder.add(STONE, ids["item"], OwnerInventory=ids["inventory"])
+    builder.add(WALL, ids["other_wall"], (5000, 5000), TargetingTeam=2, OwningPlayerID=20)
+    builder.add(STONE, ids["loose_item"])
+    path = builder.write(tmp_path / "save.ark")
+    return builder, path, ids
+
+
+def test_select(indexed):
+    _, path, ids = indexed
+    save = AsaSave(path)
+    index = save.use_index()
+
+    assert index.path == SaveIndex.default_path(path)
+    assert set(index.classes()) == {WALL, INVENTORY, STONE}
+    assert set(index.select(classes=[WALL])) == {ids["wall"], ids["other_wall"]}
+    assert index.select(team=1) == [ids["wall"]]
+    assert index.select(classes=[WALL], owner_id=20) == [ids["other_wall"]]
+    assert index.select(parent_inventory=ids["inventory"]) == [ids["item"]]
+    # Locations come from the actor transforms
+    assert index.select(bounds=((0, 0), (1000, 1000))) == [ids["wall"]]
+    assert index.get(ids["item"])["parent_inventory"] == ids["inventory"]
+
+
+def test_index_is_rebuilt_when_the_file_changes(indexed):
+    _, path, ids = indexed
+    save = AsaSave(path)
+    save.use_index()
+    assert save.index.is_current(path)
+
+    # A changed modification time
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert not save.index.is_current(path)
+    assert AsaSave(path).use_index().is_current(path)
+
+    # A changed size
+    with open(path, "ab") as f:
+        f.write(b"\0")
+    assert not save.index.is_current(path)
+    index = SaveIndex.open(AsaSave(path), path)
+    assert index.is_current(path)
+    assert set(index.select(classes=[WALL])) == {ids["wall"], ids["other_wall"]}
+
+
+@pytest.mark.parametrize("config", [GameObjectReaderConfiguration(),
+                                    GameObjectReaderConfiguration(blueprint_name_filter=lambda name: name == WALL)])
+def test_get_game_objects_with_and_without_index(indexed, config):
+    _, path, _ = indexed
+    AsaSave.parsed_objects.clear()
+    scanned = {obj_uuid: obj.blueprint for obj_uuid, obj in AsaSave(path).get_game_objects(config).items()}
+
+    AsaSave.parsed_objects.clear()
+    save = AsaSave(path)
+    save.use_index()
+    AsaSave.parsed_objects.clear()
+    assert {obj_uuid: obj.blueprint for obj_uuid, obj in save.get_game_objects(config).items()} == scanned
+
+
+def test_index_is_not_used_after_modification(indexed):
+    builder, path, _ = indexed
+    save = AsaSave(path)
+    save.use_index()
+    added = uuid4()
+    save.add_obj_to_db(added, builder.game_object(WALL, TargetingTeam=3))
+
+    assert added in save.get_game_objects(GameObjectReaderConfiguration(blueprint_name_filter=lambda name: name == WALL))
+
+
+def test_unparsable_objects_are_indexed_by_class(indexed, monkeypatch):
+    builder, path, ids = indexed
+    broken = uuid4()
+    builder.add(WALL, broken, TargetingTeam=1)
+    # Cut off in the middle of the properties
+    builder.objects[broken] = builder.objects[broken][:30]
+    path = builder.write(path.with_name("broken.ark"))
+
+    AsaSave.parsed_objects.clear()
+    monkeypatch.setattr(ArkSaveLogger, "_allow_invalid_objects", True)
+    save = AsaSave(path)
+    original = save.parse_as_predefined_object
+
+    def strict(obj_uuid, class_name, reader):
+        if obj_uuid == broken:
+            raise Exception("broken object")
+        return original(obj_uuid, class_name, reader)
+
+    # Parse errors of one object do not stop the build
+    monkeypatch.setattr(save, "parse_as_predefined_object", strict)
+    index = save.use_index()
+    monkeypatch.delattr(save, "parse_as_predefined_object")
+
+    row = index.get(broken)
+    assert (row["class"], row["team"]) == (WALL, None)
+    assert index.select(team=1) == [ids["wall"]]
+
+    # Objects that fail to parse are counted on the index path as on the scanning path
+    objects = save.get_game_objects(GameObjectReaderConfiguration(blueprint_name_filter=lambda name: name == WALL))
+    assert set(objects) == {ids["wall"], ids["other_wall"]}
+    assert save.faulty_objects == 1
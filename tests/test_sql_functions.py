@@ -0,0 +1,123 @@
+import struct
+from pathlib import Path
+from typing import Dict, Tuple
+from uuid import UUID, uuid4
+
+import pytest
+
+import arkparse.saves.sql_functions as sql_functions
+from arkparse.saves.asa_save import AsaSave
+
+from synthetic_save import INVENTORY, STONE, WALL, SyntheticSave
+
+
+def _int_at(builder: SyntheticSave, key: str, position: int, value: int) -> bytes:
+    """IntProperty at an array position, as used for per-stat values"""
+    return builder.name(key) + builder.name("IntProperty") + struct.pack("<ii", 4, position) + b"\0" + struct.pack("<i", value)
+
+
+@pytest.fixture
+def base(tmp_path: Path) -> Tuple[AsaSave, Dict[str, UUID], SyntheticSave]:
+    ids = {key: uuid4() for key in ("wall", "stone", "inventory", "stats", "broken")}
+    builder = SyntheticSave()
+    # Registered in the name table, but no object has a property with that name. The id does not
+    # occur in the objects by chance, as small ids do
+    builder.names["UnusedProperty"] = 0x0ABCDE01
+    builder.add(WALL, ids["wall"], (0, 0), TargetingTeam=7, Health=125.5, bIsLocked=True, BoxName="Stash", MyInventoryComponent=ids["inventory"])
+    builder.add(STONE, ids["stone"], ItemQuantity=3, bIsEngram=False)
+    builder.add(INVENTORY, ids["inventory"], InventoryItems=[ids["stone"]])
+
+    stats = builder.game_object(WALL)
+    header = stats[:len(stats) - len(builder.name("None") + struct.pack("<i", 0) + bytes(16))]
+    builder.objects[ids["stats"]] = header + _int_at(builder, "Levels", 0, 10) + _int_at(builder, "Levels", 3, 40) \
+        + builder.name("None") + struct.pack("<i", 0) + bytes(16)
+
+    # Cut off in the middle of the TargetingTeam property
+    builder.add(WALL, ids["broken"], TargetingTeam=9)
+    builder.objects[ids["broken"]] = builder.objects[ids["broken"]][:-30]
+    return AsaSave(builder.write(tmp_path / "save.ark")), ids, builder
+
+
+def _select(save: AsaSave, obj_uuid: UUID, expression: str, *params):
+    return save.connection.execute(f"SELECT {expression} FROM game WHERE key = ?", (*params, obj_uuid.bytes)).fetchone()[0]
+
+
+def test_ark_class(base):
+    save, ids, _ = base
+    assert _select(save, ids["wall"], "ark_class(value)") == WALL
+    assert _select(save, ids["inventory"], "ark_class(value)") == INVENTORY
+    assert save.select_obj_uuids("ark_class(value) LIKE '%Stone%'") == [ids["stone"]]
+    assert save.connection.execute("SELECT ark_class(NULL), ark_class(x'0100')").fetchone() == (None, None)
+
+
+def test_present_properties(base):
+    save, ids, _ = base
+    assert _select(save, ids["wall"], "ark_has_prop(value, 'BoxName')") == 1
+    assert _select(save, ids["wall"], "ark_prop_int(value, 'TargetingTeam')") == 7
+    assert _select(save, ids["wall"], "ark_prop_int(value, 'bIsLocked')") == 1
+    assert _select(save, ids["wall"], "ark_prop_real(value, 'Health')") == 125.5
+    assert _select(save, ids["wall"], "ark_prop_real(value, 'TargetingTeam')") == 7.0
+    assert _select(save, ids["wall"], "ark_prop_text(value, 'BoxName')") == "Stash"
+    assert _select(save, ids["stone"], "ark_prop_int(value, 'bIsEngram')") == 0
+    assert save.select_obj_uuids("ark_prop_int(value, 'TargetingTeam') = ?", (7,)) == [ids["wall"]]
+
+
+def test_type_mismatch_is_null(base):
+    save, ids, _ = base
+    assert _select(save, ids["wall"], "ark_prop_int(value, 'Health')") is None
+    assert _select(save, ids["wall"], "ark_prop_int(value, 'BoxName')") is None
+    assert _select(save, ids["wall"], "ark_prop_text(value, 'TargetingTeam')") is None
+    # Object references are not decoded to a value
+    assert _select(save, ids["wall"], "ark_prop_text(value, 'MyInventoryComponent')") is None
+    assert _select(save, ids["wall"], "ark_has_prop(value, 'MyInventoryComponent')") == 1
+
+
+def test_absent_properties(base):
+    save, ids, _ = base
+    for name in ("ItemQuantity", "UnusedProperty", "NotInTheNameTable"):
+        assert _select(save, ids["wall"], "ark_has_prop(value, ?)", name) == 0
+        assert _select(save, ids["wall"], "ark_prop_int(value, ?)", name) is None
+        assert _select(save, ids["wall"], "ark_prop_real(value, ?)", name) is None
+        assert _select(save, ids["wall"], "ark_prop_text(value, ?)", name) is None
+    assert _select(save, ids["wall"], "ark_prop_int(value, NULL)") is None
+
+
+def test_name_id_rejection(base, monkeypatch):
+    save, ids, builder = base
+    decoded = []
+    original = sql_functions.ArkBinaryParser
+
+    def parser(value, save_context):
+        decoded.append(value)
+        return original(value, save_context)
+
+    monkeypatch.setattr(sql_functions, "ArkBinaryParser", parser)
+
+    # Objects without the id of the property name are rejected without decoding them
+    assert save.select_obj_uuids("ark_has_prop(value, 'UnusedProperty')") == []
+    assert save.select_obj_uuids("ark_has_prop(value, 'NotInTheNameTable')") == []
+    assert decoded == []
+
+    assert save.select_obj_uuids("ark_has_prop(value, 'ItemQuantity')") == [ids["stone"]]
+    assert len(decoded) == 1
+
+    # The id also occurs as a value: the object is decoded, the property is still absent
+    save.add_obj_to_db(uuid4(), builder.game_object(WALL, TargetingTeam=builder.name_id("ItemQuantity")))
+    assert save.select_obj_uuids("ark_has_prop(value, 'ItemQuantity')") == [ids["stone"]]
+
+
+def test_position(base):
+    save, ids, _ = base
+    assert _select(save, ids["stats"], "ark_prop_int(value, 'Levels')") == 10
+    assert _select(save, ids["stats"], "ark_prop_int(value, 'Levels', 0)") == 10
+    assert _select(save, ids["stats"], "ark_prop_int(value, 'Levels', 3)") == 40
+    assert _select(save, ids["stats"], "ark_prop_real(value, 'Levels', 3)") == 40.0
+    assert _select(save, ids["stats"], "ark_prop_int(value, 'Levels', 1)") is None
+    assert save.select_obj_uuids("ark_prop_int(value, 'Levels', 3) > 20") == [ids["stats"]]
+
+
+def test_undecodable_object_is_null(base):
+    save, ids, _ = base
+    assert _select(save, ids["broken"], "ark_class(value)") == WALL
+    assert _select(save, ids["broken"], "ark_prop_int(value, 'TargetingTeam')") is None
+    assert _select(save, ids["broken"], "ark_has_prop(value, 'TargetingTeam')") == 0
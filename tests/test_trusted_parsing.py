@@ -0,0 +1,80 @@
+import struct
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from arkparse.object_model.ark_game_object import ArkGameObject
+from arkparse.parsing import ArkBinaryParser
+from arkparse.saves.asa_save import AsaSave
+from arkparse.saves.save_context import SaveContext
+
+from synthetic_save import INVENTORY, RAPTOR, RAPTOR_STATUS, STONE, WALL, SyntheticSave
+
+
+def _properties(obj: ArkGameObject) -> list:
+    return [(prop.name, prop.type, prop.value) for prop in obj.properties]
+
+
+def _parse(save: AsaSave, obj_uuid) -> ArkGameObject:
+    return ArkGameObject(obj_uuid, "", ArkBinaryParser(save.get_game_obj_binary(obj_uuid), save.save_context))
+
+
+@pytest.fixture
+def builder() -> SyntheticSave:
+    builder = SyntheticSave()
+    inventory, status = uuid4(), uuid4()
+    builder.add(WALL, location=(0, 0), MyInventoryComponent=inventory, TargetingTeam=7, Health=125.5, bIsLocked=True, BoxName="Stash")
+    builder.add(INVENTORY, inventory, InventoryItems=[builder.add(STONE, OwnerInventory=inventory) for _ in range(3)])
+    builder.add(RAPTOR, location=(1, 1), MyCharacterStatusComponent=status, TamedName="Rex")
+    builder.add(RAPTOR_STATUS, status, BaseCharacterLevel=12)
+    return builder
+
+
+def test_trusted_and_strict_parse_the_same_objects(builder, tmp_path: Path):
+    path = builder.write(tmp_path / "save.ark")
+    strict, trusted = AsaSave(path), AsaSave(path, trusted=True)
+    assert not strict.save_context.trusted and trusted.save_context.trusted
+
+    for obj_uuid in builder.objects:
+        expected, parsed = _parse(strict, obj_uuid), _parse(trusted, obj_uuid)
+        assert parsed.blueprint == expected.blueprint
+        assert _properties(parsed) == _properties(expected)
+        assert len(expected.properties) > 0
+
+
+def test_trusted_skips_parse_checks(builder, tmp_path: Path):
+    obj_uuid = next(iter(builder.objects))
+    # The int after the class name is expected to be 0
+    value = builder.objects[obj_uuid]
+    builder.objects[obj_uuid] = value[:8] + struct.pack("<I", 1) + value[12:]
+    path = builder.write(tmp_path / "save.ark")
+
+    with pytest.raises(Exception, match="Expected 0x0 but got 0x1"):
+        _parse(AsaSave(path), obj_uuid)
+    assert _parse(AsaSave(path, trusted=True), obj_uuid).get_property_value("TargetingTeam") == 7
+
+
+def test_validate_stays_strict_when_trusted():
+    context = SaveContext()
+    context.trusted = True
+    parser = ArkBinaryParser(struct.pack("<IB", 5, 1), context)
+
+    # Edits rely on validate_* to check they write at the right offset
+    with pytest.raises(Exception):
+        parser.validate_uint32(0)
+    parser.set_position(0)
+    parser.expect_uint32(0)
+    parser.expect_byte(0)
+    assert parser.position == 5
+
+
+def test_passed_save_context_keeps_its_trusted_setting(builder, tmp_path: Path):
+    save = AsaSave(builder.write(tmp_path / "save.ark"), trusted=True)
+    context = save.save_context
+    AsaSave(working_copy=save.sqlite_db, save_context=context)
+    assert context.trusted
+
+    context.trusted = False
+    AsaSave(working_copy=save.sqlite_db, save_context=context, trusted=True)
+    assert not context.trusted